@@ -13,6 +13,8 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -79,10 +81,10 @@ SESSION_SAVE_EVERY_REQUEST = True  # Reset the session timeout on each request
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",  # CORS middleware
     "django.middleware.security.SecurityMiddleware",  # Security middleware
-    "django.contrib.sessions.middleware.SessionMiddleware",  # Session middleware (ensure this is included)
+    "learningtracker.middleware.ConditionalSessionMiddleware",  # Session middleware that skips session writes on 304s
     "django.middleware.common.CommonMiddleware",  # Common middleware
     "django.middleware.csrf.CsrfViewMiddleware",  # CSRF protection
-    "django.contrib.auth.middleware.AuthenticationMiddleware",  # Authentication middleware
+    "learningtracker.middleware.CachedAuthenticationMiddleware",  # Authentication middleware that caches the session user
     "django.contrib.messages.middleware.MessageMiddleware",  # Message middleware
     "django.middleware.clickjacking.XFrameOptionsMiddleware",  # Clickjacking protection
 ]
@@ -119,6 +121,66 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# Without CACHE_URL every process keeps a bounded LRU cache of its own. Set
+# CACHE_URL (e.g. redis://cache:6379/0) to share one cache between workers, so
+# invalidation reaches all of them. The per-user generations behind the ETags
+# of the entry and tag lists live in this cache, so running more than one
+# worker (WEB_CONCURRENCY, which uvicorn and gunicorn read as their default
+# worker count) requires CACHE_URL; otherwise workers would answer 304 for
+# changes made through another worker.
+
+CACHE_URL = os.getenv("CACHE_URL")
+if CACHE_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "learningtracker",
+            "OPTIONS": {"MAX_ENTRIES": int(os.getenv("CACHE_MAX_ENTRIES", 5000))},
+        }
+    }
+
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", 1))
+if WEB_CONCURRENCY > 1 and not CACHE_URL:
+    raise ImproperlyConfigured(
+        "Set CACHE_URL to a shared cache to run more than one worker "
+        f"(WEB_CONCURRENCY={WEB_CONCURRENCY})."
+    )
+
+# Seconds a cached API response may be served; writes invalidate it sooner.
+# 0 disables the response cache. It is only enabled with CACHE_URL set: a
+# process-local cache would keep serving bodies that another process changed.
+# Its hit/miss counters are read with the cache_stats command.
+LEARNINGTRACKER_RESPONSE_CACHE_TIMEOUT = 10 * 60 if CACHE_URL else 0
+
+# Per-process LRU of each user's tag names, used to resolve tags on entry
+# writes. Each map is checked against a tag generation kept in the default
+# cache, so with CACHE_URL set every worker sees tag changes at once; without
+# it, the timeout bounds how long other processes may miss one.
+LEARNINGTRACKER_TAG_CACHE_SIZE = int(os.getenv("TAG_CACHE_SIZE", 1000))
+LEARNINGTRACKER_TAG_CACHE_TIMEOUT = int(os.getenv("TAG_CACHE_TIMEOUT", 5 * 60))
+
+# Seconds the session user may be served from the cache; saving the user or
+# logging out invalidates it sooner.
+LEARNINGTRACKER_USER_CACHE_TIMEOUT = 60
+
+# API tokens: default lifetime, how long a rotated token keeps working, and
+# the per-process cache of verified tokens. A revoked token may still be
+# accepted by other processes for up to LEARNINGTRACKER_TOKEN_CACHE_TIMEOUT
+# seconds.
+LEARNINGTRACKER_TOKEN_LIFETIME_DAYS = 90
+LEARNINGTRACKER_TOKEN_ROTATION_GRACE = 60
+LEARNINGTRACKER_TOKEN_CACHE_SIZE = 10000
+LEARNINGTRACKER_TOKEN_CACHE_TIMEOUT = int(os.getenv("TOKEN_CACHE_TIMEOUT", 30))
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -137,10 +199,17 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Fan-out backend for the /api/events/ stream. The in-process broker only
+# reaches streams served by the same process; multi-worker deployments should
+# point this at a backend shared between workers.
+LEARNINGTRACKER_EVENT_BROKER = os.getenv(
+    "LEARNINGTRACKER_EVENT_BROKER", "learningtracker.events.InProcessBroker"
+)
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework.authentication.SessionAuthentication",
-        "rest_framework.authentication.TokenAuthentication",
+        "learningtracker.authentication.ExpiringTokenAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
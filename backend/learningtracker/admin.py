@@ -1,7 +1,15 @@
 from django.contrib import admin
 
 # Register your models here.
-from .models import DailyLearning, Tag
+from .models import (
+    ApiToken,
+    DailyLearning,
+    LearningStreak,
+    MonthlyRollup,
+    Tag,
+    TagRollup,
+    Tombstone,
+)
 
 
 @admin.register(DailyLearning)
@@ -18,3 +26,53 @@ class TagAdmin(admin.ModelAdmin):
     list_display = ("name", "user")  # Show tag name and user in the admin list
     search_fields = ["name", "user__username"]  # Enable search by tag name and user
     list_filter = ["user"]  # Filter by user
+
+
+@admin.register(MonthlyRollup)
+class MonthlyRollupAdmin(admin.ModelAdmin):
+    list_display = ["month", "learning_type", "entry_count", "user"]
+    ordering = ["-month"]
+    list_filter = ["learning_type", "month"]
+    search_fields = ["user__username"]
+    readonly_fields = ["user", "month", "learning_type", "entry_count"]
+
+
+@admin.register(TagRollup)
+class TagRollupAdmin(admin.ModelAdmin):
+    list_display = ["tag", "entry_count", "user"]
+    ordering = ["-entry_count"]
+    search_fields = ["tag__name", "user__username"]
+    readonly_fields = ["user", "tag", "entry_count"]
+
+
+@admin.register(LearningStreak)
+class LearningStreakAdmin(admin.ModelAdmin):
+    list_display = ["user", "latest_length", "latest_end", "longest_length"]
+    ordering = ["-longest_length"]
+    search_fields = ["user__username"]
+    readonly_fields = [
+        "user",
+        "latest_start",
+        "latest_end",
+        "latest_length",
+        "longest_start",
+        "longest_end",
+        "longest_length",
+    ]
+
+
+@admin.register(Tombstone)
+class TombstoneAdmin(admin.ModelAdmin):
+    list_display = ["kind", "object_id", "deleted_at", "user"]
+    ordering = ["-deleted_at"]
+    list_filter = ["kind"]
+    search_fields = ["user__username"]
+    readonly_fields = ["user", "kind", "object_id", "deleted_at"]
+
+
+@admin.register(ApiToken)
+class ApiTokenAdmin(admin.ModelAdmin):
+    list_display = ["name", "prefix", "user", "created_at", "expires_at"]
+    ordering = ["-created_at"]
+    search_fields = ["name", "prefix", "user__username"]
+    readonly_fields = ["user", "prefix", "digest", "created_at"]
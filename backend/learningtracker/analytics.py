@@ -0,0 +1,128 @@
+from datetime import date
+
+import numpy as np
+from django.core.cache import cache
+
+from .caching import user_generation
+from .models import DailyLearning
+
+ANALYTICS_CACHE_KEY = "learningtracker:analytics:{user_id}:{generation}"
+ANALYTICS_CACHE_TIMEOUT = 24 * 60 * 60
+TOPICS = [value for value, _label in DailyLearning.Topics.choices]
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+# Lower bounds of the gap histogram bins, in missed days.
+GAP_BINS = [1, 2, 3, 4, 8, 15, 31]
+GAP_LABELS = ["1", "2", "3", "4-7", "8-14", "15-30", "31+"]
+
+
+def load_arrays(user_id):
+    """
+    Load the entries of `user_id` as sorted `datetime64[D]` days and topic codes
+    with a single `values_list` query.
+
+    Topic codes index into `TOPICS`.
+    """
+    rows = list(
+        DailyLearning.objects.filter(user_id=user_id)
+        .order_by("date")
+        .values_list("date", "learning_type")
+    )
+    if not rows:
+        return np.empty(0, dtype="datetime64[D]"), np.empty(0, dtype=np.int8)
+
+    dates, learning_types = zip(*rows)
+    days = np.array(dates, dtype="datetime64[D]")
+    names, inverse = np.unique(np.array(learning_types), return_inverse=True)
+    codes = np.array([TOPICS.index(name) for name in names], dtype=np.int8)
+    return days, codes[inverse]
+
+
+def user_arrays(user_id):
+    """
+    Return `load_arrays(user_id)`, cached until the user's entries change.
+    """
+    key = ANALYTICS_CACHE_KEY.format(
+        user_id=user_id, generation=user_generation(user_id)
+    )
+    arrays = cache.get(key)
+    if arrays is None:
+        arrays = load_arrays(user_id)
+        cache.set(key, arrays, ANALYTICS_CACHE_TIMEOUT)
+    return arrays
+
+
+def rolling_average(days, today, window, span):
+    """
+    Entries per day averaged over the trailing `window` days, for each of the
+    `span` days ending on `today`.
+    """
+    first = np.datetime64(today, "D") - (span + window - 2)
+    offsets = (days - first).astype(np.int64)
+    offsets = offsets[(offsets >= 0) & (offsets < span + window - 1)]
+    daily = np.bincount(offsets, minlength=span + window - 1)
+    totals = np.concatenate(([0], np.cumsum(daily)))
+    averages = (totals[window:] - totals[:-window]) / window
+    return np.round(averages, 4).tolist()
+
+
+def topic_share(days, topics):
+    """
+    Share of each topic among the entries of every month with entries.
+    """
+    if not len(days):
+        return [], []
+    months = days.astype("datetime64[M]")
+    periods, month_index = np.unique(months, return_inverse=True)
+    counts = np.bincount(
+        month_index * len(TOPICS) + topics, minlength=len(periods) * len(TOPICS)
+    ).reshape(len(periods), len(TOPICS))
+    shares = counts / counts.sum(axis=1, keepdims=True)
+    return np.datetime_as_string(periods).tolist(), np.round(shares, 4).tolist()
+
+
+def weekday_distribution(days):
+    """
+    Number of entries per weekday, Monday first.
+    """
+    # 1970-01-01, day zero of datetime64, was a Thursday.
+    weekdays = (days.astype(np.int64) + 3) % 7
+    return np.bincount(weekdays, minlength=7).tolist()
+
+
+def gap_histogram(days):
+    """
+    Histogram of the number of missed days between consecutive entries.
+    """
+    gaps = np.diff(days).astype(np.int64) - 1
+    gaps = gaps[gaps > 0]
+    counts, _edges = np.histogram(gaps, bins=GAP_BINS + [np.iinfo(np.int64).max])
+    return counts.tolist(), int(gaps.max()) if len(gaps) else 0
+
+
+def user_analytics(user_id, window=30, span=365, today=None):
+    """
+    Time-series analytics of `user_id`, computed with NumPy from its cached
+    `(date, learning_type)` arrays.
+    """
+    today = today or date.today()
+    days, topics = user_arrays(user_id)
+    periods, shares = topic_share(days, topics)
+    gaps, longest_gap = gap_histogram(days)
+    return {
+        "total_entries": len(days),
+        "first_date": str(days[0]) if len(days) else None,
+        "last_date": str(days[-1]) if len(days) else None,
+        "rolling_average": {
+            "window": window,
+            "start": str(np.datetime64(today, "D") - (span - 1)),
+            "end": today.isoformat(),
+            "values": rolling_average(days, today, window, span),
+        },
+        "topic_share": {"topics": TOPICS, "periods": periods, "shares": shares},
+        "weekdays": dict(zip(WEEKDAYS, weekday_distribution(days))),
+        "gaps": {
+            "bins": GAP_LABELS,
+            "counts": gaps,
+            "longest": longest_gap,
+        },
+    }
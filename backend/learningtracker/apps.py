@@ -4,3 +4,18 @@ from django.apps import AppConfig
 class LearningtrackerConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "learningtracker"
+
+    def ready(self):
+        # Connect the signal receivers that keep derived data current.
+        from . import (  # noqa: F401
+            auth_cache,
+            authentication,
+            caching,
+            changes,
+            events,
+            heatmap,
+            rollups,
+            signals,
+            streaks,
+            tag_cache,
+        )
@@ -0,0 +1,190 @@
+import json
+import logging
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.views import View
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotFound, ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from .filters import DailyLearningFilter, TagFilter
+from .models import DailyLearning, Tag
+from .pagination import DailyLearningCursorPagination, TagCursorPagination
+from .serializers import DailyLearningSerializer, TagSerializer
+from .views import check_tag_name_is_free
+
+logger = logging.getLogger(__name__)
+
+NOT_AUTHENTICATED = "Authentication credentials were not provided."
+INVALID_JSON = "Request body must be valid JSON."
+# Rows fetched per round trip when streaming a list with `aiterator()`.
+ITERATOR_CHUNK_SIZE = 500
+
+
+def json_response(data, status=status.HTTP_200_OK):
+    return HttpResponse(
+        JSONRenderer().render(data), status=status, content_type="application/json"
+    )
+
+
+class AsyncModelView(View):
+    """
+    Async-native counterpart of a `ModelViewSet` over the user's own objects.
+
+    Reads use the async ORM (`aiterator()`, `aget()`, `adelete()`) directly on
+    the event loop. Serializer validation is pure Python and runs inline. Saves
+    run their transaction, tag sync and signal receivers in one
+    `sync_to_async` call, because Django's async ORM has no transactions.
+    Authentication uses the session, via `request.auser()`.
+    """
+
+    model = None
+    serializer_class = None
+    filterset_class = None
+    pagination_class = None
+    ordering = ()
+    prefetch = ()
+
+    async def dispatch(self, request, *args, **kwargs):
+        user = await request.auser()
+        if not user.is_authenticated:
+            return json_response(
+                {"detail": NOT_AUTHENTICATED}, status=status.HTTP_403_FORBIDDEN
+            )
+        self.user = user
+        # Used for `query_params`, absolute URLs and by filtersets and
+        # serializers; DRF never authenticates it, so hand it the session user.
+        self.drf_request = Request(request)
+        self.drf_request.user = user
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        except self.model.DoesNotExist:
+            return json_response(
+                {"detail": NotFound.default_detail}, status=status.HTTP_404_NOT_FOUND
+            )
+        except APIException as exc:
+            return json_response(exc.detail, status=exc.status_code)
+
+    def get_queryset(self):
+        return (
+            self.model.objects.filter(user=self.user)
+            .prefetch_related(*self.prefetch)
+            .order_by(*self.ordering)
+        )
+
+    def filter_queryset(self, queryset):
+        filterset = self.filterset_class(
+            self.drf_request.query_params, queryset=queryset, request=self.drf_request
+        )
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+        return filterset.qs
+
+    def get_serializer(self, *args, **kwargs):
+        return self.serializer_class(
+            *args, context={"request": self.drf_request}, **kwargs
+        )
+
+    def parse_body(self):
+        try:
+            return json.loads(self.request.body or b"{}")
+        except ValueError:
+            raise ValidationError({"detail": INVALID_JSON})
+
+    def check_save(self, serializer):
+        """
+        Hook for checks that need the database before `serializer` is saved;
+        runs in the same `sync_to_async` call as the save.
+        """
+
+    async def save(self, serializer, **kwargs):
+        def save_and_represent():
+            self.check_save(serializer)
+            serializer.save(**kwargs)
+            return serializer.data
+
+        return await sync_to_async(save_and_represent)()
+
+
+class AsyncCollectionView(AsyncModelView):
+    async def get(self, request):
+        queryset = self.filter_queryset(self.get_queryset())
+        paginator = self.pagination_class()
+        page = await paginator.apaginate_queryset(queryset, self.drf_request)
+        if page is not None:
+            data = self.get_serializer(page, many=True).data
+            return json_response(paginator.get_paginated_response(data).data)
+
+        objects = [
+            instance
+            async for instance in queryset.aiterator(chunk_size=ITERATOR_CHUNK_SIZE)
+        ]
+        return json_response(self.get_serializer(objects, many=True).data)
+
+    async def post(self, request):
+        serializer = self.get_serializer(data=self.parse_body())
+        serializer.is_valid(raise_exception=True)
+        logger.info(f"User {self.user} is creating a {self.model._meta.model_name}.")
+        data = await self.save(serializer, user=self.user)
+        return json_response(data, status=status.HTTP_201_CREATED)
+
+
+class AsyncDetailView(AsyncModelView):
+    async def get(self, request, pk):
+        instance = await self.get_queryset().aget(pk=pk)
+        return json_response(self.get_serializer(instance).data)
+
+    async def put(self, request, pk, partial=False):
+        instance = await self.get_queryset().aget(pk=pk)
+        serializer = self.get_serializer(
+            instance, data=self.parse_body(), partial=partial
+        )
+        serializer.is_valid(raise_exception=True)
+        logger.info(f"User {self.user} updated a {self.model._meta.model_name}.")
+        return json_response(await self.save(serializer))
+
+    async def patch(self, request, pk):
+        return await self.put(request, pk, partial=True)
+
+    async def delete(self, request, pk):
+        instance = await self.get_queryset().aget(pk=pk)
+        await instance.adelete()
+        return HttpResponse(status=status.HTTP_204_NO_CONTENT)
+
+
+class DailyLearningAsyncMixin:
+    model = DailyLearning
+    serializer_class = DailyLearningSerializer
+    filterset_class = DailyLearningFilter
+    pagination_class = DailyLearningCursorPagination
+    ordering = ("date",)
+    prefetch = ("tags",)
+
+
+class TagAsyncMixin:
+    model = Tag
+    serializer_class = TagSerializer
+    filterset_class = TagFilter
+    pagination_class = TagCursorPagination
+    ordering = ("name",)
+
+    def check_save(self, serializer):
+        check_tag_name_is_free(self.user, serializer)
+
+
+class AsyncDailyLearningListView(DailyLearningAsyncMixin, AsyncCollectionView):
+    pass
+
+
+class AsyncDailyLearningDetailView(DailyLearningAsyncMixin, AsyncDetailView):
+    pass
+
+
+class AsyncTagListView(TagAsyncMixin, AsyncCollectionView):
+    pass
+
+
+class AsyncTagDetailView(TagAsyncMixin, AsyncDetailView):
+    pass
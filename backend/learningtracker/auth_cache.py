@@ -0,0 +1,96 @@
+import time
+
+from django.conf import settings
+from django.contrib import auth
+from django.contrib.auth import (
+    BACKEND_SESSION_KEY,
+    HASH_SESSION_KEY,
+    SESSION_KEY,
+    user_logged_out,
+)
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+USER_CACHE_KEY = "learningtracker:auth-user:{user_id}:{session_hash}"
+USER_VERSION_KEY = "learningtracker:auth-version:{user_id}"
+DEFAULT_TIMEOUT = 60
+
+
+def _initial_version():
+    # Like cache generations, start from the clock so an evicted version never
+    # matches a user cached under an older one.
+    return time.time_ns() // 1000
+
+
+def bump_user_version(user_id):
+    key = USER_VERSION_KEY.format(user_id=user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _initial_version(), None)
+
+
+def _bump_version_on_commit(user_id):
+    bump_user_version(user_id)
+    transaction.on_commit(lambda: bump_user_version(user_id))
+
+
+def get_cached_user(request):
+    """
+    Return the user of the request's session, like `django.contrib.auth.get_user`,
+    but from the cache while the session and the user are unchanged.
+
+    Users are cached for `LEARNINGTRACKER_USER_CACHE_TIMEOUT` seconds under
+    their session auth hash, which only `get_user` can vouch for, together with
+    the user's version stamp. Saving or deleting the user (password change,
+    deactivation, `last_login`) and logging out bump the stamp, so the next
+    request loads and verifies the user from the database again.
+    """
+    session = request.session
+    user_id = session.get(SESSION_KEY)
+    session_hash = session.get(HASH_SESSION_KEY)
+    if (
+        user_id is None
+        or not session_hash
+        or session.get(BACKEND_SESSION_KEY) not in settings.AUTHENTICATION_BACKENDS
+    ):
+        return auth.get_user(request)
+
+    version_key = USER_VERSION_KEY.format(user_id=user_id)
+    user_key = USER_CACHE_KEY.format(user_id=user_id, session_hash=session_hash)
+    cached = cache.get_many([version_key, user_key])
+    version = cached.get(version_key)
+    if version is None:
+        version = cache.get_or_set(version_key, _initial_version, None)
+    elif user_key in cached and cached[user_key][0] == version:
+        return cached[user_key][1]
+
+    # The version was read first, so a change racing this load leaves the
+    # cached user stale under an old version rather than the current one.
+    user = auth.get_user(request)
+    if user.is_authenticated and session.get(HASH_SESSION_KEY) == session_hash:
+        timeout = getattr(
+            settings, "LEARNINGTRACKER_USER_CACHE_TIMEOUT", DEFAULT_TIMEOUT
+        )
+        cache.set(user_key, (version, user), timeout)
+    return user
+
+
+@receiver(post_save, sender=User)
+def _user_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _bump_version_on_commit(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def _user_deleted(sender, instance, **kwargs):
+    _bump_version_on_commit(instance.pk)
+
+
+@receiver(user_logged_out)
+def _user_logged_out(sender, request, user, **kwargs):
+    if user is not None:
+        _bump_version_on_commit(user.pk)
@@ -0,0 +1,103 @@
+import copy
+from functools import cache
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+from rest_framework.exceptions import AuthenticationFailed
+
+from .lru import ExpiringLRUCache
+from .models import ApiToken
+from .utils.error_const import TOKEN_ERRORS
+
+DEFAULT_CACHE_SIZE = 10000
+# Seconds a verified token is trusted without the database; revoking a token
+# reaches other processes within this window.
+DEFAULT_CACHE_TIMEOUT = 30
+
+
+@cache
+def get_token_cache():
+    """
+    Return the process-wide LRU of token digest -> `ApiToken` (with its user),
+    sized by `LEARNINGTRACKER_TOKEN_CACHE_SIZE` and expired after
+    `LEARNINGTRACKER_TOKEN_CACHE_TIMEOUT` seconds.
+    """
+    return ExpiringLRUCache(
+        size=getattr(settings, "LEARNINGTRACKER_TOKEN_CACHE_SIZE", DEFAULT_CACHE_SIZE),
+        timeout=getattr(
+            settings, "LEARNINGTRACKER_TOKEN_CACHE_TIMEOUT", DEFAULT_CACHE_TIMEOUT
+        ),
+    )
+
+
+class ExpiringTokenAuthentication(BaseAuthentication):
+    """
+    Authenticate `Authorization: Token <token>` against hashed `ApiToken`s.
+
+    A verified token is kept in a per-process LRU together with its user, so
+    repeated requests skip the database. Expiry is checked on every request.
+    Revoking, rotating or expiring a token and saving its user invalidate this
+    process at once and every other process within the cache timeout.
+    """
+
+    keyword = "Token"
+
+    def authenticate(self, request):
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise AuthenticationFailed(TOKEN_ERRORS["invalid_header"])
+        try:
+            key = auth[1].decode()
+        except UnicodeError:
+            raise AuthenticationFailed(TOKEN_ERRORS["invalid_header"])
+        return self.authenticate_credentials(key)
+
+    def authenticate_credentials(self, key):
+        digest = ApiToken.hash(key)
+        token_cache = get_token_cache()
+        token = token_cache.get(digest)
+        if token is None:
+            try:
+                token = ApiToken.objects.select_related("user").get(digest=digest)
+            except ApiToken.DoesNotExist:
+                raise AuthenticationFailed(TOKEN_ERRORS["invalid_token"])
+            token_cache.set(digest, token)
+
+        if token.is_expired(timezone.now()):
+            raise AuthenticationFailed(TOKEN_ERRORS["expired_token"])
+        if not token.user.is_active:
+            raise AuthenticationFailed(TOKEN_ERRORS["inactive_user"])
+        # Hand every request its own copies of the cached objects.
+        token = copy.copy(token)
+        token.user = copy.copy(token.user)
+        return token.user, token
+
+    def authenticate_header(self, request):
+        return self.keyword
+
+
+def _invalidate_on_commit(predicate):
+    # Drop now and again after commit, so a request racing the transaction
+    # cannot cache the token as it was before.
+    get_token_cache().invalidate_where(predicate)
+    transaction.on_commit(lambda: get_token_cache().invalidate_where(predicate))
+
+
+@receiver(post_save, sender=ApiToken)
+@receiver(post_delete, sender=ApiToken)
+def _token_changed(sender, instance, **kwargs):
+    _invalidate_on_commit(lambda token: token.pk == instance.pk)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def _user_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _invalidate_on_commit(lambda token: token.user_id == instance.pk)
@@ -0,0 +1,129 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from asgiref.sync import iscoroutinefunction
+from django.core.exceptions import PermissionDenied
+from django.db import connections
+from django.http import Http404, HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+
+from .utils.error_const import BATCH_ERRORS
+
+MAX_BATCH_REQUESTS = 20
+MAX_BATCH_WORKERS = 4
+# Endpoints that cannot run inside a batch: the batch itself and streams.
+EXCLUDED_PATHS = ("/api/batch/", "/api/events/")
+
+
+def _sub_request(request, path, query_string):
+    """
+    Build a GET request for `path` that reuses the user and session of
+    `request`.
+
+    DRF honours `_force_auth_user`, so sub-requests skip their authenticators
+    instead of checking the session or token again; `_accepts_auth()` must
+    have cleared the view first.
+    """
+    sub = HttpRequest()
+    sub.method = "GET"
+    sub.path = sub.path_info = path
+    sub.META = {
+        **request.META,
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path,
+        "QUERY_STRING": query_string,
+        "CONTENT_LENGTH": "0",
+    }
+    sub.GET = QueryDict(query_string)
+    sub.COOKIES = request.COOKIES
+    sub.session = request.session
+    sub.user = request.user
+    sub._force_auth_user = request.user
+    sub._force_auth_token = request.auth
+    return sub
+
+
+def _accepts_auth(view, request):
+    """
+    Whether `view` accepts the method `request` was authenticated with, so a
+    batch cannot reach views restricted to other authenticators.
+    """
+    view_class = getattr(view, "cls", None)
+    if view_class is None:
+        # Plain Django views have no authenticators of their own.
+        return True
+    authentication_classes = getattr(view, "initkwargs", {}).get(
+        "authentication_classes", view_class.authentication_classes
+    )
+    return isinstance(request.successful_authenticator, tuple(authentication_classes))
+
+
+def _error(path, status, message):
+    return {"path": path, "status": status, "body": {"detail": message}}
+
+
+def _run_one(request, path):
+    url = urlsplit(path)
+    if not url.path.startswith("/api/") or url.path.startswith(EXCLUDED_PATHS):
+        return _error(path, 400, BATCH_ERRORS["not_allowed"]), {}
+    try:
+        match = resolve(url.path)
+    except Resolver404:
+        return _error(path, 404, BATCH_ERRORS["not_found"]), {}
+    if iscoroutinefunction(match.func):
+        # Sub-requests are called synchronously; an async view would only
+        # return an unawaited coroutine.
+        return _error(path, 400, BATCH_ERRORS["async_view"]), {}
+    if not _accepts_auth(match.func, request):
+        return _error(path, 403, BATCH_ERRORS["authentication_not_accepted"]), {}
+
+    sub = _sub_request(request, url.path, url.query)
+    try:
+        response = match.func(sub, *match.args, **match.kwargs)
+    except Http404:
+        return _error(path, 404, BATCH_ERRORS["not_found"]), {}
+    except PermissionDenied:
+        return _error(path, 403, BATCH_ERRORS["forbidden"]), {}
+
+    if hasattr(response, "data"):
+        # DRF responses are passed through unrendered; the batch response
+        # renders everything once.
+        body = response.data
+    elif response.get("Content-Type", "").startswith("application/json"):
+        body = json.loads(response.content)
+    else:
+        body = response.content.decode(response.charset)
+    result = {"path": path, "status": response.status_code, "body": body}
+    return result, response.cookies
+
+
+def _run_in_thread(request, path):
+    try:
+        return _run_one(request, path)
+    finally:
+        # Worker threads open their own database connections.
+        connections.close_all()
+
+
+def run_batch(request, paths, concurrent=False):
+    """
+    Run the GET requests for `paths` in-process on behalf of the already
+    authenticated `request`.
+
+    Returns the results in order and the cookies the sub-requests set, e.g. the
+    CSRF cookie from /api/csrf/. With `concurrent`, sub-requests run on a small
+    thread pool.
+    """
+    if concurrent and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=MAX_BATCH_WORKERS) as executor:
+            outcomes = list(
+                executor.map(lambda path: _run_in_thread(request, path), paths)
+            )
+    else:
+        outcomes = [_run_one(request, path) for path in paths]
+
+    cookies = {}
+    for _result, sub_cookies in outcomes:
+        cookies.update(sub_cookies)
+    return [result for result, _cookies in outcomes], cookies
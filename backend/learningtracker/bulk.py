@@ -0,0 +1,239 @@
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import DailyLearning
+from .serializers import DailyLearningSerializer
+from .signals import batch_changes, mark_changed
+from .tagging import sync_entries_tags
+from .utils.error_const import BULK_ERRORS
+
+UPDATABLE_FIELDS = ["date", "learning_type", "description"]
+
+
+class BulkConflictError(Exception):
+    """Raised when the database rejects a batch that passed validation."""
+
+
+def _error(key, index, errors):
+    return {key: index, "status": "error", "errors": errors}
+
+
+def apply_bulk(user, payload, context=None):
+    """
+    Apply a batch of creates, updates and deletes for `user`.
+
+    `payload` is the validated output of `DailyLearningBulkSerializer`. Every item
+    is validated up front, then the valid ones are written with `bulk_create`,
+    `bulk_update` and a single DELETE inside one transaction, with tags resolved
+    for the whole batch at once. Invalid items are skipped and reported in the
+    per-item results; the number of queries does not grow with the batch size.
+    """
+    context = context or {}
+    creates = payload.get("create", [])
+    updates = payload.get("update", [])
+    deletes = list(dict.fromkeys(payload.get("delete", [])))
+    results = {"create": [], "update": [], "delete": []}
+
+    update_ids = [item.get("id") for item in updates]
+    wanted_ids = {pk for pk in update_ids + deletes if isinstance(pk, int)}
+    instances = {
+        entry.pk: entry
+        for entry in DailyLearning.objects.filter(
+            user=user, pk__in=wanted_ids
+        ).prefetch_related("tags")
+    }
+
+    deleted_ids = [pk for pk in deletes if pk in instances]
+    for pk in deletes:
+        if pk in instances:
+            results["delete"].append({"id": pk, "status": "deleted"})
+        else:
+            results["delete"].append(
+                _error("id", pk, {"id": [BULK_ERRORS["not_found"]]})
+            )
+
+    # Validate every item before touching the database.
+    valid_updates = []
+    seen_update_ids = set()
+    for index, item in enumerate(updates):
+        pk = item.get("id")
+        if pk not in instances or pk in deleted_ids:
+            results["update"].append(
+                _error("index", index, {"id": [BULK_ERRORS["not_found"]]})
+            )
+            continue
+        if pk in seen_update_ids:
+            results["update"].append(
+                _error("index", index, {"id": [BULK_ERRORS["duplicate_id"]]})
+            )
+            continue
+        seen_update_ids.add(pk)
+        data = {key: value for key, value in item.items() if key != "id"}
+        serializer = DailyLearningSerializer(
+            instances[pk], data=data, partial=True, context=context
+        )
+        if not serializer.is_valid():
+            results["update"].append(_error("index", index, serializer.errors))
+            continue
+        valid_updates.append((index, instances[pk], serializer.validated_data))
+
+    valid_creates = []
+    for index, item in enumerate(creates):
+        serializer = DailyLearningSerializer(data=item, context=context)
+        if not serializer.is_valid():
+            results["create"].append(_error("index", index, serializer.errors))
+            continue
+        valid_creates.append((index, serializer.validated_data))
+
+    # Enforce `unique_user_date` for the batch with a single lookup. Entries
+    # moving in this batch keep their current date until the move is accepted.
+    moving = {
+        entry.pk: entry.date
+        for _index, entry, data in valid_updates
+        if data.get("date", entry.date) != entry.date
+    }
+    candidate_dates = {data["date"] for _index, data in valid_creates} | {
+        data["date"] for _index, _entry, data in valid_updates if "date" in data
+    }
+    occupied = {
+        entry_date: pk
+        for entry_date, pk in DailyLearning.objects.filter(
+            user=user, date__in=candidate_dates
+        )
+        .exclude(pk__in=deleted_ids)
+        .values_list("date", "pk")
+    }
+
+    accepted_updates = []
+    for index, entry, data in valid_updates:
+        new_date = data.get("date", entry.date)
+        holder = occupied.get(new_date, entry.pk)
+        if holder != entry.pk:
+            # A date held by another entry of the batch is only freed by the
+            # same UPDATE, which the unique constraint would reject.
+            error = "date_moved_in_batch" if holder in moving else "duplicate_date"
+            results["update"].append(
+                _error("index", index, {"date": [BULK_ERRORS[error]]})
+            )
+            continue
+        occupied[new_date] = entry.pk
+        accepted_updates.append((index, entry, data))
+
+    # Creates are inserted after the updates, so they may take the dates that
+    # accepted moves leave.
+    for _index, entry, _data in accepted_updates:
+        if entry.pk in moving and occupied.get(moving[entry.pk]) == entry.pk:
+            del occupied[moving[entry.pk]]
+
+    accepted_creates = []
+    for index, data in valid_creates:
+        if data["date"] in occupied:
+            results["create"].append(
+                _error("index", index, {"date": [BULK_ERRORS["duplicate_date"]]})
+            )
+            continue
+        occupied[data["date"]] = None
+        accepted_creates.append((index, data))
+
+    try:
+        with transaction.atomic(), batch_changes():
+            new_entries = _write(
+                user, instances, deleted_ids, accepted_updates, accepted_creates
+            )
+    except IntegrityError as exc:
+        raise BulkConflictError(str(exc)) from exc
+
+    created = [
+        (index, entry) for (index, _data), entry in zip(accepted_creates, new_entries)
+    ]
+
+    # Re-read the written entries with their tags in two queries.
+    written = {
+        entry.pk: entry
+        for entry in DailyLearning.objects.filter(
+            pk__in=[entry.pk for _index, entry, _data in accepted_updates]
+            + [entry.pk for _index, entry in created]
+        ).prefetch_related("tags")
+    }
+    for index, entry, _data in accepted_updates:
+        results["update"].append(
+            {
+                "index": index,
+                "status": "updated",
+                "data": DailyLearningSerializer(written[entry.pk]).data,
+            }
+        )
+    for index, entry in created:
+        results["create"].append(
+            {
+                "index": index,
+                "status": "created",
+                "data": DailyLearningSerializer(written[entry.pk]).data,
+            }
+        )
+
+    for key in ("create", "update"):
+        results[key].sort(key=lambda result: result["index"])
+    return results
+
+
+def _write(user, instances, deleted_ids, accepted_updates, accepted_creates):
+    """
+    Write the accepted part of a batch and return the created entries in order.
+
+    Must run inside a transaction and `batch_changes()`. Bulk writes skip model
+    signals, so the touched dates and tags are reported with `mark_changed()`.
+    """
+    if deleted_ids:
+        # Deleted entries were loaded with their tags; report them up front so
+        # the per-entry delete signals need no extra lookups.
+        mark_changed(
+            user.pk,
+            dates={instances[pk].date for pk in deleted_ids},
+            tag_ids={tag.pk for pk in deleted_ids for tag in instances[pk].tags.all()},
+            entry_ids=deleted_ids,
+            deleted_ids=deleted_ids,
+        )
+        DailyLearning.objects.filter(user=user, pk__in=deleted_ids).delete()
+
+    tag_changes = []
+    if accepted_updates:
+        now = timezone.now()
+        changed_fields = set()
+        for _index, entry, data in accepted_updates:
+            mark_changed(user.pk, dates={entry.date, data.get("date")})
+            for attr, value in data.items():
+                if attr == "tags":
+                    continue
+                setattr(entry, attr, value)
+                changed_fields.add(attr)
+            entry.updated_at = now
+            if "tags" in data:
+                tag_changes.append(
+                    (entry, [tag["name"] for tag in data["tags"]], False)
+                )
+        DailyLearning.objects.bulk_update(
+            [entry for _index, entry, _data in accepted_updates],
+            [field for field in UPDATABLE_FIELDS if field in changed_fields]
+            + ["updated_at"],
+        )
+
+    new_entries = []
+    if accepted_creates:
+        new_entries = DailyLearning.objects.bulk_create(
+            [
+                DailyLearning(
+                    user=user,
+                    **{key: value for key, value in data.items() if key != "tags"},
+                )
+                for _index, data in accepted_creates
+            ]
+        )
+        mark_changed(user.pk, dates={entry.date for entry in new_entries})
+        for (_index, data), entry in zip(accepted_creates, new_entries):
+            tag_changes.append(
+                (entry, [tag["name"] for tag in data.get("tags", [])], True)
+            )
+
+    sync_entries_tags(user, tag_changes)
+    return new_entries
@@ -0,0 +1,100 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Tag
+from .signals import entries_changed
+
+GENERATION_KEY = "learningtracker:generation:{user_id}"
+TAG_GENERATION_KEY = "learningtracker:tag-generation:{user_id}"
+# Generations must outlive every value cached under them.
+GENERATION_TIMEOUT = None
+
+
+def _initial_generation():
+    # Start from the clock rather than 1, so a generation evicted from the
+    # cache never restarts at a number that older cached values still carry.
+    return time.time_ns() // 1000
+
+
+def user_generation(user_id):
+    """
+    Return the current cache generation of `user_id`.
+
+    Cached values derived from a user's entries or tags are keyed with this
+    number, so bumping it invalidates all of them at once without knowing their
+    keys.
+    """
+    return cache.get_or_set(
+        GENERATION_KEY.format(user_id=user_id),
+        _initial_generation,
+        GENERATION_TIMEOUT,
+    )
+
+
+def user_generations(user_ids):
+    """
+    Return `{user_id: generation}` for many users with one cache round trip.
+    """
+    keys = {GENERATION_KEY.format(user_id=user_id): user_id for user_id in user_ids}
+    found = cache.get_many(list(keys))
+    missing = {key: _initial_generation() for key in keys if key not in found}
+    if missing:
+        cache.set_many(missing, GENERATION_TIMEOUT)
+        found.update(missing)
+    return {user_id: found[key] for key, user_id in keys.items()}
+
+
+def _bump(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _initial_generation(), GENERATION_TIMEOUT)
+
+
+def bump_user_generation(user_id):
+    _bump(GENERATION_KEY.format(user_id=user_id))
+
+
+def user_tag_generation(user_id):
+    """
+    Return the generation of the tag vocabulary of `user_id`.
+
+    Unlike `user_generation()`, entry writes leave it alone; only creating,
+    renaming or deleting tags bumps it.
+    """
+    return cache.get_or_set(
+        TAG_GENERATION_KEY.format(user_id=user_id),
+        _initial_generation,
+        GENERATION_TIMEOUT,
+    )
+
+
+def bump_user_tag_generation(user_id):
+    _bump(TAG_GENERATION_KEY.format(user_id=user_id))
+
+
+def _bump_generation_on_commit(user_id):
+    # Bump now and again after commit, so a read racing the transaction cannot
+    # cache pre-commit data under the new generation.
+    bump_user_generation(user_id)
+    transaction.on_commit(lambda: bump_user_generation(user_id))
+
+
+@receiver(entries_changed)
+def _entries_changed(sender, user_id, **kwargs):
+    _bump_generation_on_commit(user_id)
+
+
+@receiver(post_save, sender=Tag)
+def _tag_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _bump_generation_on_commit(instance.user_id)
+
+
+@receiver(post_delete, sender=Tag)
+def _tag_deleted(sender, instance, **kwargs):
+    _bump_generation_on_commit(instance.user_id)
@@ -0,0 +1,198 @@
+import base64
+import binascii
+import json
+from datetime import timedelta
+
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import DailyLearning, Tag, Tombstone
+from .signals import entries_changed
+
+CHANGES_PAGE_SIZE = 200
+MAX_CHANGES_PAGE_SIZE = 1000
+# Tombstones older than this are pruned; older cursors must resync fully.
+TOMBSTONE_RETENTION = timedelta(days=90)
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+class StaleCursorError(Exception):
+    pass
+
+
+def _encode_position(position):
+    if position is None:
+        return None
+    moment, pk = position
+    return [moment.isoformat(), pk]
+
+
+def _decode_position(value):
+    if value is None:
+        return None
+    if not isinstance(value, list) or len(value) != 2:
+        raise InvalidCursorError
+    moment, pk = parse_datetime(str(value[0])), value[1]
+    if moment is None or not isinstance(pk, int):
+        raise InvalidCursorError
+    return moment, pk
+
+
+def encode_cursor(entry_position, tombstone_position, issued_at):
+    payload = json.dumps(
+        {
+            "e": _encode_position(entry_position),
+            "d": _encode_position(tombstone_position),
+            "s": issued_at.isoformat(),
+        },
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("ascii")).decode("ascii")
+
+
+def decode_cursor(encoded):
+    """
+    Return `(entry_position, tombstone_position, issued_at)` from a cursor.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+        issued_at = parse_datetime(payload["s"])
+        positions = _decode_position(payload["e"]), _decode_position(payload["d"])
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+        raise InvalidCursorError
+    if issued_at is None:
+        raise InvalidCursorError
+    return (*positions, issued_at)
+
+
+def _after(field, position):
+    """
+    Rows strictly after `(field, id)` = `position`, with a plain `>=` bound on
+    `field` so the `(user, field)` index gives a range scan.
+    """
+    if position is None:
+        return Q()
+    moment, pk = position
+    return Q(**{f"{field}__gte": moment}) & (
+        Q(**{f"{field}__gt": moment}) | Q(**{field: moment, "pk__gt": pk})
+    )
+
+
+def change_feed(user, cursor=None, limit=CHANGES_PAGE_SIZE):
+    """
+    Entries of `user` created or updated after `cursor`, plus the ids of entries
+    and tags deleted since, and the cursor to continue from.
+
+    Without a cursor every entry is returned and no tombstones, since a fresh
+    client has nothing to delete. Entries are read in `(updated_at, id)` order
+    and tombstones in `(deleted_at, id)` order, each with one index range scan.
+    """
+    now = timezone.now()
+    if cursor is None:
+        entry_position = None
+        tombstone_position = (
+            Tombstone.objects.filter(user=user)
+            .order_by("-deleted_at", "-pk")
+            .values_list("deleted_at", "pk")
+            .first()
+        )
+        tombstones = []
+    else:
+        entry_position, tombstone_position, issued_at = decode_cursor(cursor)
+        if issued_at < now - TOMBSTONE_RETENTION:
+            raise StaleCursorError
+        tombstones = list(
+            Tombstone.objects.filter(
+                _after("deleted_at", tombstone_position), user=user
+            ).order_by("deleted_at", "pk")[: limit + 1]
+        )
+
+    entries = list(
+        DailyLearning.objects.filter(_after("updated_at", entry_position), user=user)
+        .prefetch_related("tags")
+        .order_by("updated_at", "pk")[: limit + 1]
+    )
+    has_more = len(entries) > limit or len(tombstones) > limit
+    entries, tombstones = entries[:limit], tombstones[:limit]
+
+    if entries:
+        entry_position = entries[-1].updated_at, entries[-1].pk
+    if tombstones:
+        tombstone_position = tombstones[-1].deleted_at, tombstones[-1].pk
+    return {
+        "entries": entries,
+        "deleted_entries": [
+            tombstone.object_id
+            for tombstone in tombstones
+            if tombstone.kind == Tombstone.Kinds.ENTRY
+        ],
+        "deleted_tags": [
+            tombstone.object_id
+            for tombstone in tombstones
+            if tombstone.kind == Tombstone.Kinds.TAG
+        ],
+        "cursor": encode_cursor(entry_position, tombstone_position, now),
+        "has_more": has_more,
+    }
+
+
+def prune_tombstones(older_than=TOMBSTONE_RETENTION):
+    """
+    Delete tombstones older than `older_than` and return how many were removed.
+    """
+    deleted, _by_model = Tombstone.objects.filter(
+        deleted_at__lt=timezone.now() - older_than
+    ).delete()
+    return deleted
+
+
+def _touch_entries(entry_ids):
+    """
+    Move entries back into the change feed after a change made through a tag.
+    """
+    if entry_ids:
+        DailyLearning.objects.filter(pk__in=entry_ids).update(updated_at=timezone.now())
+
+
+@receiver(entries_changed)
+def _record_deleted_entries(sender, user_id, deleted_ids=(), **kwargs):
+    if deleted_ids:
+        Tombstone.objects.bulk_create(
+            [
+                Tombstone(user_id=user_id, kind=Tombstone.Kinds.ENTRY, object_id=pk)
+                for pk in sorted(deleted_ids)
+            ]
+        )
+
+
+@receiver(post_delete, sender=Tag)
+def _record_deleted_tag(sender, instance, origin=None, **kwargs):
+    # Tags removed along with their user need no tombstone.
+    if isinstance(origin, Tag) or getattr(origin, "model", None) is Tag:
+        Tombstone.objects.create(
+            user_id=instance.user_id, kind=Tombstone.Kinds.TAG, object_id=instance.pk
+        )
+
+
+@receiver(post_save, sender=Tag)
+def _tag_renamed(sender, instance, created, raw=False, **kwargs):
+    # Entries embed their tags' names, so a renamed tag changes them too.
+    if not created and not raw:
+        _touch_entries(list(instance.daily_learnings.values_list("pk", flat=True)))
+
+
+@receiver(m2m_changed, sender=DailyLearning.tags.through)
+def _tag_entries_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    # Writes from the entry side save the entry itself; only writes from the
+    # tag side (`tag.daily_learnings.add()`) leave `updated_at` behind.
+    if not reverse or action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if action == "post_clear":
+        pk_set = getattr(instance, "_cleared_entry_ids", set())
+    _touch_entries(pk_set)
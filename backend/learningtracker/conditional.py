@@ -0,0 +1,73 @@
+from django.core.cache import cache
+from django.db.models import Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from .caching import user_generation
+from .models import DailyLearning, Tombstone
+
+VERSION_CACHE_KEY = "learningtracker:version:{user_id}:{generation}"
+VERSION_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+def last_modified(user_id):
+    """
+    When the entries of `user_id` last changed: the latest `updated_at` or
+    deletion, each read with one `(user, ...)` index lookup.
+    """
+    entries = DailyLearning.objects.filter(user_id=user_id)
+    tombstones = Tombstone.objects.filter(user_id=user_id)
+    stamps = [
+        entries.aggregate(stamp=Max("updated_at"))["stamp"],
+        tombstones.aggregate(stamp=Max("deleted_at"))["stamp"],
+    ]
+    stamps = [stamp for stamp in stamps if stamp is not None]
+    return int(max(stamps).timestamp()) if stamps else None
+
+
+def user_version(user_id):
+    """
+    Return `(generation, last_modified)` validators for the collections of
+    `user_id`.
+
+    The generation is bumped on every entry and tag write, including deletes,
+    and the last-modified stamp is cached under it, so an unchanged user costs
+    one cache read and no queries.
+    """
+    generation = user_generation(user_id)
+    key = VERSION_CACHE_KEY.format(user_id=user_id, generation=generation)
+    stamp = cache.get(key)
+    if stamp is None:
+        # 0 marks a user without entries, so the miss is cached as well.
+        stamp = last_modified(user_id) or 0
+        cache.set(key, stamp, VERSION_CACHE_TIMEOUT)
+    return generation, stamp or None
+
+
+class ConditionalListMixin:
+    """
+    Answer `If-None-Match`/`If-Modified-Since` on `list()` with a 304 before
+    the queryset is evaluated or anything is serialized.
+
+    Views whose collection can change without touching an entry, such as tags,
+    set `conditional_last_modified = False` and rely on the ETag alone.
+    """
+
+    etag_prefix = None
+    conditional_last_modified = True
+
+    def list(self, request, *args, **kwargs):
+        generation, stamp = user_version(request.user.pk)
+        etag = f'W/"{self.etag_prefix}-{request.user.pk}-{generation}"'
+        if not self.conditional_last_modified:
+            stamp = None
+
+        response = get_conditional_response(request, etag=etag, last_modified=stamp)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+        response["ETag"] = etag
+        if stamp is not None:
+            response["Last-Modified"] = http_date(stamp)
+        # Let clients keep the body but revalidate before reusing it.
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
@@ -0,0 +1,117 @@
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.db.models import Count, F
+from django.db.models.expressions import Window
+from django.db.models.functions import Rank, TruncWeek
+
+from .models import DailyLearning, LearningStreak
+
+DASHBOARD_CACHE_KEY = "learningtracker:dashboard:{today}:{weeks}:{limit}"
+# Organisation-wide numbers may lag behind by this many seconds.
+DASHBOARD_CACHE_TIMEOUT = 5 * 60
+
+
+def active_learners(start, end):
+    """
+    Distinct users and entries per ISO week between `start` (a Monday) and `end`,
+    from one grouped query. Weeks without entries are included with zeros.
+    """
+    rows = {
+        row["week"]: row
+        for row in DailyLearning.objects.filter(date__gte=start, date__lte=end)
+        .annotate(week=TruncWeek("date"))
+        .values("week")
+        .annotate(learners=Count("user", distinct=True), entries=Count("pk"))
+        .order_by()
+    }
+    weeks = []
+    week = start
+    while week <= end:
+        row = rows.get(week, {})
+        weeks.append(
+            {
+                "week": week.isoformat(),
+                "learners": row.get("learners", 0),
+                "entries": row.get("entries", 0),
+            }
+        )
+        week += timedelta(weeks=1)
+    return weeks
+
+
+def topic_distribution(start, end):
+    """
+    Entries and distinct users per topic between `start` and `end`.
+    """
+    return list(
+        DailyLearning.objects.filter(date__gte=start, date__lte=end)
+        .values("learning_type")
+        .annotate(entries=Count("pk"), learners=Count("user", distinct=True))
+        .order_by("-entries", "learning_type")
+    )
+
+
+def streak_leaderboard(field, limit, **filters):
+    """
+    The `limit` best users by `LearningStreak.<field>`, ranked in SQL so that
+    ties share a rank.
+    """
+    rows = (
+        LearningStreak.objects.filter(**{f"{field}__gt": 0}, **filters)
+        .annotate(
+            rank=Window(Rank(), order_by=F(field).desc()),
+            username=F("user__username"),
+        )
+        .order_by(f"-{field}", "user__username")
+        .values("rank", "user_id", "username", field)[:limit]
+    )
+    return [
+        {
+            "rank": row["rank"],
+            "user_id": row["user_id"],
+            "username": row["username"],
+            "length": row[field],
+        }
+        for row in rows
+    ]
+
+
+def build_dashboard(weeks, limit, today=None):
+    """
+    Organisation-wide learning numbers over the last `weeks` ISO weeks.
+
+    Costs four queries however many users there are: weekly active learners and
+    topics are grouped over `DailyLearning`, and both leaderboards read the
+    `LearningStreak` summaries.
+    """
+    today = today or date.today()
+    start = today - timedelta(days=today.weekday(), weeks=weeks - 1)
+    return {
+        "from_date": start.isoformat(),
+        "to_date": today.isoformat(),
+        "active_learners": active_learners(start, today),
+        "topics": topic_distribution(start, today),
+        "leaderboard": {
+            # Only streaks whose latest run ends today or yesterday are alive.
+            "current": streak_leaderboard(
+                "latest_length",
+                limit,
+                latest_end__gte=today - timedelta(days=1),
+            ),
+            "longest": streak_leaderboard("longest_length", limit),
+        },
+    }
+
+
+def organisation_dashboard(weeks=12, limit=10, today=None):
+    """
+    Return `build_dashboard()`, cached for `DASHBOARD_CACHE_TIMEOUT` seconds.
+    """
+    today = today or date.today()
+    key = DASHBOARD_CACHE_KEY.format(today=today.isoformat(), weeks=weeks, limit=limit)
+    dashboard = cache.get(key)
+    if dashboard is None:
+        dashboard = build_dashboard(weeks, limit, today=today)
+        cache.set(key, dashboard, DASHBOARD_CACHE_TIMEOUT)
+    return dashboard
@@ -0,0 +1,191 @@
+import asyncio
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from functools import cache
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from .models import Tag
+from .signals import entries_changed
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BROKER = "learningtracker.events.InProcessBroker"
+# Events a slow subscriber may fall behind before it is told to resync.
+SUBSCRIBER_QUEUE_SIZE = 100
+# Seconds between keep-alive comments on an idle stream.
+KEEPALIVE_INTERVAL = 15
+# Milliseconds a client should wait before reconnecting.
+RECONNECT_DELAY = 5000
+RESYNC_EVENT = {"type": "resync"}
+
+
+class Broker(ABC):
+    """
+    Fan-out of per-user change events to open event streams.
+
+    `publish()` is called from synchronous code after a write commits;
+    `subscribe()` is used by the async stream view. Only `InProcessBroker`
+    ships; deployments with several worker processes need a subclass that
+    crosses processes (e.g. Redis pub/sub), selected by setting
+    `LEARNINGTRACKER_EVENT_BROKER` to its dotted path.
+    """
+
+    @abstractmethod
+    def publish(self, user_id, event):
+        """
+        Deliver `event` to every current subscriber of `user_id`.
+        """
+
+    @abstractmethod
+    def subscribe(self, user_id):
+        """
+        Async context manager yielding an `asyncio.Queue` of the user's events.
+        """
+
+
+class InProcessBroker(Broker):
+    """
+    Deliver events to the subscribers of the current process.
+
+    Each subscriber owns a bounded queue on its event loop. Publishers may run
+    in any thread, so events are handed over with `call_soon_threadsafe`. A
+    subscriber whose queue is full gets a single `resync` event instead of
+    the events it missed.
+    """
+
+    def __init__(self, queue_size=SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def subscriber_count(self, user_id=None):
+        with self._lock:
+            if user_id is not None:
+                return len(self._subscribers.get(user_id, ()))
+            return sum(len(queues) for queues in self._subscribers.values())
+
+    def publish(self, user_id, event):
+        with self._lock:
+            subscribers = list(self._subscribers.get(user_id, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._deliver, queue, event)
+            except RuntimeError:
+                # The subscriber's loop has shut down.
+                continue
+
+    @staticmethod
+    def _deliver(queue, event):
+        if queue.full():
+            return
+        if queue.qsize() == queue.maxsize - 1:
+            event = RESYNC_EVENT
+        queue.put_nowait(event)
+
+    @asynccontextmanager
+    async def subscribe(self, user_id):
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue(self.queue_size))
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(subscriber)
+        try:
+            yield subscriber[1]
+        finally:
+            with self._lock:
+                queues = self._subscribers.get(user_id, set())
+                queues.discard(subscriber)
+                if not queues:
+                    self._subscribers.pop(user_id, None)
+
+
+@cache
+def get_broker():
+    """
+    Return the process-wide broker configured by `LEARNINGTRACKER_EVENT_BROKER`.
+    """
+    path = getattr(settings, "LEARNINGTRACKER_EVENT_BROKER", DEFAULT_BROKER)
+    return import_string(path)()
+
+
+def publish_on_commit(user_id, event):
+    """
+    Publish `event` to `user_id` once the current transaction commits, so
+    clients never react to data they cannot read yet.
+    """
+
+    def publish():
+        try:
+            get_broker().publish(user_id, event)
+        except Exception:
+            logger.exception(f"Failed to publish {event['type']} for user {user_id}")
+
+    transaction.on_commit(publish)
+
+
+def format_event(event, event_id=None):
+    """
+    Encode `event` as a Server-Sent Events message.
+    """
+    lines = [f"event: {event['type']}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(event, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def stream_events(user_id, keepalive=KEEPALIVE_INTERVAL):
+    """
+    Yield the Server-Sent Events stream of `user_id` until the client leaves.
+
+    The generator only holds a queue while it waits, so an idle stream costs a
+    suspended coroutine rather than a worker thread.
+    """
+    async with get_broker().subscribe(user_id) as queue:
+        yield f"retry: {RECONNECT_DELAY}\n\n"
+        event_id = 0
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), keepalive)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            event_id += 1
+            yield format_event(event, event_id)
+
+
+@receiver(entries_changed)
+def _publish_entries_changed(sender, user_id, dates, tag_ids, deleted_ids=(), **kwargs):
+    publish_on_commit(
+        user_id,
+        {
+            "type": "entries",
+            "dates": sorted(day.isoformat() for day in dates),
+            "tag_ids": sorted(tag_ids),
+            "deleted_ids": sorted(deleted_ids),
+        },
+    )
+
+
+@receiver(post_save, sender=Tag)
+def _publish_tag_saved(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        publish_on_commit(
+            instance.user_id,
+            {"type": "tags", "tag_ids": [instance.pk], "deleted": False},
+        )
+
+
+@receiver(post_delete, sender=Tag)
+def _publish_tag_deleted(sender, instance, origin=None, **kwargs):
+    if isinstance(origin, Tag) or getattr(origin, "model", None) is Tag:
+        publish_on_commit(
+            instance.user_id,
+            {"type": "tags", "tag_ids": [instance.pk], "deleted": True},
+        )
@@ -1,6 +1,12 @@
 import django_filters
+from django.db.models import Count
 
 from .models import DailyLearning, Tag
+from .search import search_entries
+
+
+class ChoiceInFilter(django_filters.BaseInFilter, django_filters.ChoiceFilter):
+    """Comma-separated list of exact choice values, matched with `IN (...)`."""
 
 
 class DailyLearningFilter(django_filters.FilterSet):
@@ -29,16 +35,85 @@ class DailyLearningFilter(django_filters.FilterSet):
         label="Learning Topic",
         help_text="Filter entries by a learning topic (case-insensitive match).",
     )
+    learning_type__in = ChoiceInFilter(
+        field_name="learning_type",
+        lookup_expr="in",
+        choices=DailyLearning.Topics.choices,
+        label="Learning Topics",
+        help_text="Filter entries by any of these exact topics (comma-separated).",
+    )
     description = django_filters.CharFilter(
         field_name="description",
         lookup_expr="icontains",
         label="Description",
         help_text="Filter entries by words in the desc. (case-insensitive match).",
     )
+    tags = django_filters.CharFilter(
+        method="filter_tags_any",
+        label="Tags (any)",
+        help_text="Comma-separated tag names; entries with at least one of them.",
+    )
+    tags_all = django_filters.CharFilter(
+        method="filter_tags_all",
+        label="Tags (all)",
+        help_text="Comma-separated tag names; entries with every one of them.",
+    )
+    q = django_filters.CharFilter(
+        method="filter_search",
+        label="Search",
+        help_text="Full-text search of the description, best matches first.",
+    )
 
     class Meta:
         model = DailyLearning
-        fields = ["date", "from_date", "to_date", "learning_type", "description"]
+        fields = [
+            "date",
+            "from_date",
+            "to_date",
+            "learning_type",
+            "learning_type__in",
+            "description",
+            "tags",
+            "tags_all",
+            "q",
+        ]
+
+    def _tag_links(self, value):
+        """
+        Return the requested tag names and a through-table queryset restricted to
+        links with those tags, resolved by the `(user, name_lower)` tag index.
+        """
+        names = {name.strip().lower() for name in value.split(",") if name.strip()}
+        tags = Tag.objects.filter(name_lower__in=names)
+        user = getattr(self.request, "user", None)
+        if user is not None and user.is_authenticated:
+            tags = tags.filter(user=user)
+        links = DailyLearning.tags.through.objects.filter(tag_id__in=tags.values("id"))
+        return names, links
+
+    def filter_tags_any(self, queryset, name, value):
+        names, links = self._tag_links(value)
+        if not names:
+            return queryset
+        return queryset.filter(id__in=links.values("dailylearning_id"))
+
+    def filter_tags_all(self, queryset, name, value):
+        names, links = self._tag_links(value)
+        if not names:
+            return queryset
+        # One grouped pass over the through table instead of one join per tag.
+        # Tag names are unique per user only as written, so count distinct
+        # lower-cased names: "Docker" and "docker" together match one name.
+        matching = (
+            links.values("dailylearning_id")
+            .annotate(matched=Count("tag__name_lower", distinct=True))
+            .filter(matched=len(names))
+            .values("dailylearning_id")
+        )
+        return queryset.filter(id__in=matching)
+
+    def filter_search(self, queryset, name, value):
+        return search_entries(queryset, value)
 
 
 class TagFilter(django_filters.FilterSet):
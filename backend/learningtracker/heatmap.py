@@ -0,0 +1,81 @@
+import base64
+from datetime import date
+
+from django.core.cache import cache
+from django.db import transaction
+from django.dispatch import receiver
+
+from .models import DailyLearning
+from .signals import entries_changed
+
+HEATMAP_CACHE_KEY = "learningtracker:heatmap:{user_id}:{year}"
+HEATMAP_CACHE_TIMEOUT = 24 * 60 * 60
+TOPICS = [value for value, _label in DailyLearning.Topics.choices]
+
+
+def _encode(data):
+    return base64.b64encode(bytes(data)).decode("ascii")
+
+
+def build_heatmap(user_id, year):
+    """
+    Encode the entries of `user_id` in `year` from a single `(user, date)` range
+    query.
+
+    `bitmap` holds one bit per day of the year, most significant bit first, set
+    when the day has an entry. `topics` holds one byte per day: 0 for no entry,
+    otherwise the 1-based index of the entry's topic in `topic_names`.
+    """
+    start = date(year, 1, 1)
+    days = (date(year + 1, 1, 1) - start).days
+    bitmap = bytearray((days + 7) // 8)
+    topics = bytearray(days)
+
+    rows = (
+        DailyLearning.objects.filter(
+            user_id=user_id, date__gte=start, date__lte=date(year, 12, 31)
+        )
+        .order_by()
+        .values_list("date", "learning_type")
+    )
+    total = 0
+    for day, learning_type in rows:
+        index = (day - start).days
+        bitmap[index // 8] |= 0x80 >> (index % 8)
+        topics[index] = TOPICS.index(learning_type) + 1
+        total += 1
+
+    return {
+        "year": year,
+        "start": start.isoformat(),
+        "days": days,
+        "total": total,
+        "bitmap": _encode(bitmap),
+        "topics": _encode(topics),
+        "topic_names": TOPICS,
+    }
+
+
+def user_heatmap(user_id, year):
+    """
+    Return the heatmap of `user_id` for `year`, cached until its entries change.
+    """
+    key = HEATMAP_CACHE_KEY.format(user_id=user_id, year=year)
+    heatmap = cache.get(key)
+    if heatmap is None:
+        heatmap = build_heatmap(user_id, year)
+        cache.set(key, heatmap, HEATMAP_CACHE_TIMEOUT)
+    return heatmap
+
+
+@receiver(entries_changed)
+def _invalidate_heatmaps(sender, user_id, dates, **kwargs):
+    keys = [
+        HEATMAP_CACHE_KEY.format(user_id=user_id, year=year)
+        for year in {day.year for day in dates}
+    ]
+    if keys:
+        # Drop now and again after commit, so a read racing the transaction
+        # cannot leave a stale heatmap behind.
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
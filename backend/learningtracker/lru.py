@@ -0,0 +1,61 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class ExpiringLRUCache:
+    """
+    Bounded, thread-safe LRU whose entries expire `timeout` seconds after they
+    are set, local to this process.
+
+    Writes in this process invalidate their keys at once; other processes keep
+    their copy for at most `timeout` seconds, which bounds how long they can
+    serve a stale value.
+    """
+
+    def __init__(self, size, timeout):
+        self.size = size
+        self.timeout = timeout
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            expires, value = cached
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.timeout, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate):
+        """
+        Drop every entry whose value matches `predicate`.
+        """
+        with self._lock:
+            stale = [
+                key for key, (_, value) in self._entries.items() if predicate(value)
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
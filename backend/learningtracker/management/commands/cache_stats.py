@@ -0,0 +1,40 @@
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand, CommandError
+from learningtracker.response_cache import (
+    reset_response_cache_stats,
+    response_cache_stats,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Show the hit/miss counters of the API response cache. Needs the shared "
+        "cache set by CACHE_URL, since the counters live in the serving processes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the counters after showing them",
+        )
+
+    def handle(self, *args, **kwargs):
+        # The counters live in the default cache. A process-local cache only
+        # holds this command's own, always empty, counters.
+        if isinstance(caches[DEFAULT_CACHE_ALIAS], (LocMemCache, DummyCache)):
+            raise CommandError(
+                "The response cache counters are kept per server process with "
+                "the local-memory cache; set CACHE_URL to a shared cache to "
+                "read them here."
+            )
+        stats = response_cache_stats()
+        ratio = "n/a" if stats["hit_ratio"] is None else f"{stats['hit_ratio']:.2%}"
+        self.stdout.write(
+            f"Hits: {stats['hits']}, misses: {stats['misses']}, hit ratio: {ratio}"
+        )
+        if kwargs["reset"]:
+            reset_response_cache_stats()
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
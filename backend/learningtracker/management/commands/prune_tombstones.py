@@ -0,0 +1,20 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from learningtracker.changes import TOMBSTONE_RETENTION, prune_tombstones
+
+
+class Command(BaseCommand):
+    help = "Delete change-feed tombstones that no valid cursor can still need."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=TOMBSTONE_RETENTION.days,
+            help="Keep tombstones younger than this many days",
+        )
+
+    def handle(self, *args, **kwargs):
+        deleted = prune_tombstones(timedelta(days=kwargs["days"]))
+        self.stdout.write(self.style.SUCCESS(f"Pruned {deleted} tombstones."))
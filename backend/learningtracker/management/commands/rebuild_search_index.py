@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+from learningtracker.caching import bump_user_generation
+from learningtracker.models import DailyLearning
+from learningtracker.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index over learning entry descriptions."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias whose search index should be rebuilt",
+        )
+
+    def handle(self, *args, **kwargs):
+        database = kwargs["database"]
+
+        if rebuild_search_index(using=database):
+            # Search results may change without any entry being written, so
+            # drop the cached responses of everyone with entries.
+            user_ids = (
+                DailyLearning.objects.using(database)
+                .values_list("user_id", flat=True)
+                .distinct()
+                .order_by()
+            )
+            for user_id in user_ids:
+                bump_user_generation(user_id)
+            self.stdout.write(
+                self.style.SUCCESS(f"Search index rebuilt on '{database}'.")
+            )
+        else:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Database '{database}' has no full-text index; nothing to do."
+                )
+            )
@@ -0,0 +1,63 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from learningtracker.models import DailyLearning, LearningRun
+from learningtracker.streaks import rebuild_streaks, runs_from_dates
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute learning streaks from all entries and report any drift from "
+        "the incrementally maintained values."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--username", help="Only recompute the streaks of this user"
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report mismatches, do not write the recomputed streaks",
+        )
+
+    def handle(self, *args, **kwargs):
+        users = User.objects.order_by("pk")
+        if kwargs["username"]:
+            users = users.filter(username=kwargs["username"])
+
+        mismatches = 0
+        for user in users.iterator():
+            expected = runs_from_dates(
+                list(
+                    DailyLearning.objects.filter(user=user)
+                    .order_by("date")
+                    .values_list("date", flat=True)
+                )
+            )
+            stored = list(
+                LearningRun.objects.filter(user=user)
+                .order_by("start")
+                .values_list("start", "end")
+            )
+            if stored != expected:
+                mismatches += 1
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Streaks of '{user.username}' drifted: "
+                        f"{len(stored)} stored runs, {len(expected)} expected."
+                    )
+                )
+            if not kwargs["check"]:
+                with transaction.atomic():
+                    rebuild_streaks(user.pk)
+
+        if mismatches:
+            action = "found" if kwargs["check"] else "fixed"
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{mismatches} user(s) with drifted streaks {action}."
+                )
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS("All streaks are up to date."))
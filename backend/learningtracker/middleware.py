@@ -0,0 +1,56 @@
+from http import HTTPStatus
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.functional import SimpleLazyObject
+
+from .auth_cache import get_cached_user
+
+
+class ConditionalSessionMiddleware(SessionMiddleware):
+    """
+    `SessionMiddleware` that leaves 304 responses alone.
+
+    With `SESSION_SAVE_EVERY_REQUEST` every response re-signs the session and
+    sends a new cookie, which would turn a bodyless 304 into a session write.
+    Unless the view changed the session, a 304 keeps the client's cookie; the
+    session expiry is extended by the next full response instead.
+    """
+
+    def process_response(self, request, response):
+        session = getattr(request, "session", None)
+        if (
+            response.status_code == HTTPStatus.NOT_MODIFIED
+            and session is not None
+            and not session.modified
+        ):
+            if session.accessed:
+                patch_vary_headers(response, ("Cookie",))
+            return response
+        return super().process_response(request, response)
+
+
+def _get_user(request):
+    if not hasattr(request, "_cached_user"):
+        request._cached_user = get_cached_user(request)
+    return request._cached_user
+
+
+async def _auser(request):
+    if not hasattr(request, "_acached_user"):
+        request._acached_user = await sync_to_async(get_cached_user)(request)
+    return request._acached_user
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    """
+    `AuthenticationMiddleware` that loads `request.user` through the user cache
+    instead of querying `auth_user` on every request.
+    """
+
+    def process_request(self, request):
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: _get_user(request))
+        request.auser = lambda: _auser(request)
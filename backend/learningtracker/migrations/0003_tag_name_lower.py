@@ -0,0 +1,33 @@
+# Generated by Django 5.1.15 on 2026-10-17 20:44
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("learningtracker", "0002_dailylearning_description_search"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tag",
+            name="name_lower",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.text.Lower("name"),
+                help_text="Lower-cased tag name maintained by the database.",
+                output_field=models.CharField(max_length=30),
+                verbose_name="Normalised Tag Name",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tag",
+            index=models.Index(
+                fields=["user", "name_lower"], name="learningtra_user_id_208b17_idx"
+            ),
+        ),
+    ]
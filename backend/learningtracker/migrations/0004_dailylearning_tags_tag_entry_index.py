@@ -0,0 +1,26 @@
+from django.db import migrations
+
+THROUGH_TABLE = "learningtracker_dailylearning_tags"
+INDEX_NAME = "learningtra_dl_tags_tag_entry_idx"
+
+
+class Migration(migrations.Migration):
+    """
+    Index the entry/tag through table by `(tag_id, dailylearning_id)`.
+
+    The auto-created through table only has a unique `(dailylearning_id, tag_id)`
+    index plus single-column FK indexes, so "entries carrying tag X" had to visit
+    the table for every row. The composite index answers the tag filters' grouped
+    subqueries from the index alone.
+    """
+
+    dependencies = [
+        ("learningtracker", "0003_tag_name_lower"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            f"CREATE INDEX {INDEX_NAME} ON {THROUGH_TABLE} (tag_id, dailylearning_id)",
+            f"DROP INDEX {INDEX_NAME}",
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.15 on 2026-10-17 20:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("learningtracker", "0004_dailylearning_tags_tag_entry_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="dailylearning",
+            index=models.Index(
+                fields=["user", "learning_type", "date"],
+                name="learningtra_user_id_3e35b1_idx",
+            ),
+        ),
+    ]
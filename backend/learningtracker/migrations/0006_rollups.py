@@ -0,0 +1,140 @@
+# Generated by Django 5.1.15 on 2026-10-17 20:48
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("learningtracker", "0005_dailylearning_user_learning_type_date_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TagRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "entry_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="How many of the user's entries carry this tag.",
+                        verbose_name="Entry Count",
+                    ),
+                ),
+                (
+                    "tag",
+                    models.OneToOneField(
+                        help_text="The counted tag.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rollup",
+                        to="learningtracker.tag",
+                        verbose_name="Tag",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="The user who owns the tag.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="tag_rollups",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="User",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Tag Rollup",
+                "verbose_name_plural": "Tag Rollups",
+            },
+        ),
+        migrations.CreateModel(
+            name="MonthlyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "month",
+                    models.DateField(
+                        help_text="The first day of the counted month.",
+                        verbose_name="Month",
+                    ),
+                ),
+                (
+                    "learning_type",
+                    models.CharField(
+                        choices=[
+                            ("Python", "Python"),
+                            ("Django", "Django"),
+                            ("Flask", "Flask"),
+                            ("Kubernetes", "Kubernetes"),
+                            ("Docker", "Docker"),
+                            ("Grafana", "Grafana"),
+                            ("SQL", "SQL"),
+                            ("NoSQL", "NoSQL"),
+                            ("React", "React"),
+                            ("Angular", "Angular"),
+                            ("Vue", "Vue"),
+                            ("Testing", "Testing"),
+                            ("CI/CD", "CI/CD"),
+                            ("DevOps", "DevOps"),
+                            ("Cloud", "Cloud"),
+                            ("Machine Learning", "Machine Learning"),
+                            ("Data Analysis", "Data Analysis"),
+                            ("Security", "Security"),
+                            ("Other", "Other"),
+                        ],
+                        help_text="The topic of the counted entries.",
+                        max_length=50,
+                        verbose_name="Learning Topic",
+                    ),
+                ),
+                (
+                    "entry_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="How many entries of this topic fall in this month.",
+                        verbose_name="Entry Count",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="The user whose entries are counted.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="monthly_rollups",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="User",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Monthly Rollup",
+                "verbose_name_plural": "Monthly Rollups",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "month", "learning_type"),
+                        name="unique_user_month_topic",
+                    )
+                ],
+            },
+        ),
+    ]
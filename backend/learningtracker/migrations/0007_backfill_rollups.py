@@ -0,0 +1,56 @@
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import TruncMonth
+
+
+def backfill_rollups(apps, schema_editor):
+    DailyLearning = apps.get_model("learningtracker", "DailyLearning")
+    MonthlyRollup = apps.get_model("learningtracker", "MonthlyRollup")
+    Tag = apps.get_model("learningtracker", "Tag")
+    TagRollup = apps.get_model("learningtracker", "TagRollup")
+
+    monthly = (
+        DailyLearning.objects.annotate(month=TruncMonth("date"))
+        .values_list("user_id", "month", "learning_type")
+        .annotate(entry_count=Count("id"))
+        .order_by()
+    )
+    MonthlyRollup.objects.bulk_create(
+        [
+            MonthlyRollup(
+                user_id=user_id,
+                month=month,
+                learning_type=learning_type,
+                entry_count=entry_count,
+            )
+            for user_id, month, learning_type, entry_count in monthly.iterator()
+        ],
+        batch_size=1000,
+    )
+
+    tags = Tag.objects.annotate(entry_count=Count("daily_learnings")).values_list(
+        "user_id", "id", "entry_count"
+    )
+    TagRollup.objects.bulk_create(
+        [
+            TagRollup(user_id=user_id, tag_id=tag_id, entry_count=entry_count)
+            for user_id, tag_id, entry_count in tags.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+def clear_rollups(apps, schema_editor):
+    apps.get_model("learningtracker", "MonthlyRollup").objects.all().delete()
+    apps.get_model("learningtracker", "TagRollup").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("learningtracker", "0006_rollups"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_rollups, clear_rollups),
+    ]
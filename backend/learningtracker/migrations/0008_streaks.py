@@ -0,0 +1,145 @@
+# Generated by Django 5.1.15 on 2026-10-17 20:50
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("learningtracker", "0007_backfill_rollups"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LearningStreak",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        help_text="The user the streaks belong to.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="learning_streak",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="User",
+                    ),
+                ),
+                (
+                    "latest_start",
+                    models.DateField(
+                        blank=True,
+                        help_text="The first day of the most recent run.",
+                        null=True,
+                        verbose_name="Latest Run Start",
+                    ),
+                ),
+                (
+                    "latest_end",
+                    models.DateField(
+                        blank=True,
+                        help_text="The last day of the most recent run.",
+                        null=True,
+                        verbose_name="Latest Run End",
+                    ),
+                ),
+                (
+                    "latest_length",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of days in the most recent run.",
+                        verbose_name="Latest Run Length",
+                    ),
+                ),
+                (
+                    "longest_start",
+                    models.DateField(
+                        blank=True,
+                        help_text="The first day of the longest run.",
+                        null=True,
+                        verbose_name="Longest Run Start",
+                    ),
+                ),
+                (
+                    "longest_end",
+                    models.DateField(
+                        blank=True,
+                        help_text="The last day of the longest run.",
+                        null=True,
+                        verbose_name="Longest Run End",
+                    ),
+                ),
+                (
+                    "longest_length",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of days in the longest run.",
+                        verbose_name="Longest Run Length",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Learning Streak",
+                "verbose_name_plural": "Learning Streaks",
+            },
+        ),
+        migrations.CreateModel(
+            name="LearningRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "start",
+                    models.DateField(
+                        help_text="The first day of the run.", verbose_name="Start"
+                    ),
+                ),
+                (
+                    "end",
+                    models.DateField(
+                        help_text="The last day of the run.", verbose_name="End"
+                    ),
+                ),
+                (
+                    "length",
+                    models.PositiveIntegerField(
+                        help_text="Number of consecutive days in the run.",
+                        verbose_name="Length",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="The user who logged the run.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="learning_runs",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="User",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Learning Run",
+                "verbose_name_plural": "Learning Runs",
+                "indexes": [
+                    models.Index(
+                        fields=["user", "end"], name="learningtra_user_id_09af14_idx"
+                    ),
+                    models.Index(
+                        fields=["user", "length"], name="learningtra_user_id_cbaff4_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,62 @@
+from datetime import timedelta
+
+from django.db import migrations
+
+
+def backfill_streaks(apps, schema_editor):
+    DailyLearning = apps.get_model("learningtracker", "DailyLearning")
+    LearningRun = apps.get_model("learningtracker", "LearningRun")
+    LearningStreak = apps.get_model("learningtracker", "LearningStreak")
+
+    runs = {}
+    for user_id, day in (
+        DailyLearning.objects.order_by("user_id", "date")
+        .values_list("user_id", "date")
+        .iterator()
+    ):
+        user_runs = runs.setdefault(user_id, [])
+        if user_runs and day - user_runs[-1][1] == timedelta(days=1):
+            user_runs[-1][1] = day
+        else:
+            user_runs.append([day, day])
+
+    for user_id, user_runs in runs.items():
+        LearningRun.objects.bulk_create(
+            [
+                LearningRun(
+                    user_id=user_id,
+                    start=start,
+                    end=end,
+                    length=(end - start).days + 1,
+                )
+                for start, end in user_runs
+            ],
+            batch_size=1000,
+        )
+        latest = user_runs[-1]
+        longest = max(user_runs, key=lambda run: ((run[1] - run[0]).days, run[1]))
+        LearningStreak.objects.create(
+            user_id=user_id,
+            latest_start=latest[0],
+            latest_end=latest[1],
+            latest_length=(latest[1] - latest[0]).days + 1,
+            longest_start=longest[0],
+            longest_end=longest[1],
+            longest_length=(longest[1] - longest[0]).days + 1,
+        )
+
+
+def clear_streaks(apps, schema_editor):
+    apps.get_model("learningtracker", "LearningRun").objects.all().delete()
+    apps.get_model("learningtracker", "LearningStreak").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("learningtracker", "0008_streaks"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_streaks, clear_streaks),
+    ]
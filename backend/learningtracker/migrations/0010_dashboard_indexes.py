@@ -0,0 +1,33 @@
+# Generated by Django 5.1.15 on 2026-10-17 20:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("learningtracker", "0009_backfill_streaks"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="dailylearning",
+            index=models.Index(
+                fields=["date", "user"], name="learningtra_date_d4bd94_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="learningstreak",
+            index=models.Index(
+                fields=["latest_length"], name="learningtra_latest__b6096e_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="learningstreak",
+            index=models.Index(
+                fields=["longest_length"], name="learningtra_longest_9bc491_idx"
+            ),
+        ),
+    ]
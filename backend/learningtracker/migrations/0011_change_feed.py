@@ -0,0 +1,82 @@
+# Generated by Django 5.1.15 on 2026-10-17 20:59
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("learningtracker", "0010_dashboard_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("entry", "Entry"), ("tag", "Tag")],
+                        help_text="Whether an entry or a tag was deleted.",
+                        max_length=5,
+                        verbose_name="Kind",
+                    ),
+                ),
+                (
+                    "object_id",
+                    models.BigIntegerField(
+                        help_text="The primary key the deleted object had.",
+                        verbose_name="Object ID",
+                    ),
+                ),
+                (
+                    "deleted_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="When the object was deleted.",
+                        verbose_name="Deleted At",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Tombstone",
+                "verbose_name_plural": "Tombstones",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="dailylearning",
+            index=models.Index(
+                fields=["user", "updated_at"], name="learningtra_user_id_58fcee_idx"
+            ),
+        ),
+        migrations.AddField(
+            model_name="tombstone",
+            name="user",
+            field=models.ForeignKey(
+                help_text="The user who owned the deleted object.",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="tombstones",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="User",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tombstone",
+            index=models.Index(
+                fields=["user", "deleted_at"], name="learningtra_user_id_9ba835_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 5.1.15 on 2026-10-17 21:14
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("learningtracker", "0011_change_feed"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ApiToken",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        help_text="What the token is used for.",
+                        max_length=50,
+                        verbose_name="Name",
+                    ),
+                ),
+                (
+                    "prefix",
+                    models.CharField(
+                        help_text="The start of the token, to tell tokens apart.",
+                        max_length=12,
+                        verbose_name="Prefix",
+                    ),
+                ),
+                (
+                    "digest",
+                    models.CharField(
+                        help_text="SHA-256 hex digest of the token.",
+                        max_length=64,
+                        unique=True,
+                        verbose_name="Digest",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="When the token was issued.",
+                        verbose_name="Created At",
+                    ),
+                ),
+                (
+                    "expires_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="When the token stops working; empty for never.",
+                        null=True,
+                        verbose_name="Expires At",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="The user the token authenticates as.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="api_tokens",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="User",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "API Token",
+                "verbose_name_plural": "API Tokens",
+            },
+        ),
+    ]
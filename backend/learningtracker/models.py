@@ -1,11 +1,83 @@
-from datetime import date
+import hashlib
+import secrets
+import sys
+from datetime import date, timedelta
+from typing import NamedTuple
 
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Lower
+from django.utils import timezone
 
 from .utils.error_const import DAILY_LEARNING_ERRORS, TAG_ERRORS
 
+ROLLING_WINDOWS = (30, 90, 365)
+
+
+class ProgressWindow(NamedTuple):
+    kind: str
+    label: str
+    start: date
+    end: date
+
+    @property
+    def days(self):
+        return (self.end - self.start).days + 1
+
+
+def progress_windows(years, rolling_days=ROLLING_WINDOWS, today=None):
+    """
+    Build the calendar-year, calendar-quarter and rolling windows for `years`.
+
+    Windows are clipped to `today`; those that have not started yet are left out.
+    """
+    today = today or date.today()
+    windows = []
+    for year in sorted(set(years)):
+        if year > today.year:
+            continue
+        windows.append(
+            ProgressWindow(
+                "years", str(year), date(year, 1, 1), min(date(year, 12, 31), today)
+            )
+        )
+        for quarter in range(4):
+            start = date(year, 3 * quarter + 1, 1)
+            if start > today:
+                break
+            end = (
+                date(year, 3 * quarter + 4, 1) - timedelta(days=1)
+                if quarter < 3
+                else date(year, 12, 31)
+            )
+            windows.append(
+                ProgressWindow(
+                    "quarters", f"{year}-Q{quarter + 1}", start, min(end, today)
+                )
+            )
+    for days in rolling_days:
+        windows.append(
+            ProgressWindow(
+                "rolling", f"{days}d", today - timedelta(days=days - 1), today
+            )
+        )
+    return windows
+
+
+def _next_prefix(prefix):
+    """
+    Return the smallest string above every string starting with `prefix`, or
+    None when its last character is the highest code point.
+    """
+    code_point = ord(prefix[-1]) + 1
+    if code_point > sys.maxunicode:
+        return None
+    if 0xD800 <= code_point <= 0xDFFF:
+        # Surrogates cannot be encoded; skip to the next real character.
+        code_point = 0xE000
+    return prefix[:-1] + chr(code_point)
+
 
 class Tag(models.Model):
     user = models.ForeignKey(
@@ -20,11 +92,21 @@ class Tag(models.Model):
         verbose_name="Tag Name",
         help_text="The name of the tag.",
     )
+    name_lower = models.GeneratedField(
+        expression=Lower("name"),
+        output_field=models.CharField(max_length=30),
+        db_persist=True,
+        verbose_name="Normalised Tag Name",
+        help_text="Lower-cased tag name maintained by the database.",
+    )
 
     class Meta:
         unique_together = ("user", "name")
         verbose_name = "Tag"
         verbose_name_plural = "Tags"
+        indexes = [
+            models.Index(fields=["user", "name_lower"]),
+        ]
 
     def clean(self):
         errors = {}
@@ -42,6 +124,29 @@ class Tag(models.Model):
     def __str__(self):
         return f"{self.name} ({self.user.username})"
 
+    @classmethod
+    def autocomplete(cls, user, prefix, limit=10):
+        """
+        Return up to `limit` tags of `user` whose name starts with `prefix`,
+        ignoring case, most used first.
+
+        The prefix is matched as a `[prefix, next_prefix)` range on the indexed
+        `name_lower` column so the lookup is an index range scan on any backend;
+        the `startswith` check keeps the match exact under any collation.
+        """
+        prefix = prefix.lower()
+        queryset = cls.objects.filter(user=user)
+        if prefix:
+            queryset = queryset.filter(
+                name_lower__gte=prefix, name_lower__startswith=prefix
+            )
+            upper_bound = _next_prefix(prefix)
+            if upper_bound is not None:
+                queryset = queryset.filter(name_lower__lt=upper_bound)
+        return queryset.annotate(usage_count=models.Count("daily_learnings")).order_by(
+            "-usage_count", "name_lower"
+        )[:limit]
+
 
 class DailyLearning(models.Model):
     class Topics(models.TextChoices):
@@ -117,6 +222,9 @@ class DailyLearning(models.Model):
         ]
         indexes = [
             models.Index(fields=["user", "date"]),
+            models.Index(fields=["user", "learning_type", "date"]),
+            models.Index(fields=["date", "user"]),
+            models.Index(fields=["user", "updated_at"]),
         ]
 
     def __str__(self):
@@ -141,6 +249,13 @@ class DailyLearning(models.Model):
         if errors:
             raise ValidationError(errors)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored values so change tracking can see what moved.
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
     def save(self, *args, **kwargs):
         """
         Override save to enforce validation by calling full_clean.
@@ -148,11 +263,419 @@ class DailyLearning(models.Model):
         self.full_clean()
         super().save(*args, **kwargs)
 
+    @classmethod
+    def upsert_for_date(cls, user, entry_date, **fields):
+        """
+        Insert or update the entry of `user` on `entry_date` in a single statement.
+
+        Relies on the database's native `INSERT ... ON CONFLICT DO UPDATE` over the
+        `unique_user_date` constraint, so concurrent calls for the same day never
+        raise an IntegrityError. Callers are expected to have validated `fields`.
+        """
+        entry = cls(user=user, date=entry_date, **fields)
+        cls.objects.bulk_create(
+            [entry],
+            update_conflicts=True,
+            unique_fields=["user", "date"],
+            update_fields=[*fields, "updated_at"],
+        )
+        return entry
+
     @classmethod
     def entries_vs_days(cls, user):
         """
         Returns the ratio of learning entries to the number of days in the current year.
         """
-        total_days = (date.today() - date(date.today().year, 1, 1)).days + 1
-        entries = cls.objects.filter(user=user, date__year=date.today().year).count()
-        return entries, total_days
+        today = date.today()
+        window = progress_windows([today.year], rolling_days=(), today=today)[0]
+        entries = cls.objects.filter(
+            user=user, date__gte=window.start, date__lte=window.end
+        ).count()
+        return entries, window.days
+
+    @classmethod
+    def progress(cls, user_ids, years, rolling_days=ROLLING_WINDOWS, today=None):
+        """
+        Entries vs. elapsed days per year, per quarter and over rolling windows.
+
+        Every window of every user is counted by one grouped query with a `date`
+        range predicate per window, so the `(user, date)` index is used instead
+        of extracting the year of every row. Returns
+        `{user_id: {"years": [...], "quarters": [...], "rolling": [...]}}`.
+        """
+        today = today or date.today()
+        windows = progress_windows(years, rolling_days=rolling_days, today=today)
+        user_ids = list(user_ids)
+        counts = {}
+        if windows and user_ids:
+            counts = {
+                row.pop("user_id"): row
+                for row in cls.objects.filter(
+                    user_id__in=user_ids,
+                    date__gte=min(window.start for window in windows),
+                    date__lte=today,
+                )
+                .values("user_id")
+                .annotate(
+                    **{
+                        f"w{index}": models.Count(
+                            "pk",
+                            filter=models.Q(
+                                date__gte=window.start, date__lte=window.end
+                            ),
+                        )
+                        for index, window in enumerate(windows)
+                    }
+                )
+                .order_by()
+            }
+
+        progress = {}
+        for user_id in user_ids:
+            row = counts.get(user_id, {})
+            result = {"years": [], "quarters": [], "rolling": []}
+            for index, window in enumerate(windows):
+                entries = row.get(f"w{index}", 0)
+                result[window.kind].append(
+                    {
+                        "period": window.label,
+                        "start": window.start.isoformat(),
+                        "end": window.end.isoformat(),
+                        "entries": entries,
+                        "days": window.days,
+                        "ratio": round(entries / window.days, 4),
+                    }
+                )
+            progress[user_id] = result
+        return progress
+
+
+class MonthlyRollup(models.Model):
+    """
+    Number of a user's learning entries per month and topic.
+
+    Rows are derived from `DailyLearning` and kept current by `rollups.py` in the
+    same transaction as every entry write, so statistics never scan raw entries.
+    """
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="monthly_rollups",
+        verbose_name="User",
+        help_text="The user whose entries are counted.",
+    )
+    month = models.DateField(
+        verbose_name="Month",
+        help_text="The first day of the counted month.",
+    )
+    learning_type = models.CharField(
+        max_length=50,
+        choices=DailyLearning.Topics.choices,
+        verbose_name="Learning Topic",
+        help_text="The topic of the counted entries.",
+    )
+    entry_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Entry Count",
+        help_text="How many entries of this topic fall in this month.",
+    )
+
+    class Meta:
+        verbose_name = "Monthly Rollup"
+        verbose_name_plural = "Monthly Rollups"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "month", "learning_type"],
+                name="unique_user_month_topic",
+            )
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.user.username}: {self.entry_count} {self.learning_type} "
+            f"in {self.month.strftime('%b %Y')}"
+        )
+
+
+class TagRollup(models.Model):
+    """
+    Number of learning entries carrying a tag, kept current by `rollups.py`.
+    """
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="tag_rollups",
+        verbose_name="User",
+        help_text="The user who owns the tag.",
+    )
+    tag = models.OneToOneField(
+        Tag,
+        on_delete=models.CASCADE,
+        related_name="rollup",
+        verbose_name="Tag",
+        help_text="The counted tag.",
+    )
+    entry_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Entry Count",
+        help_text="How many of the user's entries carry this tag.",
+    )
+
+    class Meta:
+        verbose_name = "Tag Rollup"
+        verbose_name_plural = "Tag Rollups"
+
+    def __str__(self):
+        return f"{self.tag.name}: {self.entry_count} entries"
+
+
+class LearningRun(models.Model):
+    """
+    A maximal run of consecutive days on which a user logged an entry.
+
+    Runs are kept current by `streaks.py`, which only rebuilds the runs around
+    the dates touched by a write.
+    """
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="learning_runs",
+        verbose_name="User",
+        help_text="The user who logged the run.",
+    )
+    start = models.DateField(
+        verbose_name="Start",
+        help_text="The first day of the run.",
+    )
+    end = models.DateField(
+        verbose_name="End",
+        help_text="The last day of the run.",
+    )
+    length = models.PositiveIntegerField(
+        verbose_name="Length",
+        help_text="Number of consecutive days in the run.",
+    )
+
+    class Meta:
+        verbose_name = "Learning Run"
+        verbose_name_plural = "Learning Runs"
+        indexes = [
+            models.Index(fields=["user", "end"]),
+            models.Index(fields=["user", "length"]),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username}: {self.length} days ending {self.end}"
+
+
+class LearningStreak(models.Model):
+    """
+    Per-user summary of the latest and the longest learning run.
+    """
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="learning_streak",
+        verbose_name="User",
+        help_text="The user the streaks belong to.",
+    )
+    latest_start = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name="Latest Run Start",
+        help_text="The first day of the most recent run.",
+    )
+    latest_end = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name="Latest Run End",
+        help_text="The last day of the most recent run.",
+    )
+    latest_length = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Latest Run Length",
+        help_text="Number of days in the most recent run.",
+    )
+    longest_start = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name="Longest Run Start",
+        help_text="The first day of the longest run.",
+    )
+    longest_end = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name="Longest Run End",
+        help_text="The last day of the longest run.",
+    )
+    longest_length = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Longest Run Length",
+        help_text="Number of days in the longest run.",
+    )
+
+    class Meta:
+        verbose_name = "Learning Streak"
+        verbose_name_plural = "Learning Streaks"
+        indexes = [
+            models.Index(fields=["latest_length"]),
+            models.Index(fields=["longest_length"]),
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.user.username}: current {self.current_length()}, "
+            f"longest {self.longest_length}"
+        )
+
+    def current_length(self, today=None):
+        """
+        Length of the streak that is still alive, i.e. whose latest run ends
+        today or yesterday; 0 otherwise.
+        """
+        today = today or date.today()
+        if self.latest_end is None or (today - self.latest_end).days > 1:
+            return 0
+        return self.latest_length
+
+
+class Tombstone(models.Model):
+    """
+    Record of a deleted entry or tag, so the change feed can tell clients to
+    drop their copy.
+
+    Rows are written by `changes.py` and pruned by the `prune_tombstones`
+    command once no client cursor can be that old.
+    """
+
+    class Kinds(models.TextChoices):
+        ENTRY = "entry", "Entry"
+        TAG = "tag", "Tag"
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="tombstones",
+        verbose_name="User",
+        help_text="The user who owned the deleted object.",
+    )
+    kind = models.CharField(
+        max_length=5,
+        choices=Kinds.choices,
+        verbose_name="Kind",
+        help_text="Whether an entry or a tag was deleted.",
+    )
+    object_id = models.BigIntegerField(
+        verbose_name="Object ID",
+        help_text="The primary key the deleted object had.",
+    )
+    deleted_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name="Deleted At",
+        help_text="When the object was deleted.",
+    )
+
+    class Meta:
+        verbose_name = "Tombstone"
+        verbose_name_plural = "Tombstones"
+        indexes = [
+            models.Index(fields=["user", "deleted_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username}: {self.kind} {self.object_id} deleted"
+
+
+class ApiToken(models.Model):
+    """
+    Token for scripted API clients, sent as `Authorization: Token <token>`.
+
+    Only a SHA-256 digest of the token is stored; the token itself is shown
+    once, when it is issued. See `authentication.py`.
+    """
+
+    PREFIX = "lt_"
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="api_tokens",
+        verbose_name="User",
+        help_text="The user the token authenticates as.",
+    )
+    name = models.CharField(
+        max_length=50,
+        verbose_name="Name",
+        help_text="What the token is used for.",
+    )
+    prefix = models.CharField(
+        max_length=12,
+        verbose_name="Prefix",
+        help_text="The start of the token, to tell tokens apart.",
+    )
+    digest = models.CharField(
+        max_length=64,
+        unique=True,
+        verbose_name="Digest",
+        help_text="SHA-256 hex digest of the token.",
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="Created At",
+        help_text="When the token was issued.",
+    )
+    expires_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Expires At",
+        help_text="When the token stops working; empty for never.",
+    )
+
+    class Meta:
+        verbose_name = "API Token"
+        verbose_name_plural = "API Tokens"
+
+    def __str__(self):
+        return f"{self.name} ({self.user.username}, {self.prefix}...)"
+
+    @staticmethod
+    def hash(key):
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    @classmethod
+    def issue(cls, user, name, lifetime=None):
+        """
+        Create a token for `user` that expires after `lifetime`, if given.
+
+        Returns the saved `ApiToken` and the token itself, which is not stored.
+        """
+        key = cls.PREFIX + secrets.token_urlsafe(32)
+        token = cls.objects.create(
+            user=user,
+            name=name,
+            prefix=key[:12],
+            digest=cls.hash(key),
+            expires_at=timezone.now() + lifetime if lifetime else None,
+        )
+        return token, key
+
+    def is_expired(self, now=None):
+        return self.expires_at is not None and self.expires_at <= (
+            now or timezone.now()
+        )
+
+    def rotate(self, grace=timedelta(0), lifetime=None):
+        """
+        Issue a replacement token with the same name and let this one expire
+        after `grace`, so clients can switch over without failed requests.
+        """
+        expires_at = timezone.now() + grace
+        if self.expires_at is None or expires_at < self.expires_at:
+            self.expires_at = expires_at
+            self.save(update_fields=["expires_at"])
+        return ApiToken.issue(self.user, self.name, lifetime=lifetime)
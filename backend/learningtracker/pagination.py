@@ -0,0 +1,221 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+INVALID_CURSOR_MESSAGE = "Invalid cursor."
+
+
+def _flip(field):
+    return field[1:] if field.startswith("-") else f"-{field}"
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Opt-in keyset pagination over a unique `(field, id)` ordering.
+
+    Pagination only kicks in when the request carries a `cursor` or `page_size`
+    query parameter, so existing clients keep receiving the full list. Pages are
+    located with a range predicate on the ordering columns instead of an OFFSET,
+    and no `COUNT(*)` is issued, so fetching page 1 or page 10,000 costs the same
+    index range scan.
+    """
+
+    ordering = ("id",)
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = 50
+    max_page_size = 500
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page = self._page_queryset(queryset, request)
+        if page is None:
+            return None
+        return self._finish_page(list(page))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        `paginate_queryset()` for async views, reading the page with the async
+        ORM.
+        """
+        page = self._page_queryset(queryset, request)
+        if page is None:
+            return None
+        return self._finish_page([instance async for instance in page])
+
+    def _page_queryset(self, queryset, request):
+        if (
+            self.cursor_query_param not in request.query_params
+            and self.page_size_query_param not in request.query_params
+        ):
+            return None
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.page_ordering = self.get_ordering(queryset)
+        self.position, self.reverse = self.decode_cursor(request)
+
+        queryset = queryset.order_by(
+            *(_flip(field) if self.reverse else field for field in self.page_ordering)
+        )
+        if self.position is not None:
+            try:
+                queryset = queryset.filter(
+                    self._keyset_filter(self.position, self.reverse)
+                )
+            except (DjangoValidationError, ValueError, TypeError):
+                raise NotFound(INVALID_CURSOR_MESSAGE)
+
+        # Fetch one extra row to find out whether another page exists.
+        return queryset[: self.page_size + 1]
+
+    def _finish_page(self, results):
+        position, reverse = self.position, self.reverse
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+
+        if reverse:
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.first_position = self._position(results[0]) if results else position
+        self.last_position = self._position(results[-1]) if results else position
+        return results
+
+    def get_ordering(self, queryset):
+        """
+        Return the unique ordering to page `queryset` by; a `-` prefix sorts
+        that column descending.
+        """
+        return self.ordering
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_next_link(self):
+        if not self.has_next or self.last_position is None:
+            return None
+        return self.encode_cursor(self.last_position, reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.first_position is None:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.first_position, reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Opaque pagination cursor value.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page.",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+    def encode_cursor(self, position, reverse):
+        payload = json.dumps({"p": position, "r": int(reverse)}, separators=(",", ":"))
+        encoded = base64.urlsafe_b64encode(payload.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            position = payload["p"]
+            reverse = bool(payload.get("r", 0))
+        except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+            raise NotFound(INVALID_CURSOR_MESSAGE)
+        if not isinstance(position, list) or len(position) != len(self.page_ordering):
+            raise NotFound(INVALID_CURSOR_MESSAGE)
+        return position, reverse
+
+    def _position(self, instance):
+        values = []
+        for field in self.page_ordering:
+            value = getattr(instance, field.lstrip("-"))
+            values.append(value.isoformat() if hasattr(value, "isoformat") else value)
+        return values
+
+    def _keyset_filter(self, position, reverse):
+        """
+        Build `(a, b, ...) > (x, y, ...)` as an OR-chain of equality prefixes.
+
+        The leading column is repeated as a plain `>=`/`<=` bound so the planner
+        can turn it into an index range scan.
+        """
+        fields = [field.lstrip("-") for field in self.page_ordering]
+        # Descending columns move towards smaller values.
+        forward = [field.startswith("-") == reverse for field in self.page_ordering]
+        condition = Q()
+        for index, field in enumerate(fields):
+            # Equal on every earlier column, strictly beyond on this one.
+            prefix = dict(zip(fields[:index], position[:index]))
+            lookup = "gt" if forward[index] else "lt"
+            condition |= Q(**prefix, **{f"{field}__{lookup}": position[index]})
+        lead_lookup = "gte" if forward[0] else "lte"
+        return Q(**{f"{fields[0]}__{lead_lookup}": position[0]}) & condition
+
+
+class DailyLearningCursorPagination(KeysetCursorPagination):
+    ordering = ("date", "id")
+    search_ordering = ("-search_rank", "date", "id")
+
+    def get_ordering(self, queryset):
+        # Full-text search (`q=`) pages through its results best match first.
+        if "search_rank" in queryset.query.annotations:
+            return self.search_ordering
+        return self.ordering
+
+
+class TagCursorPagination(KeysetCursorPagination):
+    ordering = ("name", "id")
@@ -0,0 +1,46 @@
+from datetime import date
+
+from django.core.cache import cache
+
+from .caching import user_generations
+from .models import ROLLING_WINDOWS, DailyLearning
+
+PROGRESS_CACHE_KEY = "learningtracker:progress:{user_id}:{generation}:{signature}"
+PROGRESS_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+def cached_progress(user_ids, years, rolling_days=ROLLING_WINDOWS, today=None):
+    """
+    `DailyLearning.progress()` with results cached per user until its data
+    changes.
+
+    Keys carry the user's cache generation, which `entries_changed` bumps, and
+    the day, so rolling windows move on at midnight. Users missing from the
+    cache are computed together with a single grouped query.
+    """
+    today = today or date.today()
+    signature = "{}:{}:{}".format(
+        today.isoformat(),
+        ",".join(str(year) for year in sorted(set(years))),
+        ",".join(str(days) for days in rolling_days),
+    )
+    keys = {
+        user_id: PROGRESS_CACHE_KEY.format(
+            user_id=user_id, generation=generation, signature=signature
+        )
+        for user_id, generation in user_generations(user_ids).items()
+    }
+
+    found = cache.get_many(list(keys.values()))
+    progress = {user_id: found[key] for user_id, key in keys.items() if key in found}
+    missing = [user_id for user_id in keys if user_id not in progress]
+    if missing:
+        computed = DailyLearning.progress(
+            missing, years, rolling_days=rolling_days, today=today
+        )
+        cache.set_many(
+            {keys[user_id]: result for user_id, result in computed.items()},
+            PROGRESS_CACHE_TIMEOUT,
+        )
+        progress.update(computed)
+    return progress
@@ -0,0 +1,94 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+from .caching import user_generation
+
+RESPONSE_CACHE_KEY = "learningtracker:response:{user_id}:{generation}:{digest}"
+HITS_KEY = "learningtracker:response-cache:hits"
+MISSES_KEY = "learningtracker:response-cache:misses"
+DEFAULT_TIMEOUT = 10 * 60
+
+
+def _count(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        # First use, or evicted: start counting again.
+        cache.add(key, 0, None)
+        cache.incr(key)
+
+
+def response_cache_stats():
+    """
+    Return the response cache `hits`, `misses` and `hit_ratio` so far.
+    """
+    counts = cache.get_many([HITS_KEY, MISSES_KEY])
+    hits, misses = counts.get(HITS_KEY, 0), counts.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / total, 4) if total else None,
+    }
+
+
+def reset_response_cache_stats():
+    cache.delete_many([HITS_KEY, MISSES_KEY])
+
+
+class CachedResponseMixin:
+    """
+    Cache the serialized data of `list()` and `retrieve()` per user.
+
+    Keys carry the user's cache generation, which every entry or tag write
+    bumps (see `caching.py`), so a changed user never gets stale data and old
+    keys simply age out of the LRU. The query string and host are part of the
+    key, which covers filters, pagination cursors and absolute page links.
+    A `LEARNINGTRACKER_RESPONSE_CACHE_TIMEOUT` of 0 turns the cache off.
+    """
+
+    def _response_cache_key(self, request, **kwargs):
+        parts = [
+            self.basename,
+            self.action,
+            str(kwargs.get(self.lookup_url_kwarg or self.lookup_field, "")),
+            request.get_host(),
+            "&".join(sorted(request.META.get("QUERY_STRING", "").split("&"))),
+        ]
+        digest = hashlib.sha1("|".join(parts).encode()).hexdigest()
+        return RESPONSE_CACHE_KEY.format(
+            user_id=request.user.pk,
+            generation=user_generation(request.user.pk),
+            digest=digest,
+        )
+
+    def _cached_response(self, handler, request, *args, **kwargs):
+        timeout = getattr(
+            settings, "LEARNINGTRACKER_RESPONSE_CACHE_TIMEOUT", DEFAULT_TIMEOUT
+        )
+        if not timeout:
+            return handler(request, *args, **kwargs)
+
+        key = self._response_cache_key(request, **kwargs)
+        data = cache.get(key)
+        if data is not None:
+            _count(HITS_KEY)
+            response = Response(data)
+            response["X-Cache"] = "HIT"
+            return response
+
+        _count(MISSES_KEY)
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, timeout)
+        response["X-Cache"] = "MISS"
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(super().retrieve, request, *args, **kwargs)
@@ -0,0 +1,150 @@
+from datetime import date
+from functools import reduce
+from operator import or_
+
+from django.db.models import Count, Q
+from django.db.models.functions import TruncMonth
+from django.dispatch import receiver
+
+from .models import DailyLearning, MonthlyRollup, Tag, TagRollup
+from .signals import entries_changed
+
+
+def month_start(value):
+    return value.replace(day=1)
+
+
+def next_month(value):
+    if value.month == 12:
+        return date(value.year + 1, 1, 1)
+    return date(value.year, value.month + 1, 1)
+
+
+def refresh_month_rollups(user_id, months):
+    """
+    Recount the `MonthlyRollup` rows of `user_id` for `months` from raw entries.
+
+    Each month is a `(user, date)` index range of at most 31 rows, and all months
+    are handled together: one grouped SELECT, one upsert and one DELETE of rows
+    whose topic no longer occurs.
+    """
+    months = {month_start(month) for month in months}
+    if not months:
+        return
+
+    in_months = reduce(
+        or_,
+        (Q(date__gte=month, date__lt=next_month(month)) for month in months),
+    )
+    counts = (
+        DailyLearning.objects.filter(in_months, user_id=user_id)
+        .annotate(month=TruncMonth("date"))
+        .values_list("month", "learning_type")
+        .annotate(entry_count=Count("id"))
+        .order_by()
+    )
+    rows = MonthlyRollup.objects.bulk_create(
+        [
+            MonthlyRollup(
+                user_id=user_id,
+                month=month,
+                learning_type=learning_type,
+                entry_count=entry_count,
+            )
+            for month, learning_type, entry_count in counts
+        ],
+        update_conflicts=True,
+        unique_fields=["user", "month", "learning_type"],
+        update_fields=["entry_count"],
+    )
+    MonthlyRollup.objects.filter(user_id=user_id, month__in=months).exclude(
+        pk__in=[row.pk for row in rows]
+    ).delete()
+
+
+def refresh_tag_rollups(user_id, tag_ids):
+    """
+    Recount the `TagRollup` rows for `tag_ids` with one grouped query over the
+    `(tag_id, dailylearning_id)` through-table index and one upsert.
+    """
+    if not tag_ids:
+        return
+    counts = (
+        Tag.objects.filter(user_id=user_id, pk__in=tag_ids)
+        .annotate(entry_count=Count("daily_learnings"))
+        .values_list("pk", "entry_count")
+    )
+    TagRollup.objects.bulk_create(
+        [
+            TagRollup(user_id=user_id, tag_id=tag_id, entry_count=entry_count)
+            for tag_id, entry_count in counts
+        ],
+        update_conflicts=True,
+        unique_fields=["tag"],
+        update_fields=["entry_count"],
+    )
+
+
+def rebuild_rollups(user_id):
+    """
+    Recompute every rollup of `user_id` from scratch.
+    """
+    months = (
+        DailyLearning.objects.filter(user_id=user_id)
+        .annotate(month=TruncMonth("date"))
+        .values_list("month", flat=True)
+        .distinct()
+        .order_by()
+    )
+    MonthlyRollup.objects.filter(user_id=user_id).delete()
+    refresh_month_rollups(user_id, set(months))
+    refresh_tag_rollups(
+        user_id, set(Tag.objects.filter(user_id=user_id).values_list("pk", flat=True))
+    )
+
+
+@receiver(entries_changed)
+def _update_rollups(sender, user_id, dates, tag_ids, **kwargs):
+    refresh_month_rollups(user_id, dates)
+    refresh_tag_rollups(user_id, tag_ids)
+
+
+def user_stats(user, year=None):
+    """
+    Summarise the entries of `user` from the rollup tables only.
+    """
+    monthly = MonthlyRollup.objects.filter(user=user)
+    tags = TagRollup.objects.filter(user=user, entry_count__gt=0)
+    if year is not None:
+        monthly = monthly.filter(
+            month__gte=date(year, 1, 1), month__lt=date(year + 1, 1, 1)
+        )
+
+    by_month = {}
+    by_topic = {}
+    for month, learning_type, entry_count in monthly.values_list(
+        "month", "learning_type", "entry_count"
+    ):
+        key = month.strftime("%Y-%m")
+        by_month[key] = by_month.get(key, 0) + entry_count
+        by_topic[learning_type] = by_topic.get(learning_type, 0) + entry_count
+
+    return {
+        "total_entries": sum(by_month.values()),
+        "by_month": [
+            {"month": month, "count": count}
+            for month, count in sorted(by_month.items())
+        ],
+        "by_topic": [
+            {"learning_type": learning_type, "count": count}
+            for learning_type, count in sorted(
+                by_topic.items(), key=lambda item: (-item[1], item[0])
+            )
+        ],
+        "by_tag": [
+            {"id": tag_id, "name": name, "count": entry_count}
+            for tag_id, name, entry_count in tags.order_by(
+                "-entry_count", "tag__name"
+            ).values_list("tag_id", "tag__name", "entry_count")
+        ],
+    }
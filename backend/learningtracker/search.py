@@ -0,0 +1,90 @@
+import re
+
+from django.db import connections
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = "learningtracker_dailylearning_fts"
+ENTRY_TABLE = "learningtracker_dailylearning"
+PG_INDEX_NAME = "learningtra_desc_search_gin"
+PG_SEARCH_CONFIG = "english"
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _fts5_query(text):
+    """
+    Turn free text into a safe FTS5 query: every word must match, and the last
+    one also matches as a prefix so results follow the user while typing.
+    """
+    words = _WORD_RE.findall(text)
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def _search_sqlite(queryset, text):
+    match = _fts5_query(text)
+    if match is None:
+        return queryset.none()
+    return (
+        queryset.filter(
+            id__in=RawSQL(
+                f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", (match,)
+            )
+        )
+        .annotate(
+            search_rank=RawSQL(
+                f"SELECT -rank FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s "
+                f"AND rowid = {ENTRY_TABLE}.id",
+                (match,),
+            )
+        )
+        .order_by("-search_rank", "date")
+    )
+
+
+def _search_postgres(queryset, text):
+    from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+
+    # Must match the expression of the GIN index created in migration 0002.
+    vector = SearchVector("description", config=PG_SEARCH_CONFIG)
+    query = SearchQuery(text, config=PG_SEARCH_CONFIG, search_type="websearch")
+    return (
+        queryset.annotate(search_vector=vector, search_rank=SearchRank(vector, query))
+        .filter(search_vector=query)
+        .order_by("-search_rank", "date")
+    )
+
+
+def search_entries(queryset, text):
+    """
+    Full-text search `queryset` of `DailyLearning` by description, best first.
+
+    SQLite uses the FTS5 table kept in sync by triggers, Postgres the GIN-indexed
+    tsvector. Other databases fall back to a case-insensitive substring match.
+    """
+    vendor = connections[queryset.db].vendor
+    if vendor == "sqlite":
+        return _search_sqlite(queryset, text)
+    if vendor == "postgresql":
+        return _search_postgres(queryset, text)
+    return queryset.filter(description__icontains=text)
+
+
+def rebuild_search_index(using="default"):
+    """
+    Rebuild the full-text index from the `DailyLearning` table.
+
+    Returns False when the database has no full-text index to rebuild.
+    """
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+            return True
+        if connection.vendor == "postgresql":
+            cursor.execute(f"REINDEX INDEX {connection.ops.quote_name(PG_INDEX_NAME)}")
+            return True
+    return False
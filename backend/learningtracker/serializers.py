@@ -1,9 +1,32 @@
-from datetime import date
+import calendar
+from datetime import date, datetime
 
+from django.db import transaction
 from rest_framework import serializers
 
-from .models import DailyLearning, Tag
-from .utils.error_const import DAILY_LEARNING_ERRORS
+from .batch import MAX_BATCH_REQUESTS
+from .models import ApiToken, DailyLearning, Tag
+from .signals import batch_changes, mark_changed
+from .tagging import sync_entry_tags
+from .utils.error_const import (
+    BULK_ERRORS,
+    CALENDAR_ERRORS,
+    DAILY_LEARNING_ERRORS,
+    PROGRESS_ERRORS,
+)
+
+MAX_BULK_ITEMS = 500
+# Year bounds for per-year reads; the next year must still be a valid date.
+MIN_YEAR = 1
+MAX_YEAR = 9998
+MAX_CALENDAR_DAYS = 366
+MAX_PROGRESS_YEARS = 10
+MAX_PROGRESS_USERS = 1000
+MAX_ANALYTICS_WINDOW = 365
+MAX_ANALYTICS_SPAN = 3660
+MAX_DASHBOARD_WEEKS = 104
+MAX_LEADERBOARD_SIZE = 100
+MAX_TOKEN_LIFETIME_DAYS = 365
 
 
 class TagSerializer(serializers.ModelSerializer):
@@ -13,6 +36,26 @@ class TagSerializer(serializers.ModelSerializer):
         read_only_fields = ["id"]
 
 
+class TagAutocompleteSerializer(serializers.ModelSerializer):
+    usage_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Tag
+        fields = ["id", "name", "usage_count"]
+        read_only_fields = fields
+
+
+class ApiTokenSerializer(serializers.ModelSerializer):
+    lifetime_days = serializers.IntegerField(
+        min_value=1, max_value=MAX_TOKEN_LIFETIME_DAYS, required=False, write_only=True
+    )
+
+    class Meta:
+        model = ApiToken
+        fields = ["id", "name", "prefix", "created_at", "expires_at", "lifetime_days"]
+        read_only_fields = ["id", "prefix", "created_at", "expires_at"]
+
+
 class DailyLearningSerializer(serializers.ModelSerializer):
     tags = TagSerializer(many=True, required=False)  # Add tags as a nested serializer
 
@@ -43,30 +86,197 @@ class DailyLearningSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         tags_data = validated_data.pop("tags", [])
-        daily_learning = DailyLearning.objects.create(**validated_data)
 
-        # Add tags to the DailyLearning instance
-        for tag_data in tags_data:
-            tag, created = Tag.objects.get_or_create(
-                user=daily_learning.user, **tag_data
+        with transaction.atomic(), batch_changes():
+            daily_learning = DailyLearning.objects.create(**validated_data)
+
+            # Link tags to the DailyLearning instance in bulk
+            sync_entry_tags(
+                daily_learning, [tag["name"] for tag in tags_data], created=True
             )
-            daily_learning.tags.add(tag)
 
         return daily_learning
 
     def update(self, instance, validated_data):
         tags_data = validated_data.pop("tags", None)
 
-        # Update fields of DailyLearning
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
+        with transaction.atomic(), batch_changes():
+            # Update fields of DailyLearning
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
+            instance.save()
 
-        # Handle tags if provided
-        if tags_data is not None:
-            instance.tags.clear()  # Clear existing tags
-            for tag_data in tags_data:
-                tag, created = Tag.objects.get_or_create(user=instance.user, **tag_data)
-                instance.tags.add(tag)
+            # Handle tags if provided, writing only the links that changed
+            if tags_data is not None:
+                sync_entry_tags(instance, [tag["name"] for tag in tags_data])
 
         return instance
+
+    def upsert(self, user):
+        """
+        Save the validated data as the entry of `user` for its date, whether or
+        not one already exists.
+
+        An omitted `learning_type` is reset to its default on update just as it
+        is defaulted on insert; omitted `tags` are left unchanged.
+        """
+        validated_data = dict(self.validated_data)
+        tags_data = validated_data.pop("tags", None)
+        entry_date = validated_data.pop("date")
+        validated_data.setdefault(
+            "learning_type", DailyLearning._meta.get_field("learning_type").default
+        )
+
+        with transaction.atomic(), batch_changes():
+            self.instance = DailyLearning.upsert_for_date(
+                user, entry_date, **validated_data
+            )
+            mark_changed(user.pk, dates={entry_date})
+
+            # Handle tags if provided, writing only the links that changed
+            if tags_data is not None:
+                sync_entry_tags(self.instance, [tag["name"] for tag in tags_data])
+
+        return self.instance
+
+
+class DailyLearningSummarySerializer(serializers.ModelSerializer):
+    """
+    Entry without its description, for calendar grids.
+    """
+
+    tags = TagSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = DailyLearning
+        fields = ["id", "date", "learning_type", "tags"]
+        read_only_fields = fields
+
+
+class CalendarQuerySerializer(serializers.Serializer):
+    month = serializers.CharField(required=False)
+    from_date = serializers.DateField(required=False)
+    to_date = serializers.DateField(required=False)
+    summary = serializers.BooleanField(required=False, default=False)
+
+    def validate_month(self, value):
+        try:
+            return datetime.strptime(value, "%Y-%m").date()
+        except ValueError:
+            raise serializers.ValidationError(CALENDAR_ERRORS["invalid_month"])
+
+    def validate(self, attrs):
+        if "month" in attrs:
+            start = attrs["month"]
+            end = start.replace(day=calendar.monthrange(start.year, start.month)[1])
+        elif "from_date" in attrs and "to_date" in attrs:
+            start, end = attrs["from_date"], attrs["to_date"]
+        else:
+            raise serializers.ValidationError(CALENDAR_ERRORS["missing_range"])
+
+        if end < start:
+            raise serializers.ValidationError(CALENDAR_ERRORS["inverted_range"])
+        if (end - start).days + 1 > MAX_CALENDAR_DAYS:
+            raise serializers.ValidationError(
+                CALENDAR_ERRORS["range_too_long"].format(max_days=MAX_CALENDAR_DAYS)
+            )
+        attrs["start"], attrs["end"] = start, end
+        return attrs
+
+
+class IntegerListField(serializers.CharField):
+    """
+    Comma-separated integers from a query string, e.g. `2023,2024`.
+    """
+
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        try:
+            return sorted({int(item) for item in value.split(",") if item.strip()})
+        except ValueError:
+            raise serializers.ValidationError(PROGRESS_ERRORS["invalid_list"])
+
+
+class StatsQuerySerializer(serializers.Serializer):
+    year = serializers.IntegerField(
+        required=False, min_value=MIN_YEAR, max_value=MAX_YEAR
+    )
+
+
+class ProgressQuerySerializer(serializers.Serializer):
+    years = IntegerListField(required=False)
+    users = IntegerListField(required=False)
+
+    def validate_years(self, value):
+        if any(year < 1 or year > date.today().year for year in value):
+            raise serializers.ValidationError(PROGRESS_ERRORS["invalid_year"])
+        if len(value) > MAX_PROGRESS_YEARS:
+            raise serializers.ValidationError(
+                PROGRESS_ERRORS["too_many_years"].format(max_years=MAX_PROGRESS_YEARS)
+            )
+        return value
+
+    def validate_users(self, value):
+        if len(value) > MAX_PROGRESS_USERS:
+            raise serializers.ValidationError(
+                PROGRESS_ERRORS["too_many_users"].format(max_users=MAX_PROGRESS_USERS)
+            )
+        return value
+
+
+class AnalyticsQuerySerializer(serializers.Serializer):
+    window = serializers.IntegerField(
+        required=False, default=30, min_value=1, max_value=MAX_ANALYTICS_WINDOW
+    )
+    span = serializers.IntegerField(
+        required=False, default=365, min_value=1, max_value=MAX_ANALYTICS_SPAN
+    )
+
+
+class DashboardQuerySerializer(serializers.Serializer):
+    weeks = serializers.IntegerField(
+        required=False, default=12, min_value=1, max_value=MAX_DASHBOARD_WEEKS
+    )
+    limit = serializers.IntegerField(
+        required=False, default=10, min_value=1, max_value=MAX_LEADERBOARD_SIZE
+    )
+
+
+class BatchSerializer(serializers.Serializer):
+    requests = serializers.ListField(
+        child=serializers.CharField(), min_length=1, max_length=MAX_BATCH_REQUESTS
+    )
+    concurrent = serializers.BooleanField(required=False, default=False)
+
+
+class DailyLearningBulkSerializer(serializers.Serializer):
+    """
+    Shape of a batch request. Items are validated one by one in `bulk.apply_bulk`
+    so that a bad item is reported on its own instead of failing the batch.
+    """
+
+    create = serializers.ListField(
+        child=serializers.DictField(), required=False, default=list
+    )
+    update = serializers.ListField(
+        child=serializers.DictField(), required=False, default=list
+    )
+    delete = serializers.ListField(
+        child=serializers.IntegerField(), required=False, default=list
+    )
+
+    def validate_update(self, value):
+        for item in value:
+            try:
+                item["id"] = int(item["id"])
+            except (KeyError, TypeError, ValueError):
+                raise serializers.ValidationError(BULK_ERRORS["missing_id"])
+        return value
+
+    def validate(self, attrs):
+        total = sum(len(attrs[key]) for key in ("create", "update", "delete"))
+        if total > MAX_BULK_ITEMS:
+            raise serializers.ValidationError(
+                BULK_ERRORS["too_many_items"].format(max_items=MAX_BULK_ITEMS)
+            )
+        return attrs
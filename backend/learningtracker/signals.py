@@ -0,0 +1,162 @@
+import contextvars
+from contextlib import contextmanager
+
+from django.db import models
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import Signal, receiver
+
+from .models import DailyLearning
+
+# Sent once per write operation with the user whose entries changed, the
+# affected entry dates (old and new), the tags whose entry set changed and the
+# ids of deleted entries. Receivers run inside the writer's transaction.
+entries_changed = Signal()
+
+_pending = contextvars.ContextVar("learningtracker_pending_changes", default=None)
+_date_field = models.DateField()
+
+
+def _as_date(value):
+    return _date_field.to_python(value)
+
+
+def mark_changed(user_id, dates=(), tag_ids=(), entry_ids=(), deleted_ids=()):
+    """
+    Record that entries of `user_id` changed.
+
+    Outside `batch_changes()` this sends `entries_changed` right away. Inside it,
+    changes are merged and sent once when the batch ends. `entry_ids` names
+    entries whose tags were already included, so per-entry delete handlers can
+    skip looking them up. `deleted_ids` names entries that no longer exist.
+    """
+    dates = {_as_date(value) for value in dates if value is not None}
+    pending = _pending.get()
+    if pending is not None:
+        batch = pending.setdefault(
+            user_id,
+            {
+                "dates": set(),
+                "tag_ids": set(),
+                "entry_ids": set(),
+                "deleted_ids": set(),
+            },
+        )
+        batch["dates"].update(dates)
+        batch["tag_ids"].update(tag_ids)
+        batch["entry_ids"].update(entry_ids)
+        batch["deleted_ids"].update(deleted_ids)
+        return
+    entries_changed.send(
+        sender=DailyLearning,
+        user_id=user_id,
+        dates=dates,
+        tag_ids=set(tag_ids),
+        deleted_ids=set(deleted_ids),
+    )
+
+
+@contextmanager
+def batch_changes():
+    """
+    Collect `mark_changed()` calls and send one `entries_changed` per user on exit.
+
+    Use it inside the transaction of a multi-row write so derived data is updated
+    once, still before the transaction commits. Nested batches join the outer one.
+    """
+    if _pending.get() is not None:
+        yield
+        return
+
+    token = _pending.set({})
+    try:
+        yield
+        pending = _pending.get()
+    finally:
+        _pending.reset(token)
+
+    for user_id, batch in pending.items():
+        entries_changed.send(
+            sender=DailyLearning,
+            user_id=user_id,
+            dates=batch["dates"],
+            tag_ids=batch["tag_ids"],
+            deleted_ids=batch["deleted_ids"],
+        )
+
+
+def _already_marked(entry):
+    pending = _pending.get()
+    if pending is None or entry.user_id not in pending:
+        return False
+    return entry.pk in pending[entry.user_id]["entry_ids"]
+
+
+def _is_entry_deletion(origin):
+    """
+    Only track deletes that start from entries, not cascades from a user delete.
+    """
+    if isinstance(origin, models.QuerySet):
+        return origin.model is DailyLearning
+    return isinstance(origin, DailyLearning)
+
+
+@receiver(post_save, sender=DailyLearning)
+def _entry_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    loaded = getattr(instance, "_loaded_values", {})
+    mark_changed(instance.user_id, dates={instance.date, loaded.get("date")})
+    instance._loaded_values = {
+        "date": _as_date(instance.date),
+        "learning_type": instance.learning_type,
+    }
+
+
+@receiver(pre_delete, sender=DailyLearning)
+def _entry_deleting(sender, instance, origin=None, **kwargs):
+    if not _is_entry_deletion(origin) or _already_marked(instance):
+        return
+    cache = getattr(instance, "_prefetched_objects_cache", {})
+    if "tags" in cache:
+        instance._deleted_tag_ids = {tag.pk for tag in cache["tags"]}
+    else:
+        instance._deleted_tag_ids = set(instance.tags.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=DailyLearning)
+def _entry_deleted(sender, instance, origin=None, **kwargs):
+    if not _is_entry_deletion(origin):
+        return
+    loaded = getattr(instance, "_loaded_values", {})
+    mark_changed(
+        instance.user_id,
+        dates={instance.date, loaded.get("date")},
+        tag_ids=getattr(instance, "_deleted_tag_ids", ()),
+        deleted_ids={instance.pk},
+    )
+
+
+@receiver(m2m_changed, sender=DailyLearning.tags.through)
+def _entry_tags_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear":
+        if reverse:
+            instance._cleared_entry_ids = set(
+                instance.daily_learnings.values_list("pk", flat=True)
+            )
+        else:
+            instance._cleared_tag_ids = set(instance.tags.values_list("pk", flat=True))
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if reverse:
+        # `instance` is a Tag; its entry set changed.
+        if action == "post_clear":
+            pk_set = getattr(instance, "_cleared_entry_ids", set())
+        if pk_set:
+            mark_changed(instance.user_id, tag_ids={instance.pk})
+    else:
+        if action == "post_clear":
+            pk_set = getattr(instance, "_cleared_tag_ids", set())
+        if pk_set:
+            mark_changed(instance.user_id, tag_ids=pk_set)
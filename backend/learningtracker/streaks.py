@@ -0,0 +1,156 @@
+from datetime import timedelta
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+from django.dispatch import receiver
+
+from .models import DailyLearning, LearningRun, LearningStreak
+from .signals import entries_changed
+
+ONE_DAY = timedelta(days=1)
+
+
+def runs_from_dates(dates):
+    """
+    Split sorted, distinct `dates` into maximal `(start, end)` runs of
+    consecutive days.
+    """
+    runs = []
+    for day in dates:
+        if runs and day - runs[-1][1] == ONE_DAY:
+            runs[-1][1] = day
+        else:
+            runs.append([day, day])
+    return [(start, end) for start, end in runs]
+
+
+def _make_runs(user_id, spans):
+    return [
+        LearningRun(
+            user_id=user_id, start=start, end=end, length=(end - start).days + 1
+        )
+        for start, end in spans
+    ]
+
+
+def _clusters(dates, runs):
+    """
+    Group the touched `dates` with the stored runs they touch into disjoint
+    `[low, high]` day ranges. Each range contains every run that a change on
+    those dates can merge, split, grow or shrink, and no other run.
+    """
+    spans = []
+    for day in dates:
+        low, high = day, day
+        for run in runs:
+            if run.start <= day + ONE_DAY and run.end >= day - ONE_DAY:
+                low, high = min(low, run.start), max(high, run.end)
+        spans.append([low, high])
+
+    spans.sort()
+    merged = []
+    for low, high in spans:
+        if merged and low <= merged[-1][1] + ONE_DAY:
+            merged[-1][1] = max(merged[-1][1], high)
+        else:
+            merged.append([low, high])
+    return merged
+
+
+def refresh_summary(user_id):
+    """
+    Store the latest and the longest run of `user_id` on its `LearningStreak`.
+    """
+    runs = LearningRun.objects.filter(user_id=user_id)
+    latest = runs.order_by("-end").first()
+    longest = runs.order_by("-length", "-end").first()
+    fields = {
+        "latest_start": latest.start if latest else None,
+        "latest_end": latest.end if latest else None,
+        "latest_length": latest.length if latest else 0,
+        "longest_start": longest.start if longest else None,
+        "longest_end": longest.end if longest else None,
+        "longest_length": longest.length if longest else 0,
+    }
+    LearningStreak.objects.bulk_create(
+        [LearningStreak(user_id=user_id, **fields)],
+        update_conflicts=True,
+        unique_fields=["user"],
+        update_fields=list(fields),
+    )
+
+
+def refresh_streaks(user_id, dates):
+    """
+    Rebuild the runs of `user_id` around `dates` and refresh its streak summary.
+
+    Only the runs touching a changed day are reread, so the cost depends on the
+    length of those runs, not on the user's history. Adding, back-filling and
+    deleting days anywhere, including in the middle of a run, are all handled
+    the same way: the affected ranges are recomputed from the stored entries.
+    """
+    dates = sorted(set(dates))
+    if not dates:
+        return
+
+    touching = reduce(
+        or_,
+        (Q(start__lte=day + ONE_DAY, end__gte=day - ONE_DAY) for day in dates),
+    )
+    old_runs = list(LearningRun.objects.filter(touching, user_id=user_id))
+    clusters = _clusters(dates, old_runs)
+
+    in_clusters = reduce(
+        or_, (Q(date__gte=low, date__lte=high) for low, high in clusters)
+    )
+    entry_dates = (
+        DailyLearning.objects.filter(in_clusters, user_id=user_id)
+        .order_by("date")
+        .values_list("date", flat=True)
+    )
+
+    if old_runs:
+        LearningRun.objects.filter(pk__in=[run.pk for run in old_runs]).delete()
+    new_runs = _make_runs(user_id, runs_from_dates(list(entry_dates)))
+    if new_runs:
+        LearningRun.objects.bulk_create(new_runs)
+    refresh_summary(user_id)
+
+
+def rebuild_streaks(user_id):
+    """
+    Recompute every run of `user_id` from all of its entries.
+    """
+    entry_dates = (
+        DailyLearning.objects.filter(user_id=user_id)
+        .order_by("date")
+        .values_list("date", flat=True)
+    )
+    LearningRun.objects.filter(user_id=user_id).delete()
+    LearningRun.objects.bulk_create(
+        _make_runs(user_id, runs_from_dates(list(entry_dates)))
+    )
+    refresh_summary(user_id)
+
+
+def user_streak(user, today=None):
+    """
+    Return the streak summary of `user` with a single primary-key lookup.
+    """
+    streak = LearningStreak.objects.filter(user=user).first() or LearningStreak(
+        user=user
+    )
+    return {
+        "current_streak": streak.current_length(today),
+        "current_start": streak.latest_start if streak.current_length(today) else None,
+        "longest_streak": streak.longest_length,
+        "longest_start": streak.longest_start,
+        "longest_end": streak.longest_end,
+        "last_entry_date": streak.latest_end,
+    }
+
+
+@receiver(entries_changed)
+def _update_streaks(sender, user_id, dates, **kwargs):
+    refresh_streaks(user_id, dates)
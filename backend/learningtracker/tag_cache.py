@@ -0,0 +1,69 @@
+from functools import cache
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .caching import bump_user_tag_generation, user_tag_generation
+from .lru import ExpiringLRUCache
+from .models import Tag
+
+DEFAULT_SIZE = 1000
+DEFAULT_TIMEOUT = 5 * 60
+
+
+@cache
+def get_tag_cache():
+    """
+    Return the process-wide LRU of `user_id -> (tag generation, {name: id})`,
+    sized by `LEARNINGTRACKER_TAG_CACHE_SIZE` and expired after
+    `LEARNINGTRACKER_TAG_CACHE_TIMEOUT` seconds.
+    """
+    return ExpiringLRUCache(
+        size=getattr(settings, "LEARNINGTRACKER_TAG_CACHE_SIZE", DEFAULT_SIZE),
+        timeout=getattr(settings, "LEARNINGTRACKER_TAG_CACHE_TIMEOUT", DEFAULT_TIMEOUT),
+    )
+
+
+def user_tag_ids(user_id):
+    """
+    Return `{name: tag_id}` for every tag of `user_id`.
+
+    The map is cached with the user's tag generation from the default cache
+    (see `caching.py`) and only used while that is current, so a tag change
+    made by another process is seen as soon as the cache is shared. A warm
+    cache answers without a query; a cold one loads the whole vocabulary with
+    a single query. Callers must not modify the returned dict.
+    """
+    tag_cache = get_tag_cache()
+    # Read the generation before the tags, so a change racing the load leaves
+    # the map under an outdated generation.
+    generation = user_tag_generation(user_id)
+    cached = tag_cache.get(user_id)
+    if cached is not None and cached[0] == generation:
+        return cached[1]
+    tag_ids = dict(Tag.objects.filter(user_id=user_id).values_list("name", "pk"))
+    tag_cache.set(user_id, (generation, tag_ids))
+    return tag_ids
+
+
+def invalidate_user_tags(user_id):
+    # Bump now and again after commit, so a read racing the transaction cannot
+    # cache ids that are rolled back or not yet visible.
+    def invalidate():
+        bump_user_tag_generation(user_id)
+        get_tag_cache().invalidate(user_id)
+
+    invalidate()
+    transaction.on_commit(invalidate)
+
+
+@receiver(post_save, sender=Tag)
+def _tag_saved(sender, instance, **kwargs):
+    invalidate_user_tags(instance.user_id)
+
+
+@receiver(post_delete, sender=Tag)
+def _tag_deleted(sender, instance, **kwargs):
+    invalidate_user_tags(instance.user_id)
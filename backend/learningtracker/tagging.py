@@ -0,0 +1,167 @@
+from functools import reduce
+from operator import or_
+
+from django.db import router, transaction
+from django.db.models import Q
+from django.db.models.signals import m2m_changed
+
+from .models import DailyLearning, Tag
+from .tag_cache import invalidate_user_tags, user_tag_ids
+
+EntryTag = DailyLearning.tags.through
+
+
+def _unique_names(names):
+    """Drop duplicate tag names while keeping the caller's order."""
+    return list(dict.fromkeys(names))
+
+
+def resolve_tags(user, names):
+    """
+    Map tag names to `Tag` rows for `user`, creating any that are missing.
+
+    Existing tags come from the user's cached vocabulary (see `tag_cache.py`),
+    so a warm cache costs no query; only when some are missing is there one
+    INSERT for all of them. The insert is an upsert on `(user, name)`, so a
+    concurrent request creating the same tag cannot make it fail.
+    """
+    names = _unique_names(names)
+    if not names:
+        return {}
+
+    known = user_tag_ids(user.pk)
+    tags = {
+        name: Tag(pk=known[name], user=user, name=name)
+        for name in names
+        if name in known
+    }
+    missing = [Tag(user=user, name=name) for name in names if name not in tags]
+    if missing:
+        created = Tag.objects.bulk_create(
+            missing,
+            update_conflicts=True,
+            unique_fields=["user", "name"],
+            update_fields=["name"],
+        )
+        tags.update({tag.name: tag for tag in created})
+        # `bulk_create()` sends no `post_save`.
+        invalidate_user_tags(user.pk)
+    return tags
+
+
+def _send_m2m_changed(entry, action, pk_set, using):
+    m2m_changed.send(
+        sender=EntryTag,
+        instance=entry,
+        action=action,
+        reverse=False,
+        model=Tag,
+        pk_set=pk_set,
+        using=using,
+    )
+
+
+def _current_tag_ids(entries, using):
+    """
+    Return `{entry_pk: {tag_pk, ...}}` for entries whose links are not known yet.
+
+    Links of prefetched entries come from the prefetch cache; everything else is
+    read with a single query over the through table.
+    """
+    current = {}
+    unknown = []
+    for entry, created in entries:
+        cache = getattr(entry, "_prefetched_objects_cache", {})
+        if created:
+            current[entry.pk] = set()
+        elif "tags" in cache:
+            current[entry.pk] = {tag.pk for tag in cache["tags"]}
+        else:
+            current[entry.pk] = set()
+            unknown.append(entry.pk)
+
+    if unknown:
+        links = (
+            EntryTag.objects.using(using)
+            .filter(dailylearning_id__in=unknown)
+            .values_list("dailylearning_id", "tag_id")
+        )
+        for entry_pk, tag_pk in links:
+            current[entry_pk].add(tag_pk)
+    return current
+
+
+def sync_entries_tags(user, changes):
+    """
+    Make the tags of several entries owned by `user` match the given names.
+
+    `changes` is an iterable of `(entry, names, created)` tuples. All names are
+    resolved together, current links are read at most once, and only the added
+    and removed through-table rows are written, each with a single statement.
+    `m2m_changed` is still sent per entry so listeners see the same events as
+    `entry.tags.add()`/`remove()` would emit.
+    """
+    changes = list(changes)
+    if not changes:
+        return {}
+
+    using = router.db_for_write(EntryTag)
+    with transaction.atomic(using=using):
+        tags = resolve_tags(
+            user, [name for _entry, names, _created in changes for name in names]
+        )
+        current = _current_tag_ids(
+            [(entry, created) for entry, _names, created in changes], using
+        )
+
+        removed = {}
+        added = {}
+        for entry, names, _created in changes:
+            wanted = {tags[name].pk for name in names}
+            if current[entry.pk] - wanted:
+                removed[entry] = current[entry.pk] - wanted
+            if wanted - current[entry.pk]:
+                added[entry] = wanted - current[entry.pk]
+
+        if removed:
+            for entry, pk_set in removed.items():
+                _send_m2m_changed(entry, "pre_remove", pk_set, using)
+            EntryTag.objects.using(using).filter(
+                reduce(
+                    or_,
+                    (
+                        Q(dailylearning_id=entry.pk, tag_id__in=pk_set)
+                        for entry, pk_set in removed.items()
+                    ),
+                )
+            ).delete()
+            for entry, pk_set in removed.items():
+                _send_m2m_changed(entry, "post_remove", pk_set, using)
+
+        if added:
+            for entry, pk_set in added.items():
+                _send_m2m_changed(entry, "pre_add", pk_set, using)
+            EntryTag.objects.using(using).bulk_create(
+                [
+                    EntryTag(dailylearning_id=entry.pk, tag_id=pk)
+                    for entry, pk_set in added.items()
+                    for pk in pk_set
+                ],
+                ignore_conflicts=True,
+            )
+            for entry, pk_set in added.items():
+                _send_m2m_changed(entry, "post_add", pk_set, using)
+
+    for entry, _names, _created in changes:
+        if hasattr(entry, "_prefetched_objects_cache"):
+            entry._prefetched_objects_cache.pop("tags", None)
+    return tags
+
+
+def sync_entry_tags(entry, names, *, created=False):
+    """
+    Make `entry.tags` match `names` by touching only the rows that changed.
+
+    See `sync_entries_tags`; a freshly `created` entry skips reading its links.
+    """
+    return sync_entries_tags(entry.user, [(entry, names, created)])
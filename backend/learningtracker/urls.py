@@ -6,12 +6,26 @@ from drf_spectacular.views import (
 )
 from rest_framework.routers import DefaultRouter
 
+from .async_views import (
+    AsyncDailyLearningDetailView,
+    AsyncDailyLearningListView,
+    AsyncTagDetailView,
+    AsyncTagListView,
+)
 from .views import (
+    AnalyticsView,
+    ApiTokenViewSet,
+    BatchView,
     DailyLearningViewSet,
+    DashboardView,
     LoginView,
     LogoutView,
+    ProgressView,
+    StatsView,
+    StreakView,
     TagViewSet,
     WelcomeView,
+    event_stream,
     get_csrf_token,
 )
 
@@ -19,6 +33,7 @@ from .views import (
 router = DefaultRouter()
 router.register(r"learned-entries", DailyLearningViewSet, basename="daily-learning")
 router.register(r"tags", TagViewSet, basename="tag")  # Register TagViewSet
+router.register(r"tokens", ApiTokenViewSet, basename="api-token")
 
 # Define your urlpatterns
 urlpatterns = [
@@ -40,6 +55,33 @@ urlpatterns = [
     path("api/login/", LoginView.as_view(), name="login"),
     path("api/logout/", LogoutView.as_view(), name="logout"),
     path("api/csrf/", get_csrf_token, name="get-csrf-token"),
+    # Statistics
+    path("api/stats/", StatsView.as_view(), name="stats"),
+    path("api/streaks/", StreakView.as_view(), name="streaks"),
+    path("api/progress/", ProgressView.as_view(), name="progress"),
+    path("api/analytics/", AnalyticsView.as_view(), name="analytics"),
+    path("api/dashboard/", DashboardView.as_view(), name="dashboard"),
+    # Batched reads
+    path("api/batch/", BatchView.as_view(), name="batch"),
+    # Live updates
+    path("api/events/", event_stream, name="events"),
+    # Async-native entry and tag endpoints, for ASGI deployments
+    path(
+        "api/async/learned-entries/",
+        AsyncDailyLearningListView.as_view(),
+        name="async-learned-entries-list",
+    ),
+    path(
+        "api/async/learned-entries/<int:pk>/",
+        AsyncDailyLearningDetailView.as_view(),
+        name="async-learned-entries-detail",
+    ),
+    path("api/async/tags/", AsyncTagListView.as_view(), name="async-tags-list"),
+    path(
+        "api/async/tags/<int:pk>/",
+        AsyncTagDetailView.as_view(),
+        name="async-tags-detail",
+    ),
     # Registered API Routes
     path("api/", include(router.urls)),  # Prefix all API routes with /api/
 ]
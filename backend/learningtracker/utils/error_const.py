@@ -4,11 +4,13 @@ from typing import TypedDict
 class DailyLearningErrorDefinitions(TypedDict):
     invalid_date: str
     invalid_description: str
+    invalid_body: str
 
 
 DAILY_LEARNING_ERRORS: DailyLearningErrorDefinitions = {
     "invalid_date": "The date cannot be in the future.",
     "invalid_description": "Description must be at least 5 characters.",
+    "invalid_body": "Expected a JSON object with the fields of the entry.",
 }
 
 
@@ -19,3 +21,114 @@ class TagsErrorDefinitions(TypedDict):
 TAG_ERRORS: TagsErrorDefinitions = {
     "duplicate_name": "A tag with this name already exists for this user."
 }
+
+
+class BulkErrorDefinitions(TypedDict):
+    not_found: str
+    duplicate_id: str
+    duplicate_date: str
+    date_moved_in_batch: str
+    missing_id: str
+    too_many_items: str
+    conflict: str
+
+
+BULK_ERRORS: BulkErrorDefinitions = {
+    "not_found": "No learning entry with this id exists for this user.",
+    "duplicate_id": "This entry is updated more than once in the batch.",
+    "duplicate_date": "A learning entry already exists for this date.",
+    "date_moved_in_batch": (
+        "Another entry in this batch moves off this date; move it in a separate batch."
+    ),
+    "missing_id": "Each update must include an integer id.",
+    "too_many_items": "A batch may contain at most {max_items} items.",
+    "conflict": "The batch conflicts with concurrent changes; please retry.",
+}
+
+
+class CalendarErrorDefinitions(TypedDict):
+    missing_range: str
+    invalid_month: str
+    inverted_range: str
+    range_too_long: str
+
+
+CALENDAR_ERRORS: CalendarErrorDefinitions = {
+    "missing_range": "Provide either month or both from_date and to_date.",
+    "invalid_month": "Month has wrong format. Use YYYY-MM.",
+    "inverted_range": "to_date must be on or after from_date.",
+    "range_too_long": "A calendar range may span at most {max_days} days.",
+}
+
+
+class ProgressErrorDefinitions(TypedDict):
+    invalid_list: str
+    invalid_year: str
+    too_many_years: str
+    too_many_users: str
+    staff_only: str
+
+
+PROGRESS_ERRORS: ProgressErrorDefinitions = {
+    "invalid_list": "Enter a comma-separated list of integers.",
+    "invalid_year": "Years must lie between 1 and the current year.",
+    "too_many_years": "At most {max_years} years can be requested at once.",
+    "too_many_users": "At most {max_users} users can be requested at once.",
+    "staff_only": "Only staff members can view the progress of other users.",
+}
+
+
+class ChangesErrorDefinitions(TypedDict):
+    invalid_cursor: str
+    stale_cursor: str
+    invalid_limit: str
+
+
+CHANGES_ERRORS: ChangesErrorDefinitions = {
+    "invalid_cursor": "Invalid cursor.",
+    "stale_cursor": "This cursor is too old; fetch the changes again without one.",
+    "invalid_limit": "Enter an integer between 1 and {max_limit}.",
+}
+
+
+class EventsErrorDefinitions(TypedDict):
+    asgi_required: str
+
+
+EVENTS_ERRORS: EventsErrorDefinitions = {
+    "asgi_required": "Event streams are only available when served over ASGI.",
+}
+
+
+class BatchErrorDefinitions(TypedDict):
+    not_allowed: str
+    async_view: str
+    not_found: str
+    forbidden: str
+    authentication_not_accepted: str
+
+
+BATCH_ERRORS: BatchErrorDefinitions = {
+    "not_allowed": "Only GET requests to /api/ endpoints can be batched.",
+    "async_view": "Async endpoints cannot be batched; call them directly.",
+    "not_found": "Not found.",
+    "forbidden": "You do not have permission to perform this action.",
+    "authentication_not_accepted": (
+        "This endpoint does not accept the authentication used for the batch."
+    ),
+}
+
+
+class TokenErrorDefinitions(TypedDict):
+    invalid_header: str
+    invalid_token: str
+    expired_token: str
+    inactive_user: str
+
+
+TOKEN_ERRORS: TokenErrorDefinitions = {
+    "invalid_header": "Invalid token header. Send 'Token <token>'.",
+    "invalid_token": "Invalid token.",
+    "expired_token": "Token has expired.",
+    "inactive_user": "User inactive or deleted.",
+}
@@ -1,24 +1,79 @@
 import logging
+from datetime import date, timedelta
 
+from django.conf import settings
 from django.contrib.auth import authenticate, login, logout
-from django.http import JsonResponse
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
 from django.middleware.csrf import get_token
+from django.utils.cache import patch_cache_control
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_protect, ensure_csrf_cookie
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.openapi import AutoSchema
-from rest_framework import status
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework import mixins, status
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
-from rest_framework.viewsets import ModelViewSet
+from rest_framework.viewsets import GenericViewSet, ModelViewSet
 
+from .analytics import user_analytics
+from .batch import run_batch
+from .bulk import BulkConflictError, apply_bulk
+from .changes import (
+    CHANGES_PAGE_SIZE,
+    MAX_CHANGES_PAGE_SIZE,
+    InvalidCursorError,
+    StaleCursorError,
+    change_feed,
+)
+from .conditional import ConditionalListMixin
+from .dashboard import organisation_dashboard
+from .events import stream_events
 from .filters import DailyLearningFilter, TagFilter
-from .models import DailyLearning, Tag
-from .serializers import DailyLearningSerializer, TagSerializer
+from .heatmap import user_heatmap
+from .models import ApiToken, DailyLearning, Tag
+from .pagination import DailyLearningCursorPagination, TagCursorPagination
+from .progress import cached_progress
+from .response_cache import CachedResponseMixin
+from .rollups import user_stats
+from .serializers import (
+    MAX_YEAR,
+    MIN_YEAR,
+    AnalyticsQuerySerializer,
+    ApiTokenSerializer,
+    BatchSerializer,
+    CalendarQuerySerializer,
+    DailyLearningBulkSerializer,
+    DailyLearningSerializer,
+    DailyLearningSummarySerializer,
+    DashboardQuerySerializer,
+    ProgressQuerySerializer,
+    StatsQuerySerializer,
+    TagAutocompleteSerializer,
+    TagSerializer,
+)
+from .streaks import user_streak
+from .tag_cache import user_tag_ids
+from .utils.error_const import (
+    BULK_ERRORS,
+    CHANGES_ERRORS,
+    DAILY_LEARNING_ERRORS,
+    EVENTS_ERRORS,
+    PROGRESS_ERRORS,
+    TAG_ERRORS,
+)
 
 logger = logging.getLogger(__name__)
 
+AUTOCOMPLETE_LIMIT = 10
+AUTOCOMPLETE_MAX_LIMIT = 25
+AUTOCOMPLETE_MAX_AGE = 60  # Seconds a browser may reuse a suggestion list.
+
 
 class WelcomeView(APIView):
     permission_classes = [AllowAny]
@@ -32,12 +87,14 @@ class WelcomeView(APIView):
         )
 
 
-class DailyLearningViewSet(ModelViewSet):
+class DailyLearningViewSet(ConditionalListMixin, CachedResponseMixin, ModelViewSet):
+    etag_prefix = "entries"
     queryset = DailyLearning.objects.all()
     serializer_class = DailyLearningSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
     filterset_class = DailyLearningFilter
+    pagination_class = DailyLearningCursorPagination
     schema = AutoSchema()
 
     def get_queryset(self):
@@ -45,9 +102,9 @@ class DailyLearningViewSet(ModelViewSet):
             self.queryset.filter(
                 user=self.request.user
             )  # Fetch entries for the logged-in user only.
-            .select_related(
-                "user"
-            )  # Optimize database queries by joining the "user" table.
+            .prefetch_related(
+                "tags"
+            )  # Load the nested tags for every entry in one extra query.
             .order_by("date")  # Sort results by date.
         )
 
@@ -59,34 +116,300 @@ class DailyLearningViewSet(ModelViewSet):
         logger.info(f"User {self.request.user} updated an entry.")
         serializer.save()
 
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk",
+        serializer_class=DailyLearningBulkSerializer,
+    )
+    def bulk(self, request):
+        """
+        Create, update and delete many entries in a single request.
+        """
+        serializer = DailyLearningBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            results = apply_bulk(
+                request.user,
+                serializer.validated_data,
+                context=self.get_serializer_context(),
+            )
+        except BulkConflictError:
+            logger.warning(f"Bulk write by user {request.user} hit a conflict.")
+            return Response(
+                {"error": BULK_ERRORS["conflict"]}, status=status.HTTP_409_CONFLICT
+            )
+        logger.info(
+            f"User {request.user} ran a bulk write: "
+            f"{len(results['create'])} create, {len(results['update'])} update, "
+            f"{len(results['delete'])} delete."
+        )
+        return Response(results, status=status.HTTP_200_OK)
+
+    @action(
+        detail=False,
+        methods=["put"],
+        url_path=r"by-date/(?P<entry_date>\d{4}-\d{2}-\d{2})",
+    )
+    def by_date(self, request, entry_date=None):
+        """
+        Create or replace the entry for a given day in a single round trip.
+
+        Answers 201 when the entry was created and 200 when it was replaced.
+        """
+        if not isinstance(request.data, dict):
+            return Response(
+                {
+                    api_settings.NON_FIELD_ERRORS_KEY: [
+                        DAILY_LEARNING_ERRORS["invalid_body"]
+                    ]
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        data = request.data.copy()
+        data["date"] = entry_date
+        serializer = self.get_serializer(data=data)
+        serializer.is_valid(raise_exception=True)
+        entry = serializer.upsert(request.user)
+        saved = self.get_queryset().get(pk=entry.pk)
+        # An update keeps the stored `created_at`, so only an insert matches
+        # the timestamp this call assigned.
+        created = saved.created_at == entry.created_at
+        logger.info(f"User {request.user} upserted the entry for {entry_date}.")
+        return Response(
+            self.get_serializer(saved).data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+    @action(detail=False, methods=["get"], url_path="heatmap", pagination_class=None)
+    def heatmap(self, request):
+        """
+        Compact per-day presence and topic encoding of a whole year.
+        """
+        try:
+            year = int(request.query_params.get("year", date.today().year))
+        except ValueError:
+            year = 0
+        if not MIN_YEAR <= year <= MAX_YEAR:
+            return Response(
+                {"year": [f"Enter a year between {MIN_YEAR} and {MAX_YEAR}."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(user_heatmap(request.user.pk, year))
+
+    @action(detail=False, methods=["get"], url_path="changes", pagination_class=None)
+    def changes(self, request):
+        """
+        Entries created or updated, and entries and tags deleted, since `since`.
+
+        Start without `since` and pass the returned `cursor` on the next call;
+        keep calling while `has_more` is true.
+        """
+        try:
+            limit = int(request.query_params.get("limit", CHANGES_PAGE_SIZE))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= MAX_CHANGES_PAGE_SIZE:
+            return Response(
+                {
+                    "limit": [
+                        CHANGES_ERRORS["invalid_limit"].format(
+                            max_limit=MAX_CHANGES_PAGE_SIZE
+                        )
+                    ]
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            feed = change_feed(
+                request.user, request.query_params.get("since") or None, limit
+            )
+        except InvalidCursorError:
+            return Response(
+                {"since": [CHANGES_ERRORS["invalid_cursor"]]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except StaleCursorError:
+            return Response(
+                {"error": CHANGES_ERRORS["stale_cursor"]}, status=status.HTTP_410_GONE
+            )
+        feed["entries"] = self.get_serializer(feed["entries"], many=True).data
+        return Response(feed)
+
+    @action(detail=False, methods=["get"], url_path="calendar", pagination_class=None)
+    def calendar(self, request):
+        """
+        Entries of a month (`month=YYYY-MM`) or a date range, grouped by day.
 
-class TagViewSet(ModelViewSet):
+        Pass `summary=true` to leave out descriptions for calendar grids.
+        """
+        query = CalendarQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        start, end = query.validated_data["start"], query.validated_data["end"]
+
+        entries = self.get_queryset().filter(date__gte=start, date__lte=end)
+        if query.validated_data["summary"]:
+            entries = entries.defer("description")
+            serializer_class = DailyLearningSummarySerializer
+        else:
+            serializer_class = DailyLearningSerializer
+
+        days = {}
+        for entry in serializer_class(entries, many=True).data:
+            days.setdefault(entry["date"], []).append(entry)
+        return Response(
+            {"from_date": start.isoformat(), "to_date": end.isoformat(), "days": days}
+        )
+
+
+def check_tag_name_is_free(user, serializer):
+    """
+    Reject a tag name `user` already has, using the cached tag vocabulary
+    instead of a query.
+    """
+    name = serializer.validated_data.get("name")
+    tag_id = user_tag_ids(user.pk).get(name)
+    if tag_id is not None and tag_id != getattr(serializer.instance, "pk", None):
+        raise ValidationError({"name": [TAG_ERRORS["duplicate_name"]]})
+
+
+class TagViewSet(ConditionalListMixin, CachedResponseMixin, ModelViewSet):
+    etag_prefix = "tags"
+    # Creating or renaming a tag leaves every entry untouched.
+    conditional_last_modified = False
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
     filterset_class = TagFilter
+    pagination_class = TagCursorPagination
     schema = AutoSchema()
 
     def get_queryset(self):
         return (
-            self.queryset.filter(
-                user=self.request.user
-            )  # Fetch entries for the logged-in user only.
-            .select_related(
-                "user"
-            )  # Optimize database queries by joining the "user" table.
-            .order_by("name")  # Sort results by name.
+            # Fetch tags for the logged-in user only.
+            self.queryset.filter(user=self.request.user)
+            # Sort results by name.
+            .order_by("name")
         )
 
     def perform_create(self, serializer):
+        check_tag_name_is_free(self.request.user, serializer)
         logger.info(f"User {self.request.user} is creating a tag.")
         serializer.save(user=self.request.user)
 
     def perform_update(self, serializer):
+        check_tag_name_is_free(self.request.user, serializer)
         logger.info(f"User {self.request.user} updated a tag.")
         serializer.save()
 
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="autocomplete",
+        serializer_class=TagAutocompleteSerializer,
+        pagination_class=None,
+        filter_backends=[],
+    )
+    def autocomplete(self, request):
+        """
+        Suggest the user's tags starting with `prefix`, most used first.
+        """
+        try:
+            limit = int(request.query_params.get("limit", AUTOCOMPLETE_LIMIT))
+        except ValueError:
+            limit = AUTOCOMPLETE_LIMIT
+        limit = max(1, min(limit, AUTOCOMPLETE_MAX_LIMIT))
+
+        tags = Tag.autocomplete(
+            request.user, request.query_params.get("prefix", ""), limit=limit
+        )
+        response = Response(TagAutocompleteSerializer(tags, many=True).data)
+        patch_cache_control(response, private=True, max_age=AUTOCOMPLETE_MAX_AGE)
+        return response
+
+
+class StatsView(APIView):
+    """
+    Learning statistics for the logged-in user, read from the rollup tables.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        query = StatsQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        return Response(user_stats(request.user, year=query.validated_data.get("year")))
+
+
+class ProgressView(APIView):
+    """
+    Entries vs. days per year, per quarter and over rolling 30/90/365 days.
+
+    Staff members may pass `users=` to get the progress of several users.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        query = ProgressQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        today = date.today()
+        years = query.validated_data.get("years") or [today.year]
+        user_ids = query.validated_data.get("users")
+
+        if user_ids is None:
+            progress = cached_progress([request.user.pk], years, today=today)
+            return Response({"today": today, **progress[request.user.pk]})
+
+        if not request.user.is_staff and user_ids != [request.user.pk]:
+            return Response(
+                {"error": PROGRESS_ERRORS["staff_only"]},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        progress = cached_progress(user_ids, years, today=today)
+        return Response({"today": today, "users": progress})
+
+
+class AnalyticsView(APIView):
+    """
+    Rolling averages, topic share per month, weekday distribution and gap
+    histogram of the logged-in user's entries.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        query = AnalyticsQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        return Response(user_analytics(request.user.pk, **query.validated_data))
+
+
+class DashboardView(APIView):
+    """
+    Organisation-wide numbers for staff: active learners per week, topic
+    distribution and the streak leaderboards.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        query = DashboardQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        return Response(organisation_dashboard(**query.validated_data))
+
+
+class StreakView(APIView):
+    """
+    Current and longest learning streak of the logged-in user.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response(user_streak(request.user))
+
 
 @ensure_csrf_cookie
 def get_csrf_token(request):
@@ -99,6 +422,121 @@ def get_csrf_token(request):
     )
 
 
+class BatchView(APIView):
+    """
+    Run several GET requests against the API in one round trip.
+
+    The caller is authenticated once and every sub-request reuses that user;
+    pass `concurrent: true` to run them in parallel.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = BatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        responses, cookies = run_batch(
+            request,
+            serializer.validated_data["requests"],
+            concurrent=serializer.validated_data["concurrent"],
+        )
+        logger.info(f"User {request.user} ran a batch of {len(responses)} requests.")
+        response = Response({"responses": responses})
+        response.cookies.update(cookies)
+        return response
+
+
+async def event_stream(request):
+    """
+    Server-Sent Events stream of the logged-in user's entry and tag changes.
+
+    Served asynchronously under ASGI, so each open stream is a coroutine
+    waiting on its queue instead of a blocked worker thread. Under WSGI the
+    endless stream would tie up a worker for good, so it is refused.
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({"detail": EVENTS_ERRORS["asgi_required"]}, status=501)
+    user = await request.auser()
+    if not user.is_authenticated:
+        return JsonResponse(
+            {"detail": "Authentication credentials were not provided."}, status=403
+        )
+    response = StreamingHttpResponse(
+        stream_events(user.pk), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    # Keep reverse proxies from buffering the stream.
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+class ApiTokenViewSet(
+    mixins.ListModelMixin,
+    mixins.CreateModelMixin,
+    mixins.DestroyModelMixin,
+    GenericViewSet,
+):
+    """
+    Issue, list, rotate and revoke the API tokens of the logged-in user.
+
+    The token itself is only returned by `create` and `rotate`; afterwards it
+    is known by its prefix alone. Tokens are managed from a logged-in session
+    only, so a leaked token cannot renew itself past its expiry.
+    """
+
+    serializer_class = ApiTokenSerializer
+    authentication_classes = [SessionAuthentication]
+    permission_classes = [IsAuthenticated]
+    pagination_class = None
+    schema = AutoSchema()
+
+    def get_queryset(self):
+        return ApiToken.objects.filter(user=self.request.user).order_by("-created_at")
+
+    def token_lifetime(self, serializer):
+        days = serializer.validated_data.get(
+            "lifetime_days", settings.LEARNINGTRACKER_TOKEN_LIFETIME_DAYS
+        )
+        return timedelta(days=days)
+
+    def issued_response(self, token, key):
+        return Response(
+            {**ApiTokenSerializer(token).data, "token": key},
+            status=status.HTTP_201_CREATED,
+        )
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        token, key = ApiToken.issue(
+            request.user,
+            serializer.validated_data["name"],
+            lifetime=self.token_lifetime(serializer),
+        )
+        logger.info(f"User {request.user} issued API token {token.prefix}.")
+        return self.issued_response(token, key)
+
+    @action(detail=True, methods=["post"])
+    def rotate(self, request, pk=None):
+        """
+        Replace a token: the new one is returned and the old one stops working
+        after a short grace period.
+        """
+        old = self.get_object()
+        serializer = self.get_serializer(data={"name": old.name, **request.data})
+        serializer.is_valid(raise_exception=True)
+        grace = settings.LEARNINGTRACKER_TOKEN_ROTATION_GRACE
+        token, key = old.rotate(
+            grace=timedelta(seconds=grace), lifetime=self.token_lifetime(serializer)
+        )
+        logger.info(f"User {request.user} rotated API token {old.prefix}.")
+        return self.issued_response(token, key)
+
+    def perform_destroy(self, instance):
+        logger.info(f"User {self.request.user} revoked API token {instance.prefix}.")
+        instance.delete()
+
+
 class LoginView(APIView):
     @method_decorator(csrf_protect)
     def post(self, request):
@@ -2,7 +2,25 @@ from typing import Any, Callable
 
 import pytest
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from learningtracker.authentication import get_token_cache
 from learningtracker.models import DailyLearning, Tag
+from learningtracker.tag_cache import get_tag_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Start every test with empty caches, since database ids are reused.
+    """
+    local_caches = [get_tag_cache(), get_token_cache()]
+    cache.clear()
+    for local_cache in local_caches:
+        local_cache.clear()
+    yield
+    cache.clear()
+    for local_cache in local_caches:
+        local_cache.clear()
 
 
 @pytest.fixture
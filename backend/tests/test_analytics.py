@@ -0,0 +1,111 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from learningtracker.analytics import (
+    gap_histogram,
+    load_arrays,
+    rolling_average,
+    topic_share,
+    weekday_distribution,
+)
+from learningtracker.models import DailyLearning
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+def _days(*values):
+    return np.array(values, dtype="datetime64[D]")
+
+
+#################################################################
+#                   VALIDATE ARRAY COMPUTATIONS
+#################################################################
+def test_rolling_average():
+    days = _days("2023-01-01", "2023-01-02", "2023-01-04")
+
+    values = rolling_average(days, date(2023, 1, 4), window=2, span=4)
+
+    assert values == [0.5, 1.0, 0.5, 0.5]
+
+
+def test_topic_share_and_weekdays():
+    days = _days("2023-01-02", "2023-01-03", "2023-01-09", "2023-02-01")
+    topics = np.array([0, 1, 1, 0], dtype=np.int8)
+
+    periods, shares = topic_share(days, topics)
+
+    assert periods == ["2023-01", "2023-02"]
+    assert shares[0][:2] == [0.3333, 0.6667]
+    assert shares[1][0] == 1.0
+    # Two Mondays, a Tuesday and a Wednesday
+    assert weekday_distribution(days) == [2, 1, 1, 0, 0, 0, 0]
+
+
+def test_gap_histogram():
+    days = _days("2023-01-01", "2023-01-02", "2023-01-04", "2023-01-10", "2023-03-01")
+
+    counts, longest = gap_histogram(days)
+
+    assert counts == [1, 0, 0, 1, 0, 0, 1]
+    assert longest == 49
+
+
+#################################################################
+#                   VALIDATE LOADING AND CACHING
+#################################################################
+@pytest.mark.django_db
+def test_load_arrays_uses_one_query(create_test_user):
+    user = create_test_user
+    start = date(2014, 1, 1)
+    DailyLearning.objects.bulk_create(
+        DailyLearning(
+            user=user,
+            date=start + timedelta(days=offset),
+            learning_type="Docker" if offset % 2 else "Python",
+            description="Daily learning",
+        )
+        for offset in range(3700)
+    )
+
+    with CaptureQueriesContext(connection) as context:
+        days, topics = load_arrays(user.pk)
+
+    assert len(context.captured_queries) == 1
+    assert len(days) == 3700
+    assert str(days[0]) == "2014-01-01"
+    assert DailyLearning.Topics.choices[topics[1]][0] == "Docker"
+
+
+@pytest.mark.django_db
+def test_analytics_view_is_cached_until_entries_change(create_test_user):
+    user = create_test_user
+    today = date.today()
+    DailyLearning.objects.create(
+        user=user, date=today, learning_type="Python", description="Today"
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    body = client.get("/api/analytics/?window=1&span=2").json()
+    assert body["total_entries"] == 1
+    assert body["rolling_average"]["values"] == [0.0, 1.0]
+
+    with CaptureQueriesContext(connection) as context:
+        client.get("/api/analytics/")
+    assert not any("learningtracker_dailylearning" in q["sql"] for q in context)
+
+    DailyLearning.objects.create(
+        user=user,
+        date=today - timedelta(days=3),
+        learning_type="SQL",
+        description="Earlier",
+    )
+    body = client.get("/api/analytics/").json()
+    assert body["total_entries"] == 2
+    assert body["gaps"]["counts"][1] == 1
+
+    response = client.get("/api/analytics/?window=0")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
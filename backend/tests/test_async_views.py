@@ -0,0 +1,176 @@
+import re
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from learningtracker.models import DailyLearning, Tag
+from learningtracker.utils.error_const import TAG_ERRORS
+
+ENTRIES = "/api/async/learned-entries/"
+TAGS = "/api/async/tags/"
+
+
+def _run(scenario, user):
+    async def run():
+        client = AsyncClient()
+        if user is not None:
+            await client.aforce_login(user)
+        return await scenario(client)
+
+    return async_to_sync(run)()
+
+
+#################################################################
+#                   ASYNC LEARNED ENTRIES
+#################################################################
+@pytest.mark.django_db
+def test_async_entries_crud(create_test_user):
+    async def scenario(client):
+        response = await client.post(
+            ENTRIES,
+            {
+                "date": "2023-01-01",
+                "learning_type": "Python",
+                "description": "Async entry",
+                "tags": [{"name": "asyncio"}],
+            },
+            content_type="application/json",
+        )
+        assert response.status_code == 201
+        entry_id = response.json()["id"]
+        assert response.json()["tags"][0]["name"] == "asyncio"
+
+        listed = (await client.get(ENTRIES)).json()
+        assert [entry["id"] for entry in listed] == [entry_id]
+
+        response = await client.patch(
+            f"{ENTRIES}{entry_id}/",
+            {"description": "Edited async entry"},
+            content_type="application/json",
+        )
+        assert response.json()["description"] == "Edited async entry"
+        detail = (await client.get(f"{ENTRIES}{entry_id}/")).json()
+        assert detail["tags"][0]["name"] == "asyncio"
+
+        assert (await client.delete(f"{ENTRIES}{entry_id}/")).status_code == 204
+        assert (await client.get(f"{ENTRIES}{entry_id}/")).status_code == 404
+
+    _run(scenario, create_test_user)
+    assert not DailyLearning.objects.exists()
+
+
+@pytest.mark.django_db
+def test_async_entries_filter_paginate_and_validate(create_test_user):
+    for day in range(1, 6):
+        DailyLearning.objects.create(
+            user=create_test_user,
+            date=f"2023-01-0{day}",
+            learning_type="Python" if day % 2 else "SQL",
+            description="Async entry",
+        )
+
+    async def scenario(client):
+        filtered = (await client.get(ENTRIES, {"learning_type__in": "SQL"})).json()
+        assert [entry["date"] for entry in filtered] == ["2023-01-02", "2023-01-04"]
+
+        page = (await client.get(ENTRIES, {"page_size": 2})).json()
+        assert [entry["date"] for entry in page["results"]] == [
+            "2023-01-01",
+            "2023-01-02",
+        ]
+        page = (await client.get(page["next"])).json()
+        assert page["results"][0]["date"] == "2023-01-03"
+
+        response = await client.post(
+            ENTRIES,
+            {"date": "2023-02-01", "learning_type": "SQL", "description": "no"},
+            content_type="application/json",
+        )
+        assert response.status_code == 400
+        assert "description" in response.json()
+
+    _run(scenario, create_test_user)
+
+
+@pytest.mark.django_db
+def test_async_views_require_login():
+    async def scenario(client):
+        return (await client.get(ENTRIES)).status_code
+
+    assert _run(scenario, None) == 403
+
+
+#################################################################
+#                   ASYNC TAGS
+#################################################################
+@pytest.mark.django_db
+def test_async_tags_crud(create_tags):
+    user = create_tags[0].user
+
+    async def scenario(client):
+        names = [tag["name"] for tag in (await client.get(TAGS)).json()]
+        assert names == ["Docker", "Python"]
+
+        response = await client.post(
+            TAGS, {"name": "Rust"}, content_type="application/json"
+        )
+        assert response.status_code == 201
+        tag_id = response.json()["id"]
+        response = await client.put(
+            f"{TAGS}{tag_id}/", {"name": "Go"}, content_type="application/json"
+        )
+        assert response.json()["name"] == "Go"
+
+        other_tag = await sync_to_async(Tag.objects.exclude(user=user).first)()
+        assert (await client.get(f"{TAGS}{other_tag.pk}/")).status_code == 404
+        assert (await client.delete(f"{TAGS}{tag_id}/")).status_code == 204
+
+    _run(scenario, user)
+    assert not Tag.objects.filter(name__in=["Rust", "Go"]).exists()
+
+
+@pytest.mark.django_db
+def test_async_tags_reject_duplicate_names(create_tags):
+    user = create_tags[0].user
+
+    async def scenario(client):
+        response = await client.post(
+            TAGS, {"name": "Docker"}, content_type="application/json"
+        )
+        assert response.status_code == 400
+        assert response.json() == {"name": [TAG_ERRORS["duplicate_name"]]}
+
+        python = await Tag.objects.aget(user=user, name="Python")
+        response = await client.put(
+            f"{TAGS}{python.pk}/", {"name": "Docker"}, content_type="application/json"
+        )
+        assert response.status_code == 400
+        response = await client.put(
+            f"{TAGS}{python.pk}/", {"name": "Rust"}, content_type="application/json"
+        )
+        assert response.status_code == 200
+
+    _run(scenario, user)
+    assert Tag.objects.filter(user=user).count() == 2
+
+
+@pytest.mark.django_db
+def test_async_entry_tag_filter_is_scoped_to_the_user(create_tags):
+    user = create_tags[0].user
+
+    async def scenario(client):
+        return (await client.get(ENTRIES, {"tags": "python"})).status_code
+
+    with CaptureQueriesContext(connection) as queries:
+        assert _run(scenario, user) == 200
+    # The tag subquery of the `tags` filter carries the user's id.
+    scoped = re.compile(
+        rf'"learningtracker_tag" (\w+) WHERE .*\1\."user_id" = {user.pk}'
+    )
+    tag_lookups = [
+        query["sql"] for query in queries if '"learningtracker_tag"' in query["sql"]
+    ]
+    assert tag_lookups
+    assert all(scoped.search(sql) for sql in tag_lookups)
@@ -0,0 +1,165 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from learningtracker import lru
+from learningtracker.models import ApiToken
+from learningtracker.utils.error_const import TOKEN_ERRORS
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+# Session authentication is listed first, so DRF answers failed token
+# authentication with 403 rather than 401.
+def _token_client(key):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Token {key}")
+    return client
+
+
+def _session_client(user):
+    client = APIClient()
+    client.force_login(user)
+    return client
+
+
+#################################################################
+#                   TOKEN ISSUING TESTS
+#################################################################
+@pytest.mark.django_db
+def test_issue_token_stores_only_its_digest(create_test_user):
+    """Test that a token is shown once and only its hash is stored."""
+    client = _session_client(create_test_user)
+
+    response = client.post(
+        "/api/tokens/",
+        data={"name": "backup script", "lifetime_days": 7},
+        format="json",
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    key = response.json()["token"]
+    token = ApiToken.objects.get()
+    assert token.digest == ApiToken.hash(key) != key
+    assert key.startswith(token.prefix)
+    assert token.expires_at - timezone.now() > timedelta(days=6)
+
+    listed = client.get("/api/tokens/").json()
+    assert [item["name"] for item in listed] == ["backup script"]
+    assert "token" not in listed[0]
+    assert _token_client(key).get("/api/tags/").status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_tokens_cannot_manage_tokens(create_test_user):
+    """Test that a token cannot issue, rotate or revoke tokens, itself included."""
+    token, key = ApiToken.issue(create_test_user, "script")
+    client = _token_client(key)
+
+    assert client.get("/api/tokens/").status_code == status.HTTP_403_FORBIDDEN
+    response = client.post("/api/tokens/", data={"name": "more"}, format="json")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    response = client.post(f"/api/tokens/{token.pk}/rotate/")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    response = client.delete(f"/api/tokens/{token.pk}/")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert list(ApiToken.objects.values_list("pk", flat=True)) == [token.pk]
+
+
+#################################################################
+#                   TOKEN AUTHENTICATION TESTS
+#################################################################
+@pytest.mark.django_db
+def test_verified_tokens_are_cached(create_test_user):
+    """Test that a warm token cache authenticates without queries."""
+    _token, key = ApiToken.issue(create_test_user, "script")
+    client = _token_client(key)
+    client.get("/api/tags/")
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.get("/api/tags/")
+    assert response.status_code == status.HTTP_200_OK
+    assert not [
+        q
+        for q in context.captured_queries
+        if "auth_user" in q["sql"] or "apitoken" in q["sql"]
+    ]
+
+
+@pytest.mark.django_db
+def test_invalid_and_expired_tokens_are_rejected(create_test_user):
+    """Test the errors for unknown, malformed and expired tokens."""
+    token, key = ApiToken.issue(create_test_user, "script", lifetime=timedelta(1))
+
+    response = _token_client("lt_unknown").get("/api/tags/")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert response.json() == {"detail": TOKEN_ERRORS["invalid_token"]}
+    response = _token_client("two parts").get("/api/tags/")
+    assert response.json() == {"detail": TOKEN_ERRORS["invalid_header"]}
+
+    assert _token_client(key).get("/api/tags/").status_code == status.HTTP_200_OK
+    token.expires_at = timezone.now() - timedelta(seconds=1)
+    token.save()
+    response = _token_client(key).get("/api/tags/")
+    assert response.json() == {"detail": TOKEN_ERRORS["expired_token"]}
+
+
+@pytest.mark.django_db
+def test_inactive_user_token_is_rejected(create_test_user):
+    """Test that deactivating a user invalidates their cached tokens."""
+    _token, key = ApiToken.issue(create_test_user, "script")
+    client = _token_client(key)
+    assert client.get("/api/tags/").status_code == status.HTTP_200_OK
+
+    create_test_user.is_active = False
+    create_test_user.save()
+    response = client.get("/api/tags/")
+    assert response.json() == {"detail": TOKEN_ERRORS["inactive_user"]}
+
+
+#################################################################
+#                   ROTATION AND REVOCATION TESTS
+#################################################################
+@pytest.mark.django_db
+def test_rotate_token(create_test_user, settings):
+    """Test that a rotated token keeps working only for the grace period."""
+    settings.LEARNINGTRACKER_TOKEN_ROTATION_GRACE = 60
+    token, old_key = ApiToken.issue(create_test_user, "script")
+    client = _token_client(old_key)
+
+    response = _session_client(create_test_user).post(f"/api/tokens/{token.pk}/rotate/")
+    assert response.status_code == status.HTTP_201_CREATED
+    new_key = response.json()["token"]
+    assert response.json()["name"] == "script"
+    assert client.get("/api/tags/").status_code == status.HTTP_200_OK
+    assert _token_client(new_key).get("/api/tags/").status_code == status.HTTP_200_OK
+
+    token.refresh_from_db()
+    token.expires_at = timezone.now() - timedelta(seconds=1)
+    token.save()
+    assert client.get("/api/tags/").status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+def test_revoked_token_stops_working(create_test_user, monkeypatch):
+    """Test revocation in this process and, within the window, in others."""
+    clock = [1000.0]
+    monkeypatch.setattr(lru.time, "monotonic", lambda: clock[0])
+    token, key = ApiToken.issue(create_test_user, "script")
+    client = _token_client(key)
+    assert client.get("/api/tags/").status_code == status.HTTP_200_OK
+
+    response = _session_client(create_test_user).delete(f"/api/tokens/{token.pk}/")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert client.get("/api/tags/").status_code == status.HTTP_403_FORBIDDEN
+
+    # A revocation made by another process sends no signal here, so the
+    # cached token is trusted until the cache timeout passes.
+    token, key = ApiToken.issue(create_test_user, "script")
+    client = _token_client(key)
+    client.get("/api/tags/")
+    ApiToken.objects.filter(pk=token.pk)._raw_delete(connection.alias)
+    assert client.get("/api/tags/").status_code == status.HTTP_200_OK
+    clock[0] += 30
+    assert client.get("/api/tags/").status_code == status.HTTP_403_FORBIDDEN
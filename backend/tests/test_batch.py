@@ -0,0 +1,114 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from learningtracker.models import ApiToken, DailyLearning, Tag
+from learningtracker.utils.error_const import BATCH_ERRORS
+from rest_framework import status
+from rest_framework.test import APIClient
+
+URL = "/api/batch/"
+
+
+@pytest.fixture
+def batch_client(create_test_user):
+    user = create_test_user
+    DailyLearning.objects.create(
+        user=user, date="2023-01-01", learning_type="Python", description="Batched"
+    )
+    Tag.objects.create(user=user, name="python")
+    client = APIClient()
+    client.login(username="testuser", password="password")
+    return client
+
+
+#################################################################
+#                   VALIDATE BATCH ENDPOINT
+#################################################################
+@pytest.mark.django_db
+def test_batch_runs_get_requests_in_order(batch_client):
+    response = batch_client.post(
+        URL,
+        {
+            "requests": [
+                "/api/csrf/",
+                "/api/learned-entries/?date=2023-01-01",
+                "/api/tags/",
+                "/api/stats/?year=2023",
+            ]
+        },
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    csrf, entries, tags, stats = response.json()["responses"]
+    assert csrf["status"] == 200 and "csrfToken" in csrf["body"]
+    assert "csrftoken" in response.cookies
+    assert [entry["description"] for entry in entries["body"]] == ["Batched"]
+    assert [tag["name"] for tag in tags["body"]] == ["python"]
+    assert stats["body"]["total_entries"] == 1
+
+
+@pytest.mark.django_db
+def test_batch_authenticates_once(batch_client):
+    paths = ["/api/tags/"] * 5
+    with CaptureQueriesContext(connection) as context:
+        batch_client.post(URL, {"requests": paths}, format="json")
+    user_queries = [q for q in context if 'FROM "auth_user"' in q["sql"]]
+    assert len(user_queries) == 1
+
+
+@pytest.mark.django_db
+def test_batch_reports_per_request_errors(batch_client):
+    response = batch_client.post(
+        URL,
+        {
+            "requests": [
+                "/api/learned-entries/999999/",
+                "/api/nowhere/",
+                "/api/batch/",
+                "/admin/",
+                "/api/async/tags/",
+            ]
+        },
+        format="json",
+    )
+
+    responses = response.json()["responses"]
+    assert [item["status"] for item in responses] == [404, 404, 400, 400, 400]
+    assert responses[-1]["body"] == {"detail": BATCH_ERRORS["async_view"]}
+    response = batch_client.post(URL, {"requests": []}, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db(transaction=True)
+def test_batch_runs_concurrently(batch_client):
+    response = batch_client.post(
+        URL,
+        {"requests": ["/api/tags/", "/api/learned-entries/"], "concurrent": True},
+        format="json",
+    )
+
+    tags, entries = response.json()["responses"]
+    assert [tag["name"] for tag in tags["body"]] == ["python"]
+    assert len(entries["body"]) == 1
+
+
+@pytest.mark.django_db
+def test_batch_honours_the_authenticators_of_each_view(batch_client):
+    """Test that a token cannot reach session-only views through a batch."""
+    token, key = ApiToken.issue(Tag.objects.get().user, "script")
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Token {key}")
+    paths = ["/api/tags/", "/api/tokens/"]
+
+    response = client.post(URL, {"requests": paths}, format="json")
+    assert response.status_code == status.HTTP_200_OK
+    tags, tokens = response.json()["responses"]
+    assert tags["status"] == 200
+    assert tokens["status"] == 403
+    assert tokens["body"] == {"detail": BATCH_ERRORS["authentication_not_accepted"]}
+
+    response = batch_client.post(URL, {"requests": paths}, format="json")
+    tags, tokens = response.json()["responses"]
+    assert tokens["status"] == 200
+    assert [item["prefix"] for item in tokens["body"]] == [token.prefix]
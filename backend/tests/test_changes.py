@@ -0,0 +1,114 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from learningtracker.models import Tag
+from rest_framework import status
+from rest_framework.test import APIClient
+
+URL = "/api/learned-entries/changes/"
+
+
+def _client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+def _entry(client, day, tags=()):
+    response = client.post(
+        "/api/learned-entries/",
+        {
+            "date": day,
+            "learning_type": "Python",
+            "description": "Synced entry",
+            "tags": [{"name": name} for name in tags],
+        },
+        format="json",
+    )
+    return response.json()
+
+
+#################################################################
+#                   VALIDATE CHANGE FEED
+#################################################################
+@pytest.mark.django_db
+def test_change_feed_returns_updates_and_tombstones(create_test_user):
+    client = _client(create_test_user)
+    first = _entry(client, "2023-01-01", tags=["python"])
+    second = _entry(client, "2023-01-02", tags=["django"])
+
+    body = client.get(URL).json()
+    assert [entry["id"] for entry in body["entries"]] == [first["id"], second["id"]]
+    assert body["deleted_entries"] == [] and body["has_more"] is False
+    cursor = body["cursor"]
+
+    # Nothing changed since the cursor
+    body = client.get(URL, {"since": cursor}).json()
+    assert body["entries"] == [] and body["deleted_entries"] == []
+
+    client.patch(
+        f"/api/learned-entries/{first['id']}/",
+        {"description": "Edited offline"},
+        format="json",
+    )
+    client.delete(f"/api/learned-entries/{second['id']}/")
+    tag = Tag.objects.get(name="django")
+    client.delete(f"/api/tags/{tag.pk}/")
+
+    body = client.get(URL, {"since": cursor}).json()
+    assert [entry["description"] for entry in body["entries"]] == ["Edited offline"]
+    assert body["deleted_entries"] == [second["id"]]
+    assert body["deleted_tags"] == [tag.pk]
+
+    body = client.get(URL, {"since": body["cursor"]}).json()
+    assert body["entries"] == [] and body["deleted_entries"] == []
+
+
+@pytest.mark.django_db
+def test_change_feed_pages_with_limit(create_test_user):
+    client = _client(create_test_user)
+    for day in range(1, 6):
+        _entry(client, f"2023-01-0{day}")
+
+    seen = []
+    body = client.get(URL, {"limit": 2}).json()
+    seen += [entry["date"] for entry in body["entries"]]
+    while body["has_more"]:
+        body = client.get(URL, {"since": body["cursor"], "limit": 2}).json()
+        seen += [entry["date"] for entry in body["entries"]]
+    assert seen == [f"2023-01-0{day}" for day in range(1, 6)]
+
+
+@pytest.mark.django_db
+def test_change_feed_tracks_tag_renames_and_bulk_deletes(create_test_user):
+    client = _client(create_test_user)
+    entry = _entry(client, "2023-01-01", tags=["pyhton"])
+    other = _entry(client, "2023-01-02")
+    cursor = client.get(URL).json()["cursor"]
+
+    tag = Tag.objects.get(name="pyhton")
+    client.patch(f"/api/tags/{tag.pk}/", {"name": "python"}, format="json")
+    client.post("/api/learned-entries/bulk/", {"delete": [other["id"]]}, format="json")
+
+    body = client.get(URL, {"since": cursor}).json()
+    assert [item["id"] for item in body["entries"]] == [entry["id"]]
+    assert body["entries"][0]["tags"][0]["name"] == "python"
+    assert body["deleted_entries"] == [other["id"]]
+
+
+@pytest.mark.django_db
+def test_change_feed_rejects_bad_and_stale_cursors(create_test_user):
+    client = _client(create_test_user)
+
+    response = client.get(URL, {"since": "not-a-cursor"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    response = client.get(URL, {"limit": 0})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    cursor = client.get(URL).json()["cursor"]
+    later = timezone.now() + timedelta(days=91)
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr("learningtracker.changes.timezone.now", lambda: later)
+        response = client.get(URL, {"since": cursor})
+    assert response.status_code == status.HTTP_410_GONE
@@ -0,0 +1,114 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import override_settings
+from django.utils import timezone
+from learningtracker.models import DailyLearning, LearningRun, LearningStreak, Tombstone
+from rest_framework.test import APIClient
+
+
+#################################################################
+#                   REBUILD SEARCH INDEX COMMAND
+#################################################################
+@pytest.mark.django_db
+def test_rebuild_search_index_command(create_test_user):
+    """Test that the rebuild command restores a search index that fell behind."""
+    DailyLearning.objects.create(
+        user=create_test_user,
+        date="2023-01-01",
+        learning_type="Python",
+        description="Learned about asyncio",
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "INSERT INTO learningtracker_dailylearning_fts"
+            "(learningtracker_dailylearning_fts) VALUES ('delete-all')"
+        )
+
+    client = APIClient()
+    client.force_authenticate(user=create_test_user)
+    assert client.get("/api/learned-entries/?q=asyncio").json() == []
+
+    call_command("rebuild_search_index")
+    assert len(client.get("/api/learned-entries/?q=asyncio").json()) == 1
+
+
+#################################################################
+#                   RECOMPUTE STREAKS COMMAND
+#################################################################
+@pytest.mark.django_db
+def test_recompute_streaks_command_fixes_drift(create_learning_entry):
+    """Test that the command detects and repairs drifted streaks."""
+    entry = create_learning_entry()
+    LearningRun.objects.all().delete()
+
+    out = StringIO()
+    call_command("recompute_streaks", "--check", stdout=out)
+    assert "drifted" in out.getvalue()
+    assert not LearningRun.objects.exists()
+
+    out = StringIO()
+    call_command("recompute_streaks", stdout=out)
+    assert "1 user(s) with drifted streaks fixed." in out.getvalue()
+    assert LearningStreak.objects.get(user=entry.user).longest_length == 1
+
+    out = StringIO()
+    call_command("recompute_streaks", "--username", "testuser", stdout=out)
+    assert "All streaks are up to date." in out.getvalue()
+
+
+#################################################################
+#                   PRUNE TOMBSTONES COMMAND
+#################################################################
+@pytest.mark.django_db
+def test_prune_tombstones_command(create_test_user):
+    """Test that only tombstones past the retention window are removed."""
+    for age in (10, 100):
+        Tombstone.objects.create(
+            user=create_test_user,
+            kind=Tombstone.Kinds.ENTRY,
+            object_id=age,
+            deleted_at=timezone.now() - timedelta(days=age),
+        )
+
+    out = StringIO()
+    call_command("prune_tombstones", stdout=out)
+
+    assert "Pruned 1 tombstones." in out.getvalue()
+    assert list(Tombstone.objects.values_list("object_id", flat=True)) == [10]
+
+
+#################################################################
+#                   CACHE STATS COMMAND
+#################################################################
+@pytest.mark.django_db
+def test_cache_stats_command(create_test_user, tmp_path):
+    """Test that the response cache hit/miss counters are reported and reset."""
+    shared = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": str(tmp_path),
+        }
+    }
+    with override_settings(CACHES=shared, LEARNINGTRACKER_RESPONSE_CACHE_TIMEOUT=60):
+        client = APIClient()
+        client.force_authenticate(user=create_test_user)
+        for _ in range(3):
+            client.get("/api/tags/")
+
+        out = StringIO()
+        call_command("cache_stats", "--reset", stdout=out)
+        assert "Hits: 2, misses: 1, hit ratio: 66.67%" in out.getvalue()
+
+        out = StringIO()
+        call_command("cache_stats", stdout=out)
+        assert "Hits: 0, misses: 0, hit ratio: n/a" in out.getvalue()
+
+
+def test_cache_stats_command_requires_shared_cache():
+    """Test that the command refuses to read a process-local cache."""
+    with pytest.raises(CommandError, match="CACHE_URL"):
+        call_command("cache_stats", stdout=StringIO())
@@ -0,0 +1,97 @@
+from datetime import date, timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from learningtracker.dashboard import build_dashboard
+from learningtracker.models import DailyLearning
+from rest_framework import status
+from rest_framework.test import APIClient
+
+TODAY = date(2024, 3, 13)  # A Wednesday
+
+
+def _learners(count):
+    users = [
+        User.objects.create_user(username=f"learner{index:02d}", password="password")
+        for index in range(count)
+    ]
+    for index, user in enumerate(users):
+        for offset in range(index + 1):
+            DailyLearning.objects.create(
+                user=user,
+                date=TODAY - timedelta(days=offset),
+                learning_type="Python" if offset % 2 else "Docker",
+                description="Daily learning",
+            )
+    return users
+
+
+#################################################################
+#                   VALIDATE AGGREGATES
+#################################################################
+@pytest.mark.django_db
+def test_build_dashboard():
+    _learners(3)
+
+    dashboard = build_dashboard(weeks=2, limit=2, today=TODAY)
+
+    assert dashboard["from_date"] == "2024-03-04"
+    assert dashboard["active_learners"] == [
+        {"week": "2024-03-04", "learners": 0, "entries": 0},
+        {"week": "2024-03-11", "learners": 3, "entries": 6},
+    ]
+    assert dashboard["topics"] == [
+        {"learning_type": "Docker", "entries": 4, "learners": 3},
+        {"learning_type": "Python", "entries": 2, "learners": 2},
+    ]
+    longest = dashboard["leaderboard"]["longest"]
+    assert [(row["rank"], row["username"], row["length"]) for row in longest] == [
+        (1, "learner02", 3),
+        (2, "learner01", 2),
+    ]
+    assert dashboard["leaderboard"]["current"][0]["username"] == "learner02"
+
+
+@pytest.mark.django_db
+def test_build_dashboard_query_count_is_constant():
+    _learners(2)
+    with CaptureQueriesContext(connection) as few:
+        build_dashboard(weeks=4, limit=10, today=TODAY)
+
+    late = User.objects.create_user(username="late", password="password")
+    DailyLearning.objects.create(
+        user=late,
+        date=TODAY,
+        learning_type="SQL",
+        description="Daily learning",
+    )
+    with CaptureQueriesContext(connection) as many:
+        build_dashboard(weeks=4, limit=10, today=TODAY)
+
+    assert len(few.captured_queries) == len(many.captured_queries) == 4
+
+
+#################################################################
+#                   VALIDATE ENDPOINT
+#################################################################
+@pytest.mark.django_db
+def test_dashboard_is_staff_only_and_cached(create_test_user):
+    user = create_test_user
+    client = APIClient()
+    client.force_authenticate(user=user)
+    assert client.get("/api/dashboard/").status_code == status.HTTP_403_FORBIDDEN
+
+    user.is_staff = True
+    user.save()
+    response = client.get("/api/dashboard/?weeks=4")
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["active_learners"]) == 4
+
+    with CaptureQueriesContext(connection) as context:
+        client.get("/api/dashboard/?weeks=4")
+    assert not any("learningtracker_" in query["sql"] for query in context)
+
+    response = client.get("/api/dashboard/?weeks=0")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
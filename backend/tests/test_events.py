@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.test import AsyncClient, Client
+from learningtracker.events import (
+    Broker,
+    InProcessBroker,
+    format_event,
+    get_broker,
+)
+from learningtracker.models import DailyLearning, Tag
+from learningtracker.utils.error_const import EVENTS_ERRORS
+
+
+#################################################################
+#                   VALIDATE BROKER
+#################################################################
+def test_in_process_broker_delivers_and_signals_overflow():
+    broker = InProcessBroker(queue_size=3)
+
+    async def scenario():
+        async with broker.subscribe(1) as queue:
+            assert broker.subscriber_count(1) == 1
+            for index in range(5):
+                broker.publish(1, {"type": "entries", "index": index})
+            broker.publish(2, {"type": "entries", "index": 99})
+            await asyncio.sleep(0)
+            received = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert broker.subscriber_count() == 0
+        return received
+
+    assert async_to_sync(scenario)() == [
+        {"type": "entries", "index": 0},
+        {"type": "entries", "index": 1},
+        {"type": "resync"},
+    ]
+
+
+def test_format_event():
+    assert format_event({"type": "tags", "tag_ids": [3]}, event_id=7) == (
+        'event: tags\nid: 7\ndata: {"type":"tags","tag_ids":[3]}\n\n'
+    )
+
+
+#################################################################
+#                   VALIDATE STREAM ENDPOINT
+#################################################################
+@pytest.mark.django_db
+def test_event_stream_pushes_changes(
+    create_test_user, django_capture_on_commit_callbacks
+):
+    user = create_test_user
+
+    def write():
+        with django_capture_on_commit_callbacks(execute=True):
+            DailyLearning.objects.create(
+                user=user,
+                date="2023-01-01",
+                learning_type="Python",
+                description="Streamed entry",
+            )
+        with django_capture_on_commit_callbacks(execute=True):
+            Tag.objects.create(user=user, name="asyncio")
+
+    async def scenario():
+        client = AsyncClient()
+        await client.aforce_login(user)
+        response = await client.get("/api/events/")
+        assert response["Content-Type"] == "text/event-stream"
+        stream = aiter(response.streaming_content)
+        assert await anext(stream) == b"retry: 5000\n\n"
+        assert get_broker().subscriber_count(user.pk) == 1
+
+        await sync_to_async(write)()
+        chunks = [await asyncio.wait_for(anext(stream), 5) for _ in range(2)]
+        await stream.aclose()
+        return chunks
+
+    entries, tags = async_to_sync(scenario)()
+    assert entries.startswith(b"event: entries\nid: 1\n")
+    assert b'"dates":["2023-01-01"]' in entries
+    assert tags.startswith(b"event: tags\nid: 2\n")
+    assert get_broker().subscriber_count(user.pk) == 0
+
+
+@pytest.mark.django_db
+def test_event_stream_requires_login():
+    async def scenario():
+        return await AsyncClient().get("/api/events/")
+
+    assert async_to_sync(scenario)().status_code == 403
+
+
+@pytest.mark.django_db
+def test_event_stream_requires_asgi(create_test_user):
+    client = Client()
+    client.force_login(create_test_user)
+
+    response = client.get("/api/events/")
+
+    assert response.status_code == 501
+    assert response.json() == {"detail": EVENTS_ERRORS["asgi_required"]}
+
+
+def test_broker_is_abstract():
+    with pytest.raises(TypeError):
+        Broker()
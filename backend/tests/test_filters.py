@@ -16,6 +16,8 @@ from learningtracker.models import DailyLearning, Tag
         ({"to_date": "2022-01-01"}, 1),  # Date <= 2022-01-01
         ({"learning_type": "python"}, 1),  # Case-insensitive match
         ({"description": "test"}, 1),  # Case-insensitive substring match
+        ({"learning_type__in": "Python"}, 1),  # Exact topic
+        ({"learning_type__in": "Django,Python"}, 1),  # Any of several topics
     ],
 )
 @pytest.mark.django_db
@@ -44,6 +46,7 @@ def test_dailylearningfilter_with_valid_data(
         ({"to_date": "2000-01-01"}, 0),  # Invalid Date <= 2000-01-01
         ({"learning_type": "test"}, 0),  # Invalid Case-insensitive match
         ({"description": "invalid"}, 0),  # Invalid Case-insensitive substring match
+        ({"learning_type__in": "Django,Docker"}, 0),  # No matching topic
     ],
 )
 @pytest.mark.django_db
@@ -140,3 +143,121 @@ def test_tagfiltered_metadata():
         if field_name == "name":
             assert field.lookup_expr
         assert field.extra.get("help_text")
+
+
+#################################################################
+#                   VALIDATE FULL-TEXT SEARCH
+#################################################################
+@pytest.mark.django_db
+def test_dailylearningfilter_full_text_search_ranks_results(create_learning_entry):
+    """
+    Test that `q` matches whole words and orders the best match first.
+    """
+    create_learning_entry(date="2022-01-01", description="Docker networking basics")
+    best = create_learning_entry(
+        date="2022-01-02", description="Docker volumes and Docker compose with docker"
+    )
+    create_learning_entry(date="2022-01-03", description="Kubernetes pods")
+
+    filtered_qs = DailyLearningFilter(
+        data={"q": "docker"}, queryset=DailyLearning.objects.all()
+    ).qs
+
+    assert filtered_qs.count() == 2
+    assert filtered_qs.first() == best
+
+
+@pytest.mark.django_db
+def test_dailylearningfilter_full_text_search_tracks_writes(create_learning_entry):
+    """
+    Test that the search index follows updates and deletes.
+    """
+    entry = create_learning_entry(description="Learned about generators")
+    entry.description = "Learned about decorators"
+    entry.save()
+
+    def search(text):
+        return DailyLearningFilter(
+            data={"q": text}, queryset=DailyLearning.objects.all()
+        ).qs
+
+    assert search("generators").count() == 0
+    assert search("decorators").count() == 1
+    assert search("decor").count() == 1  # Prefix match on the last word
+    assert search('"; DROP TABLE').count() == 0
+
+    entry.delete()
+    assert search("decorators").count() == 0
+
+
+#################################################################
+#                   VALIDATE TAG FILTERS
+#################################################################
+@pytest.mark.parametrize(
+    "filter_data, expected_dates",
+    [
+        ({"tags": "docker"}, ["2022-01-01", "2022-01-02"]),
+        ({"tags": "Docker, kubernetes"}, ["2022-01-01", "2022-01-02", "2022-01-03"]),
+        ({"tags_all": "docker,kubernetes"}, ["2022-01-02"]),
+        ({"tags_all": "docker,unknown"}, []),
+        ({"tags": "unknown"}, []),
+        ({"tags": " , "}, ["2022-01-01", "2022-01-02", "2022-01-03", "2022-01-04"]),
+    ],
+)
+@pytest.mark.django_db
+def test_dailylearningfilter_tags(create_learning_entry, filter_data, expected_dates):
+    """
+    Test the any/all tag filters over the through table.
+    """
+    first = create_learning_entry(date="2022-01-01")
+    second = create_learning_entry(date="2022-01-02")
+    third = create_learning_entry(date="2022-01-03")
+    create_learning_entry(date="2022-01-04")
+    docker = Tag.objects.create(user=first.user, name="Docker")
+    kubernetes = Tag.objects.create(user=first.user, name="kubernetes")
+    first.tags.add(docker)
+    second.tags.add(docker, kubernetes)
+    third.tags.add(kubernetes)
+
+    filtered_qs = DailyLearningFilter(
+        data=filter_data, queryset=DailyLearning.objects.order_by("date")
+    ).qs
+
+    assert [entry.date.isoformat() for entry in filtered_qs] == expected_dates
+
+
+@pytest.mark.django_db
+def test_dailylearningfilter_learning_type_in_is_exact(create_learning_entry):
+    """
+    Test that `learning_type__in` rejects unknown topics instead of substrings.
+    """
+    create_learning_entry()
+    filter_set = DailyLearningFilter(
+        data={"learning_type__in": "pyth"}, queryset=DailyLearning.objects.all()
+    )
+
+    assert not filter_set.is_valid()
+    assert "learning_type__in" in filter_set.errors
+
+
+@pytest.mark.django_db
+def test_dailylearningfilter_tags_all_counts_case_variants_once(
+    create_learning_entry,
+):
+    """
+    Test that case variants of one tag do not stand in for another tag.
+    """
+    entry = create_learning_entry(date="2022-01-01")
+    entry.tags.add(
+        Tag.objects.create(user=entry.user, name="Docker"),
+        Tag.objects.create(user=entry.user, name="docker"),
+    )
+
+    filtered_qs = DailyLearningFilter(
+        data={"tags_all": "docker,kubernetes"}, queryset=DailyLearning.objects.all()
+    ).qs
+    assert not filtered_qs.exists()
+    filtered_qs = DailyLearningFilter(
+        data={"tags_all": "docker"}, queryset=DailyLearning.objects.all()
+    ).qs
+    assert list(filtered_qs) == [entry]
@@ -3,7 +3,7 @@ from datetime import date, timedelta
 import pytest
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
-from learningtracker.models import DailyLearning, Tag
+from learningtracker.models import DailyLearning, Tag, progress_windows
 from learningtracker.utils.error_const import DAILY_LEARNING_ERRORS, TAG_ERRORS
 
 
@@ -136,6 +136,79 @@ def test_dailylearning_invalid_learning_type(create_learning_entry):
     ]
 
 
+#################################################################
+#                   VALIDATE DAILYLEARNING UPSERT
+#################################################################
+@pytest.mark.django_db
+def test_dailylearning_upsert_for_date(create_learning_entry):
+    # Arrange: Create an entry to be overwritten
+    instance = create_learning_entry()
+
+    # Act: Upsert the same day and a new day
+    updated = DailyLearning.upsert_for_date(
+        instance.user, instance.date, description="Replaced description"
+    )
+    created = DailyLearning.upsert_for_date(
+        instance.user, date(2022, 1, 2), description="Brand new entry"
+    )
+
+    # Assert: The existing row was updated in place and the new one inserted
+    instance.refresh_from_db()
+    assert updated.pk == instance.pk
+    assert instance.description == "Replaced description"
+    assert DailyLearning.objects.get(pk=created.pk).description == "Brand new entry"
+    assert DailyLearning.objects.count() == 2
+
+
+#################################################################
+#                   VALIDATE PROGRESS ANALYTICS
+#################################################################
+def test_progress_windows_are_clipped_to_today():
+    windows = progress_windows([2023, 2024, 2025], today=date(2024, 5, 10))
+
+    labels = [window.label for window in windows]
+    assert labels == [
+        "2023",
+        "2023-Q1",
+        "2023-Q2",
+        "2023-Q3",
+        "2023-Q4",
+        "2024",
+        "2024-Q1",
+        "2024-Q2",
+        "30d",
+        "90d",
+        "365d",
+    ]
+    assert windows[5].days == 131
+    assert windows[7].end == date(2024, 5, 10)
+    assert windows[-1].start == date(2023, 5, 12)
+
+
+@pytest.mark.django_db
+def test_dailylearning_progress_for_many_users(
+    create_learning_entry, django_assert_num_queries
+):
+    # Arrange: Two entries for the first user, one for a second user
+    create_learning_entry(date=date(2023, 1, 5))
+    first = create_learning_entry(date=date(2023, 11, 30))
+    other = User.objects.create_user(username="other", password="password")
+    create_learning_entry(user=other, date=date(2023, 7, 1))
+
+    # Act: Compute every window for both users in one query
+    with django_assert_num_queries(1):
+        progress = DailyLearning.progress(
+            [first.user_id, other.pk], [2023], today=date(2023, 12, 31)
+        )
+
+    # Assert
+    year = progress[first.user_id]["years"][0]
+    assert (year["entries"], year["days"], year["ratio"]) == (2, 365, 0.0055)
+    assert [q["entries"] for q in progress[first.user_id]["quarters"]] == [1, 0, 0, 1]
+    assert [r["entries"] for r in progress[first.user_id]["rolling"]] == [0, 1, 2]
+    assert [q["entries"] for q in progress[other.pk]["quarters"]] == [0, 0, 1, 0]
+
+
 #################################################################
 #                   VALIDATE TAG MODEL VALID DATA
 #################################################################
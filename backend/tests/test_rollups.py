@@ -0,0 +1,168 @@
+from datetime import date
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from learningtracker.models import DailyLearning, MonthlyRollup, Tag, TagRollup
+from learningtracker.rollups import rebuild_rollups
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+def _monthly(user):
+    return {
+        (row.month.isoformat(), row.learning_type): row.entry_count
+        for row in MonthlyRollup.objects.filter(user=user)
+    }
+
+
+def _tags(user):
+    return {
+        row.tag.name: row.entry_count
+        for row in TagRollup.objects.filter(user=user).select_related("tag")
+    }
+
+
+#################################################################
+#                   VALIDATE INCREMENTAL MAINTENANCE
+#################################################################
+@pytest.mark.django_db
+def test_rollups_follow_entry_writes(create_test_user):
+    user = create_test_user
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    # Act: Create two entries in January through the API
+    for day in ("2023-01-05", "2023-01-06"):
+        response = client.post(
+            "/api/learned-entries/",
+            data={
+                "date": day,
+                "learning_type": "Python",
+                "description": "Learned something",
+                "tags": [{"name": "python"}],
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+    entry_id = response.json()["id"]
+    assert _monthly(user) == {("2023-01-01", "Python"): 2}
+    assert _tags(user) == {"python": 2}
+
+    # Act: Move one entry to February and change its topic and tags
+    client.patch(
+        f"/api/learned-entries/{entry_id}/",
+        data={"date": "2023-02-01", "learning_type": "Docker", "tags": []},
+        format="json",
+    )
+    assert _monthly(user) == {
+        ("2023-01-01", "Python"): 1,
+        ("2023-02-01", "Docker"): 1,
+    }
+    assert _tags(user) == {"python": 1}
+
+    # Act: Delete it again
+    client.delete(f"/api/learned-entries/{entry_id}/")
+    assert _monthly(user) == {("2023-01-01", "Python"): 1}
+
+
+@pytest.mark.django_db
+def test_rollups_follow_bulk_and_upsert_writes(create_test_user):
+    user = create_test_user
+    doomed = DailyLearning.objects.create(
+        user=user, date="2023-03-01", learning_type="SQL", description="To delete"
+    )
+    doomed.tags.add(Tag.objects.create(user=user, name="sql"))
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    client.post(
+        "/api/learned-entries/bulk/",
+        data={
+            "create": [
+                {
+                    "date": "2023-03-02",
+                    "learning_type": "SQL",
+                    "description": "Window functions",
+                    "tags": [{"name": "sql"}],
+                }
+            ],
+            "delete": [doomed.id],
+        },
+        format="json",
+    )
+    client.put(
+        "/api/learned-entries/by-date/2023-03-03/",
+        data={"learning_type": "SQL", "description": "Indexes"},
+        format="json",
+    )
+
+    assert _monthly(user) == {("2023-03-01", "SQL"): 2}
+    assert _tags(user) == {"sql": 1}
+
+
+@pytest.mark.django_db
+def test_rebuild_rollups_matches_incremental_state(create_learning_entry):
+    entry = create_learning_entry()
+    entry.tags.add(Tag.objects.create(user=entry.user, name="python"))
+    expected_monthly, expected_tags = _monthly(entry.user), _tags(entry.user)
+
+    MonthlyRollup.objects.all().delete()
+    TagRollup.objects.all().delete()
+    rebuild_rollups(entry.user.pk)
+
+    assert _monthly(entry.user) == expected_monthly
+    assert _tags(entry.user) == expected_tags
+
+
+#################################################################
+#                   VALIDATE STATS ENDPOINT
+#################################################################
+@pytest.mark.django_db
+def test_stats_endpoint_reads_rollups_only(create_test_user):
+    user = create_test_user
+    python_tag = Tag.objects.create(user=user, name="python")
+    for day, topic in ((1, "Python"), (2, "Python"), (40, "Django")):
+        entry = DailyLearning.objects.create(
+            user=user,
+            date=date.fromordinal(date(2023, 1, 1).toordinal() + day - 1),
+            learning_type=topic,
+            description="Some learning",
+        )
+        entry.tags.add(python_tag)
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.get("/api/stats/?year=2023")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "total_entries": 3,
+        "by_month": [
+            {"month": "2023-01", "count": 2},
+            {"month": "2023-02", "count": 1},
+        ],
+        "by_topic": [
+            {"learning_type": "Python", "count": 2},
+            {"learning_type": "Django", "count": 1},
+        ],
+        "by_tag": [{"id": python_tag.id, "name": "python", "count": 3}],
+    }
+    assert len(context.captured_queries) == 2
+    assert all(
+        "learningtracker_dailylearning" not in query["sql"]
+        for query in context.captured_queries
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("year", ["0", "9999", "abc"])
+def test_stats_endpoint_rejects_invalid_year(create_test_user, year):
+    client = APIClient()
+    client.force_authenticate(user=create_test_user)
+
+    response = client.get(f"/api/stats/?year={year}")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "year" in response.json()
@@ -1,6 +1,9 @@
 from datetime import date, timedelta
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from learningtracker import lru
 from learningtracker.models import DailyLearning, Tag
 from learningtracker.serializers import DAILY_LEARNING_ERRORS, DailyLearningSerializer
 from rest_framework.serializers import ValidationError
@@ -90,6 +93,127 @@ def test_dailylearning_serializer_updates_instance(create_learning_entry):
     assert updated_instance.tags.first().name == "Docker"
 
 
+#################################################################
+#                   VALIDATE TAG SYNCHRONISATION
+#################################################################
+@pytest.mark.django_db
+def test_dailylearning_serializer_update_keeps_unchanged_tag_links(
+    create_learning_entry,
+):
+    instance = create_learning_entry()
+    kept = Tag.objects.create(user=instance.user, name="Python")
+    dropped = Tag.objects.create(user=instance.user, name="Flask")
+    instance.tags.add(kept, dropped)
+    through = DailyLearning.tags.through
+    kept_link = through.objects.get(dailylearning=instance, tag=kept).pk
+
+    serializer = DailyLearningSerializer(
+        instance,
+        data={"tags": [{"name": "Python"}, {"name": "Docker"}]},
+        partial=True,
+    )
+    assert serializer.is_valid(), serializer.errors
+    serializer.save()
+
+    assert sorted(instance.tags.values_list("name", flat=True)) == [
+        "Docker",
+        "Python",
+    ]
+    assert through.objects.get(dailylearning=instance, tag=kept).pk == kept_link
+    assert Tag.objects.filter(pk=dropped.pk).exists()
+
+
+@pytest.mark.django_db
+def test_dailylearning_serializer_update_tag_query_count(create_learning_entry):
+    first = create_learning_entry(date="2022-01-01")
+    second = create_learning_entry(date="2022-01-02")
+    Tag.objects.create(user=first.user, name="existing")
+
+    def _save_tags(instance, names):
+        serializer = DailyLearningSerializer(
+            instance, data={"tags": [{"name": name} for name in names]}, partial=True
+        )
+        assert serializer.is_valid(), serializer.errors
+        with CaptureQueriesContext(connection) as context:
+            serializer.save()
+        return context.captured_queries
+
+    one_tag = _save_tags(first, ["existing", "new-0"])
+    ten_tags = _save_tags(second, ["existing"] + [f"new-{i}" for i in range(1, 10)])
+
+    assert second.tags.count() == 10
+    # Resolving, creating and linking tags is set-based, not per tag.
+    assert len(one_tag) == len(ten_tags)
+    tag_queries = [
+        query["sql"]
+        for query in ten_tags
+        if "learningtracker_tag" in query["sql"]
+        or "learningtracker_dailylearning_tags" in query["sql"]
+    ]
+    # Existing tag lookup, missing tag insert, current link read, link insert,
+    # then the tag rollup count and its upsert.
+    assert len(tag_queries) == 6
+
+
+def _tag_lookups(context):
+    # Tag rollups aggregate over the tag table too; only count plain lookups.
+    return [
+        q
+        for q in context.captured_queries
+        if q["sql"].startswith("SELECT")
+        and 'FROM "learningtracker_tag"' in q["sql"]
+        and "GROUP BY" not in q["sql"]
+    ]
+
+
+@pytest.mark.django_db
+def test_dailylearning_serializer_resolves_tags_from_cache(create_learning_entry):
+    entry = create_learning_entry()
+    python = Tag.objects.create(user=entry.user, name="Python")
+    docker = Tag.objects.create(user=entry.user, name="Docker")
+
+    def _save_tags(names):
+        serializer = DailyLearningSerializer(
+            entry, data={"tags": [{"name": name} for name in names]}, partial=True
+        )
+        assert serializer.is_valid(), serializer.errors
+        with CaptureQueriesContext(connection) as context:
+            serializer.save()
+        return _tag_lookups(context)
+
+    assert len(_save_tags(["Python"])) == 1
+    assert _save_tags(["Python", "Docker"]) == []
+    assert set(entry.tags.values_list("pk", flat=True)) == {python.pk, docker.pk}
+
+    # Renames and deletes invalidate the cached names.
+    docker.name = "Containers"
+    docker.save()
+    python.delete()
+    _save_tags(["Python", "Containers"])
+    assert sorted(entry.tags.values_list("name", flat=True)) == [
+        "Containers",
+        "Python",
+    ]
+    assert Tag.objects.filter(user=entry.user).count() == 2
+
+
+def test_tag_cache_is_a_bounded_lru_with_expiry(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(lru.time, "monotonic", lambda: clock[0])
+    cache = lru.ExpiringLRUCache(size=2, timeout=60)
+
+    cache.set(1, {"a": 1})
+    cache.set(2, {"b": 2})
+    assert cache.get(1) == {"a": 1}
+    cache.set(3, {"c": 3})
+    # User 2 was the least recently used.
+    assert cache.get(2) is None
+    assert len(cache) == 2
+
+    clock[0] += 60
+    assert cache.get(1) is None
+
+
 #################################################################
 #                   VALIDATE INVALID DATA
 #################################################################
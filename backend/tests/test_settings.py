@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _load_settings(**env):
+    return subprocess.run(
+        [sys.executable, "-c", "import admin.settings"],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "SECRET_KEY": "test", **env},
+        capture_output=True,
+        text=True,
+    )
+
+
+#################################################################
+#                   SHARED CACHE REQUIREMENT
+#################################################################
+@pytest.mark.parametrize(
+    "env, loads",
+    [
+        ({"WEB_CONCURRENCY": "1", "CACHE_URL": ""}, True),
+        ({"WEB_CONCURRENCY": "4", "CACHE_URL": ""}, False),
+        ({"WEB_CONCURRENCY": "4", "CACHE_URL": "redis://cache:6379/0"}, True),
+    ],
+)
+def test_multiple_workers_require_a_shared_cache(env, loads):
+    """Test that settings refuse several workers with process-local caches."""
+    result = _load_settings(**env)
+    assert (result.returncode == 0) is loads
+    if not loads:
+        assert "CACHE_URL" in result.stderr
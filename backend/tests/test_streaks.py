@@ -0,0 +1,114 @@
+from datetime import date, timedelta
+
+import pytest
+from learningtracker.models import DailyLearning, LearningRun, LearningStreak
+from learningtracker.streaks import runs_from_dates
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+def _day(offset):
+    return date.today() - timedelta(days=offset)
+
+
+def _runs(user):
+    return list(
+        LearningRun.objects.filter(user=user)
+        .order_by("start")
+        .values_list("start", "end", "length")
+    )
+
+
+def _log(user, offset):
+    return DailyLearning.objects.create(
+        user=user,
+        date=_day(offset),
+        learning_type="Python",
+        description="Daily learning",
+    )
+
+
+#################################################################
+#                   VALIDATE RUN DETECTION
+#################################################################
+def test_runs_from_dates():
+    dates = [date(2023, 1, 1), date(2023, 1, 2), date(2023, 1, 4), date(2023, 1, 5)]
+
+    assert runs_from_dates(dates) == [
+        (date(2023, 1, 1), date(2023, 1, 2)),
+        (date(2023, 1, 4), date(2023, 1, 5)),
+    ]
+    assert runs_from_dates([]) == []
+
+
+#################################################################
+#                   VALIDATE INCREMENTAL MAINTENANCE
+#################################################################
+@pytest.mark.django_db
+def test_streaks_follow_appends_backfills_and_deletes(create_test_user):
+    user = create_test_user
+
+    # Arrange: Two runs separated by a gap on day 3
+    for offset in (6, 5, 4, 2, 1, 0):
+        _log(user, offset)
+    assert _runs(user) == [(_day(6), _day(4), 3), (_day(2), _day(0), 3)]
+
+    # Act: Back-fill the gap, joining both runs
+    gap = _log(user, 3)
+    assert _runs(user) == [(_day(6), _day(0), 7)]
+    streak = LearningStreak.objects.get(user=user)
+    assert streak.current_length() == 7
+    assert streak.longest_length == 7
+
+    # Act: Delete a day in the middle, splitting the run again
+    gap.delete()
+    assert _runs(user) == [(_day(6), _day(4), 3), (_day(2), _day(0), 3)]
+    assert LearningStreak.objects.get(user=user).longest_length == 3
+
+    # Act: Move today's entry back in time
+    today = DailyLearning.objects.get(user=user, date=_day(0))
+    today.date = _day(10)
+    today.save()
+    assert _runs(user) == [
+        (_day(10), _day(10), 1),
+        (_day(6), _day(4), 3),
+        (_day(2), _day(1), 2),
+    ]
+    assert LearningStreak.objects.get(user=user).current_length() == 2
+
+
+@pytest.mark.django_db
+def test_streak_is_broken_after_a_missed_day(create_test_user):
+    user = create_test_user
+    for offset in (4, 3, 2):
+        _log(user, offset)
+
+    streak = LearningStreak.objects.get(user=user)
+    assert streak.current_length() == 0
+    assert streak.current_length(today=_day(1)) == 3
+    assert streak.longest_length == 3
+
+
+#################################################################
+#                   VALIDATE STREAK ENDPOINT
+#################################################################
+@pytest.mark.django_db
+def test_streak_endpoint(create_test_user, django_assert_num_queries):
+    user = create_test_user
+    for offset in (1, 0):
+        _log(user, offset)
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    with django_assert_num_queries(1):
+        response = client.get("/api/streaks/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "current_streak": 2,
+        "current_start": _day(1).isoformat(),
+        "longest_streak": 2,
+        "longest_start": _day(1).isoformat(),
+        "longest_end": _day(0).isoformat(),
+        "last_entry_date": _day(0).isoformat(),
+    }
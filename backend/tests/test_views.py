@@ -1,6 +1,18 @@
+import base64
+from datetime import date, timedelta
+
 import pytest
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from learningtracker import tag_cache
 from learningtracker.models import DailyLearning, Tag
+from learningtracker.response_cache import response_cache_stats
+from learningtracker.utils.error_const import (
+    BULK_ERRORS,
+    DAILY_LEARNING_ERRORS,
+    TAG_ERRORS,
+)
 from rest_framework import status
 from rest_framework.test import APIClient
 
@@ -142,3 +154,905 @@ def test_tag_update(create_test_user):
     assert response.status_code == status.HTTP_200_OK
     tag.refresh_from_db()
     assert tag.name == "Django"
+
+
+@pytest.mark.django_db
+def test_tag_create_rejects_duplicate_name(create_test_user):
+    """Test that a name the user already has is a validation error."""
+    Tag.objects.create(user=create_test_user, name="Python")
+    client = APIClient()
+    client.force_authenticate(user=create_test_user)
+
+    response = client.post("/api/tags/", data={"name": "Python"}, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"name": [TAG_ERRORS["duplicate_name"]]}
+
+
+@pytest.mark.django_db
+def test_tag_changes_in_another_process_reach_the_tag_cache(
+    create_test_user, monkeypatch
+):
+    """Test that tag lookups never trust a map another worker made stale."""
+    user = create_test_user
+    client = APIClient()
+    client.force_authenticate(user=user)
+    docker = Tag.objects.create(user=user, name="docker")
+    python = Tag.objects.create(user=user, name="python")
+
+    def post_entry(day, tag):
+        return client.post(
+            "/api/learned-entries/",
+            data={
+                "date": f"2023-01-0{day}",
+                "learning_type": "Docker",
+                "description": "Cached tags",
+                "tags": [{"name": tag}],
+            },
+            format="json",
+        )
+
+    # Warm this process's cache, then change tags as another worker would:
+    # only the shared tag generation is bumped, the local map is left alone.
+    assert post_entry(1, "docker").status_code == status.HTTP_201_CREATED
+    monkeypatch.setattr(tag_cache.get_tag_cache(), "invalidate", lambda key: None)
+
+    docker.name = "kubernetes"
+    docker.save()
+    response = post_entry(2, "docker")
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["tags"][0]["id"] != docker.pk
+
+    python.delete()
+    assert post_entry(3, "python").status_code == status.HTTP_201_CREATED
+
+    response = client.post("/api/tags/", data={"name": "kubernetes"}, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+#################################################################
+#                   CURSOR PAGINATION TESTS
+#################################################################
+@pytest.mark.django_db
+def test_daily_learning_cursor_pagination(create_test_user):
+    """Test walking the entry list forwards and backwards with cursors."""
+    user = create_test_user
+    for day in range(1, 6):
+        DailyLearning.objects.create(
+            user=user,
+            date=f"2023-01-0{day}",
+            learning_type="Python",
+            description=f"Entry number {day}",
+        )
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    seen = []
+    url = "/api/learned-entries/?page_size=2"
+    while url:
+        response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        seen.extend(entry["date"] for entry in body["results"])
+        last_page = body
+        url = body["next"]
+    assert seen == [f"2023-01-0{day}" for day in range(1, 6)]
+
+    response = client.get(last_page["previous"])
+    assert [entry["date"] for entry in response.json()["results"]] == [
+        "2023-01-03",
+        "2023-01-04",
+    ]
+
+
+@pytest.mark.django_db
+def test_daily_learning_cursor_pagination_keeps_search_rank(create_test_user):
+    """Test that paging through `q=` results keeps the best match first."""
+    user = create_test_user
+    descriptions = [
+        "Docker networking basics",
+        "Docker volumes and Docker compose with docker",
+        "Docker images",
+        "Kubernetes pods without containers",
+        "Docker and Docker swarm",
+        "Docker registries",
+    ]
+    for day, description in enumerate(descriptions, start=1):
+        DailyLearning.objects.create(
+            user=user,
+            date=f"2023-01-0{day}",
+            learning_type="Docker",
+            description=description,
+        )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    ranked = [
+        entry["date"] for entry in client.get("/api/learned-entries/?q=docker").json()
+    ]
+    assert len(ranked) == 5 and ranked != sorted(ranked)
+
+    seen = []
+    url = "/api/learned-entries/?q=docker&page_size=2"
+    while url:
+        body = client.get(url).json()
+        seen.extend(entry["date"] for entry in body["results"])
+        last_page = body
+        url = body["next"]
+    assert seen == ranked
+
+    response = client.get(last_page["previous"])
+    assert [entry["date"] for entry in response.json()["results"]] == ranked[2:4]
+
+
+@pytest.mark.django_db
+def test_daily_learning_cursor_pagination_is_opt_in(create_test_user):
+    """Test that the list stays unpaginated without cursor parameters."""
+    user = create_test_user
+    DailyLearning.objects.create(
+        user=user, date="2023-01-01", learning_type="Python", description="Test entry"
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    response = client.get("/api/learned-entries/")
+    assert isinstance(response.json(), list)
+
+
+@pytest.mark.django_db
+def test_tag_cursor_pagination_invalid_cursor(create_test_user):
+    """Test that a malformed cursor is rejected."""
+    client = APIClient()
+    client.force_authenticate(user=create_test_user)
+
+    response = client.get("/api/tags/?cursor=not-a-cursor")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+#################################################################
+#                   QUERY COUNT TESTS
+#################################################################
+def _create_tagged_entries(user, count, tags_per_entry=3, start=date(2020, 1, 1)):
+    """Create `count` entries for `user`, each carrying a few tags."""
+    tags = [Tag.objects.get_or_create(user=user, name=f"tag-{i}")[0] for i in range(5)]
+    entries = []
+    for offset in range(count):
+        entry = DailyLearning.objects.create(
+            user=user,
+            date=start + timedelta(days=offset),
+            learning_type="Python",
+            description="Tagged test entry",
+        )
+        entry.tags.add(*tags[:tags_per_entry])
+        entries.append(entry)
+    return entries
+
+
+def _count_queries(client, method, url, **kwargs):
+    with CaptureQueriesContext(connection) as context:
+        response = getattr(client, method)(url, **kwargs)
+    assert response.status_code < 400, response.content
+    return len(context.captured_queries)
+
+
+@pytest.mark.django_db
+def test_daily_learning_list_query_count_is_constant(create_test_user, settings):
+    """Test that listing entries does not issue one tags query per entry."""
+    # Count the queries of a real list, not a response cache hit.
+    settings.LEARNINGTRACKER_RESPONSE_CACHE_TIMEOUT = 0
+    user = create_test_user
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    # The first list after a write also computes the conditional-GET
+    # validators, so count the second one.
+    _create_tagged_entries(user, 1)
+    client.get("/api/learned-entries/")
+    single = _count_queries(client, "get", "/api/learned-entries/")
+
+    DailyLearning.objects.all().delete()
+    Tag.objects.all().delete()
+    _create_tagged_entries(user, 25)
+    client.get("/api/learned-entries/")
+    many = _count_queries(client, "get", "/api/learned-entries/")
+
+    assert single == many == 2
+
+
+@pytest.mark.django_db
+def test_daily_learning_retrieve_query_count(create_test_user):
+    """Test that retrieving an entry loads its tags with a single query."""
+    user = create_test_user
+    client = APIClient()
+    client.force_authenticate(user=user)
+    entry = _create_tagged_entries(user, 3, tags_per_entry=5)[0]
+
+    assert _count_queries(client, "get", f"/api/learned-entries/{entry.id}/") == 2
+
+
+@pytest.mark.django_db
+def test_daily_learning_update_query_count_is_constant(create_test_user):
+    """Test that updating an entry does not scale with the user's history."""
+    user = create_test_user
+    client = APIClient()
+    client.force_authenticate(user=user)
+    entries = _create_tagged_entries(user, 2)
+    data = {"learning_type": "Django", "description": "Updated entry"}
+    few = _count_queries(
+        client, "patch", f"/api/learned-entries/{entries[0].id}/", data=data
+    )
+
+    _create_tagged_entries(user, 20, start=date(2021, 1, 1))
+    many = _count_queries(
+        client, "patch", f"/api/learned-entries/{entries[1].id}/", data=data
+    )
+
+    assert few == many
+
+
+#################################################################
+#                   BULK ENDPOINT TESTS
+#################################################################
+@pytest.mark.django_db
+def test_daily_learning_bulk_create_update_delete(create_test_user):
+    """Test applying creates, updates and deletes in one batch."""
+    user = create_test_user
+    to_update = DailyLearning.objects.create(
+        user=user, date="2023-01-01", learning_type="Python", description="Old entry"
+    )
+    to_delete = DailyLearning.objects.create(
+        user=user, date="2023-01-02", learning_type="Python", description="Gone soon"
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    payload = {
+        "create": [
+            {
+                "date": "2023-01-03",
+                "learning_type": "Docker",
+                "description": "Learned about volumes",
+                "tags": [{"name": "docker"}, {"name": "containers"}],
+            },
+            {"date": "2023-01-04", "learning_type": "Python", "description": "ABC"},
+            {
+                "date": "2023-01-01",
+                "learning_type": "Python",
+                "description": "Clashes with an existing entry",
+            },
+        ],
+        "update": [
+            {
+                "id": to_update.id,
+                "description": "New entry",
+                "tags": [{"name": "docker"}],
+            }
+        ],
+        "delete": [to_delete.id, 999999],
+    }
+    response = client.post("/api/learned-entries/bulk/", data=payload, format="json")
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+
+    assert [result["status"] for result in body["create"]] == [
+        "created",
+        "error",
+        "error",
+    ]
+    assert "description" in body["create"][1]["errors"]
+    assert "date" in body["create"][2]["errors"]
+    assert sorted(tag["name"] for tag in body["create"][0]["data"]["tags"]) == [
+        "containers",
+        "docker",
+    ]
+    assert body["update"][0]["status"] == "updated"
+    assert body["update"][0]["data"]["description"] == "New entry"
+    assert [result["status"] for result in body["delete"]] == ["deleted", "error"]
+
+    assert not DailyLearning.objects.filter(id=to_delete.id).exists()
+    assert DailyLearning.objects.filter(user=user).count() == 2
+    assert Tag.objects.filter(user=user, name="docker").count() == 1
+
+
+@pytest.mark.django_db
+def test_daily_learning_bulk_rejected_move_keeps_its_date(create_test_user):
+    """Test that a rejected move does not free its date for a create."""
+    user = create_test_user
+    moving = DailyLearning.objects.create(
+        user=user, date="2023-01-01", learning_type="Python", description="Stays"
+    )
+    DailyLearning.objects.create(
+        user=user, date="2023-01-02", learning_type="Python", description="Taken"
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    payload = {
+        "update": [{"id": moving.id, "date": "2023-01-02"}],
+        "create": [
+            {
+                "date": "2023-01-01",
+                "learning_type": "Python",
+                "description": "Reuses the date",
+            },
+            {
+                "date": "2023-01-03",
+                "learning_type": "Python",
+                "description": "Takes a free date",
+            },
+        ],
+    }
+    response = client.post("/api/learned-entries/bulk/", data=payload, format="json")
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["update"][0]["errors"] == {"date": [BULK_ERRORS["duplicate_date"]]}
+    assert [result["status"] for result in body["create"]] == ["error", "created"]
+    assert DailyLearning.objects.filter(user=user).count() == 3
+
+
+@pytest.mark.django_db
+def test_daily_learning_bulk_moves_within_batch(create_test_user):
+    """Test that a swap is reported per item and a freed date can be reused."""
+    user = create_test_user
+    first = DailyLearning.objects.create(
+        user=user, date="2023-01-01", learning_type="Python", description="First"
+    )
+    second = DailyLearning.objects.create(
+        user=user, date="2023-01-02", learning_type="Python", description="Second"
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    payload = {
+        "update": [
+            {"id": first.id, "date": "2023-01-02"},
+            {"id": second.id, "date": "2023-01-01"},
+        ]
+    }
+    response = client.post("/api/learned-entries/bulk/", data=payload, format="json")
+    assert response.status_code == status.HTTP_200_OK
+    errors = [result["errors"] for result in response.json()["update"]]
+    assert errors == [{"date": [BULK_ERRORS["date_moved_in_batch"]]}] * 2
+
+    payload = {
+        "update": [{"id": first.id, "date": "2023-01-05"}],
+        "create": [
+            {
+                "date": "2023-01-01",
+                "learning_type": "Python",
+                "description": "Takes the freed date",
+            }
+        ],
+    }
+    response = client.post("/api/learned-entries/bulk/", data=payload, format="json")
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["update"][0]["status"] == "updated"
+    assert body["create"][0]["status"] == "created"
+    assert sorted(
+        DailyLearning.objects.filter(user=user).values_list("date", flat=True)
+    ) == [date(2023, 1, 1), date(2023, 1, 2), date(2023, 1, 5)]
+
+
+@pytest.mark.django_db
+def test_daily_learning_bulk_query_count_is_constant(create_test_user):
+    """Test that a batch costs the same number of queries at any size."""
+    user = create_test_user
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    def _payload(start, count):
+        return {
+            "create": [
+                {
+                    "date": (start + timedelta(days=offset)).isoformat(),
+                    "learning_type": "Python",
+                    "description": "Bulk created entry",
+                    "tags": [{"name": "bulk"}, {"name": f"tag-{offset}"}],
+                }
+                for offset in range(count)
+            ]
+        }
+
+    small = _count_queries(
+        client,
+        "post",
+        "/api/learned-entries/bulk/",
+        data=_payload(date(2020, 1, 1), 2),
+        format="json",
+    )
+    large = _count_queries(
+        client,
+        "post",
+        "/api/learned-entries/bulk/",
+        data=_payload(date(2021, 1, 1), 50),
+        format="json",
+    )
+    assert small == large
+    assert DailyLearning.objects.filter(user=user).count() == 52
+
+
+@pytest.mark.django_db
+def test_daily_learning_bulk_rejects_update_without_id(create_test_user):
+    """Test that a malformed batch is rejected as a whole."""
+    client = APIClient()
+    client.force_authenticate(user=create_test_user)
+
+    response = client.post(
+        "/api/learned-entries/bulk/",
+        data={"update": [{"description": "No id here"}]},
+        format="json",
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+#################################################################
+#                   UPSERT BY DATE TESTS
+#################################################################
+@pytest.mark.django_db
+def test_daily_learning_upsert_by_date(create_test_user):
+    """Test that PUT by date creates the entry once and then updates it."""
+    user = create_test_user
+    client = APIClient()
+    client.force_authenticate(user=user)
+    url = "/api/learned-entries/by-date/2023-03-01/"
+
+    response = client.put(
+        url,
+        data={
+            "learning_type": "Python",
+            "description": "First version",
+            "tags": [{"name": "python"}],
+        },
+        format="json",
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    entry_id = response.json()["id"]
+    assert response.json()["tags"][0]["name"] == "python"
+
+    response = client.put(
+        url,
+        data={"learning_type": "Django", "description": "Second version"},
+        format="json",
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["id"] == entry_id
+
+    entry = DailyLearning.objects.get(user=user, date="2023-03-01")
+    assert entry.id == entry_id
+    assert entry.description == "Second version"
+    assert entry.learning_type == "Django"
+    assert list(entry.tags.values_list("name", flat=True)) == ["python"]
+
+
+@pytest.mark.django_db
+def test_daily_learning_upsert_by_date_defaults_learning_type(create_test_user):
+    """Test that an omitted learning_type is defaulted on insert and on update."""
+    client = APIClient()
+    client.force_authenticate(user=create_test_user)
+    url = "/api/learned-entries/by-date/2023-03-01/"
+
+    response = client.put(url, data={"description": "No topic given"}, format="json")
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["learning_type"] == DailyLearning.Topics.OTHER
+
+    client.put(
+        url,
+        data={"learning_type": "Python", "description": "Now about Python"},
+        format="json",
+    )
+    response = client.put(url, data={"description": "Topic left out"}, format="json")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["learning_type"] == DailyLearning.Topics.OTHER
+
+
+@pytest.mark.django_db
+def test_daily_learning_upsert_by_date_rejects_non_object_body(create_test_user):
+    """Test that a body that is not a JSON object is a 400, not a 500."""
+    client = APIClient()
+    client.force_authenticate(user=create_test_user)
+
+    response = client.put(
+        "/api/learned-entries/by-date/2023-03-01/",
+        data=[{"description": "Wrapped in a list"}],
+        format="json",
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {
+        "non_field_errors": [DAILY_LEARNING_ERRORS["invalid_body"]]
+    }
+    assert not DailyLearning.objects.exists()
+
+
+@pytest.mark.django_db
+def test_daily_learning_upsert_by_date_rejects_future_date(create_test_user):
+    """Test that the upsert path still validates the date."""
+    client = APIClient()
+    client.force_authenticate(user=create_test_user)
+    future = (date.today() + timedelta(days=2)).isoformat()
+
+    response = client.put(
+        f"/api/learned-entries/by-date/{future}/",
+        data={"learning_type": "Python", "description": "From the future"},
+        format="json",
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "date" in response.json()
+
+
+#################################################################
+#                   TAG AUTOCOMPLETE TESTS
+#################################################################
+@pytest.mark.django_db
+def test_tag_autocomplete(create_test_user):
+    """Test prefix suggestions are case-insensitive and ordered by usage."""
+    user = create_test_user
+    other_user = User.objects.create_user(username="other", password="password")
+    docs = Tag.objects.create(user=user, name="Docs")
+    docker = Tag.objects.create(user=user, name="docker")
+    Tag.objects.create(user=user, name="Django")
+    Tag.objects.create(user=other_user, name="Dockerfile")
+    for day in range(1, 4):
+        entry = DailyLearning.objects.create(
+            user=user,
+            date=f"2023-01-0{day}",
+            learning_type="Docker",
+            description="Container work",
+        )
+        entry.tags.add(docker)
+    entry.tags.add(docs)
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    response = client.get("/api/tags/autocomplete/?prefix=DO")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {"id": docker.id, "name": "docker", "usage_count": 3},
+        {"id": docs.id, "name": "Docs", "usage_count": 1},
+    ]
+    assert "max-age=60" in response["Cache-Control"]
+
+    response = client.get("/api/tags/autocomplete/?prefix=d&limit=1")
+    assert [tag["name"] for tag in response.json()] == ["docker"]
+
+
+@pytest.mark.django_db
+def test_tag_autocomplete_prefix_at_highest_code_point(create_test_user):
+    """Test prefixes whose last character cannot be incremented."""
+    user = create_test_user
+    Tag.objects.create(user=user, name="x\U0010ffffy")
+    Tag.objects.create(user=user, name="k\ud7ffz")
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    response = client.get("/api/tags/autocomplete/?prefix=%F4%8F%BF%BF")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+
+    response = client.get("/api/tags/autocomplete/?prefix=x%F4%8F%BF%BF")
+    assert [tag["name"] for tag in response.json()] == ["x\U0010ffffy"]
+
+    response = client.get("/api/tags/autocomplete/?prefix=k%ED%9F%BF")
+    assert [tag["name"] for tag in response.json()] == ["k\ud7ffz"]
+
+
+#################################################################
+#                   HEATMAP TESTS
+#################################################################
+@pytest.mark.django_db
+def test_daily_learning_heatmap(create_test_user):
+    """Test the compact year heatmap encoding and its invalidation."""
+    user = create_test_user
+    for day, topic in (("2023-01-01", "Python"), ("2023-01-10", "Docker")):
+        DailyLearning.objects.create(
+            user=user, date=day, learning_type=topic, description="Heatmap entry"
+        )
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    response = client.get("/api/learned-entries/heatmap/?year=2023")
+    assert len(response.content) < 1024
+    body = response.json()
+    bitmap = base64.b64decode(body["bitmap"])
+    topics = base64.b64decode(body["topics"])
+    assert body["days"] == 365
+    assert body["total"] == 2
+    assert len(bitmap) == 46
+    assert bitmap[0] == 0b10000000  # January 1st
+    assert bitmap[1] == 0b01000000  # January 10th
+    assert body["topic_names"][topics[9] - 1] == "Docker"
+
+    DailyLearning.objects.create(
+        user=user, date="2023-01-02", learning_type="SQL", description="Heatmap entry"
+    )
+    body = client.get("/api/learned-entries/heatmap/?year=2023").json()
+    assert body["total"] == 3
+    assert base64.b64decode(body["bitmap"])[0] == 0b11000000
+
+    response = client.get("/api/learned-entries/heatmap/?year=abc")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+#################################################################
+#                   CALENDAR TESTS
+#################################################################
+@pytest.mark.django_db
+def test_daily_learning_calendar_month(create_test_user):
+    """Test fetching a whole month grouped by day in constant queries."""
+    user = create_test_user
+    _create_tagged_entries(user, 40, start=date(2023, 1, 20))
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.get("/api/learned-entries/calendar/?month=2023-02")
+    assert response.status_code == status.HTTP_200_OK
+    assert len(context.captured_queries) == 2
+
+    body = response.json()
+    assert body["from_date"] == "2023-02-01"
+    assert body["to_date"] == "2023-02-28"
+    assert len(body["days"]) == 28
+    first_day = body["days"]["2023-02-01"][0]
+    assert first_day["description"] == "Tagged test entry"
+    assert len(first_day["tags"]) == 3
+
+
+@pytest.mark.django_db
+def test_daily_learning_calendar_summary_range(create_test_user):
+    """Test the summary variant over an arbitrary range."""
+    user = create_test_user
+    _create_tagged_entries(user, 5, start=date(2023, 1, 1))
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    response = client.get(
+        "/api/learned-entries/calendar/"
+        "?from_date=2023-01-02&to_date=2023-01-03&summary=true"
+    )
+    body = response.json()
+    assert sorted(body["days"]) == ["2023-01-02", "2023-01-03"]
+    assert "description" not in body["days"]["2023-01-02"][0]
+
+    response = client.get("/api/learned-entries/calendar/?from_date=2023-01-02")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    response = client.get("/api/learned-entries/calendar/?month=2023-13")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    response = client.get("/api/learned-entries/calendar/?month=9999-12")
+    assert response.json()["to_date"] == "9999-12-31"
+
+
+#################################################################
+#                   PROGRESS TESTS
+#################################################################
+@pytest.mark.django_db
+def test_progress_is_cached_until_entries_change(create_test_user):
+    """Test that progress is served from cache until the user's data changes."""
+    user = create_test_user
+    year = date.today().year
+    DailyLearning.objects.create(
+        user=user, date=date.today(), learning_type="Python", description="Today"
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    url = f"/api/progress/?years={year - 1},{year}"
+    body = client.get(url).json()
+    assert [item["period"] for item in body["years"]] == [str(year - 1), str(year)]
+    assert body["years"][1]["entries"] == 1
+    assert [item["period"] for item in body["rolling"]] == ["30d", "90d", "365d"]
+
+    with CaptureQueriesContext(connection) as context:
+        client.get(url)
+    assert not any("learningtracker_dailylearning" in q["sql"] for q in context)
+
+    DailyLearning.objects.create(
+        user=user,
+        date=date.today() - timedelta(days=1),
+        learning_type="SQL",
+        description="Yesterday",
+    )
+    body = client.get(url).json()
+    assert body["rolling"][0]["entries"] == 2
+
+
+@pytest.mark.django_db
+def test_progress_for_many_users_is_staff_only(create_test_user):
+    """Test that only staff members can request the progress of other users."""
+    user = create_test_user
+    other = User.objects.create_user(username="other", password="password")
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    response = client.get(f"/api/progress/?users={user.pk},{other.pk}")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    response = client.get(f"/api/progress/?years={date.today().year + 1}")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    response = client.get("/api/progress/?years=abc")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    user.is_staff = True
+    user.save()
+    response = client.get(f"/api/progress/?users={user.pk},{other.pk}")
+    assert response.status_code == status.HTTP_200_OK
+    assert sorted(response.json()["users"]) == sorted([str(user.pk), str(other.pk)])
+
+
+#################################################################
+#                   CONDITIONAL GET TESTS
+#################################################################
+def _learningtracker_queries(context):
+    return [q for q in context if "learningtracker_" in q["sql"]]
+
+
+@pytest.mark.django_db
+def test_entries_conditional_get(create_test_user):
+    """Test that unchanged entry lists are answered with a bare 304."""
+    user = create_test_user
+    entry = DailyLearning.objects.create(
+        user=user, date="2023-01-01", learning_type="Python", description="Cached"
+    )
+    client = APIClient()
+    client.login(username="testuser", password="password")
+
+    response = client.get("/api/learned-entries/")
+    etag, last_modified = response["ETag"], response["Last-Modified"]
+    assert "sessionid" in response.cookies
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.get("/api/learned-entries/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response["ETag"] == etag
+    assert not _learningtracker_queries(context)
+    assert "sessionid" not in response.cookies
+    response = client.get("/api/learned-entries/", HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    client.delete(f"/api/learned-entries/{entry.pk}/")
+    response = client.get("/api/learned-entries/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_tags_conditional_get(create_test_user):
+    """Test that tag changes alone invalidate the tag list validators."""
+    client = APIClient()
+    client.force_authenticate(user=create_test_user)
+
+    response = client.get("/api/tags/")
+    etag = response["ETag"]
+    assert "Last-Modified" not in response
+    response = client.get("/api/tags/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    tag = Tag.objects.create(user=create_test_user, name="python")
+    response = client.get("/api/tags/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response["ETag"]
+
+    tag.name = "Python"
+    tag.save()
+    response = client.get("/api/tags/", HTTP_IF_NONE_MATCH=etag)
+    assert response.json() == [{"id": tag.pk, "name": "Python"}]
+
+
+#################################################################
+#                   RESPONSE CACHE TESTS
+#################################################################
+@pytest.mark.django_db
+def test_entries_response_cache(create_test_user, settings):
+    """Test that repeated reads are served from the cache until a write."""
+    settings.LEARNINGTRACKER_RESPONSE_CACHE_TIMEOUT = 60
+    user = create_test_user
+    entry = DailyLearning.objects.create(
+        user=user, date="2023-01-01", learning_type="Python", description="Cached"
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    for url in (
+        "/api/learned-entries/",
+        "/api/learned-entries/?learning_type=Python",
+        f"/api/learned-entries/{entry.pk}/",
+    ):
+        assert client.get(url)["X-Cache"] == "MISS"
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url)
+        assert response["X-Cache"] == "HIT"
+        assert not _learningtracker_queries(context)
+    # Filters are part of the key.
+    response = client.get("/api/learned-entries/?learning_type=Django")
+    assert response["X-Cache"] == "MISS"
+    assert response.json() == []
+
+    tag = Tag.objects.create(user=user, name="python")
+    tag.daily_learnings.add(entry)
+    response = client.get(f"/api/learned-entries/{entry.pk}/")
+    assert response["X-Cache"] == "MISS"
+    assert response.json()["tags"] == [{"id": tag.pk, "name": "python"}]
+
+    tag.name = "Python"
+    tag.save()
+    response = client.get("/api/learned-entries/")
+    assert response.json()[0]["tags"] == [{"id": tag.pk, "name": "Python"}]
+
+
+@pytest.mark.django_db
+def test_response_cache_is_per_user(create_test_user, settings):
+    """Test that cached responses never leak between users."""
+    settings.LEARNINGTRACKER_RESPONSE_CACHE_TIMEOUT = 60
+    other = User.objects.create_user(username="other", password="password")
+    Tag.objects.create(user=create_test_user, name="python")
+    client = APIClient()
+
+    client.force_authenticate(user=create_test_user)
+    assert len(client.get("/api/tags/").json()) == 1
+    client.force_authenticate(user=other)
+    response = client.get("/api/tags/")
+    assert response["X-Cache"] == "MISS"
+    assert response.json() == []
+
+
+@pytest.mark.django_db
+def test_response_cache_can_be_disabled(create_test_user, settings):
+    """Test that a timeout of 0, the default without CACHE_URL, skips the cache."""
+    settings.LEARNINGTRACKER_RESPONSE_CACHE_TIMEOUT = 0
+    client = APIClient()
+    client.force_authenticate(user=create_test_user)
+
+    for _ in range(2):
+        response = client.get("/api/tags/")
+        assert response.status_code == status.HTTP_200_OK
+        assert "X-Cache" not in response
+    assert response_cache_stats() == {"hits": 0, "misses": 0, "hit_ratio": None}
+
+
+#################################################################
+#                   AUTHENTICATED USER CACHE TESTS
+#################################################################
+def _user_queries(context):
+    return [q for q in context if 'FROM "auth_user"' in q["sql"]]
+
+
+@pytest.mark.django_db
+def test_session_user_is_cached(create_test_user):
+    """Test that the session user is loaded from the cache once warm."""
+    client = APIClient()
+    client.login(username="testuser", password="password")
+    client.get("/api/tags/")
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.get("/api/tags/")
+    assert response.status_code == status.HTTP_200_OK
+    assert not _user_queries(context)
+
+
+@pytest.mark.django_db
+def test_session_user_cache_is_invalidated(create_test_user):
+    """Test that password changes, deactivation and logout drop cached users."""
+    user = create_test_user
+    client = APIClient()
+    client.login(username="testuser", password="password")
+    assert client.get("/api/tags/").status_code == status.HTTP_200_OK
+
+    user.set_password("changed")
+    user.save()
+    assert client.get("/api/tags/").status_code == status.HTTP_403_FORBIDDEN
+
+    client.login(username="testuser", password="changed")
+    assert client.get("/api/tags/").status_code == status.HTTP_200_OK
+    user.is_active = False
+    user.save()
+    assert client.get("/api/tags/").status_code == status.HTTP_403_FORBIDDEN
+
+    user.is_active = True
+    user.save()
+    client.login(username="testuser", password="changed")
+    client.get("/api/tags/")
+    session = client.cookies["sessionid"].value
+    client.post("/api/logout/")
+    # Replaying the old session cookie must load the user again.
+    client.cookies["sessionid"] = session
+    with CaptureQueriesContext(connection) as context:
+        client.get("/api/tags/")
+    assert _user_queries(context)
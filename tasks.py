@@ -57,6 +57,24 @@ def start_backend_debug(ctx):
         ctx.run("python manage.py runserver 0.0.0.0:8000", pty=True)
 
 
+@task
+def start_backend_asgi(ctx, workers=1):
+    """
+    Start Django under uvicorn (without Docker), serving the async endpoints
+    such as /api/async/learned-entries/ and /api/events/ natively.
+
+    More than one worker requires CACHE_URL; the worker count is passed as
+    WEB_CONCURRENCY so the settings can check it.
+    """
+    with ctx.cd(BACKEND_DIR):
+        print("Starting Django backend under ASGI...")
+        ctx.run(
+            "uvicorn admin.asgi:application --host 0.0.0.0 --port 8000",
+            env={"WEB_CONCURRENCY": str(workers)},
+            pty=True,
+        )
+
+
 @task
 def createsuperuser(ctx):
     """Create a Django superuser inside the Docker container."""